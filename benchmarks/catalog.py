@@ -0,0 +1,694 @@
+"""
+Seeded generator for synthetic LINAS catalogs of any size, written out as
+data files or loaded straight into a data manager
+
+Run from the repository root with:
+
+    python -m benchmarks.catalog [--scale N] [--seed N] [--out DIR]
+                                 [--pdf PATH] [--wkhtmltopdf PATH]
+"""
+from __future__ import print_function, division
+from obj_classes.data_loader import loadEntry, TEMPLATES, JSONL
+from obj_classes.data_manager import DataManager
+from obj_classes.linas_entity import LinasEntity
+from obj_classes.pdf_generator import PDFGenerator, WKHTMLTOPDF
+from systems.fantasy import Fantasy
+from typing import Any, Dict, List, Set, Tuple
+import argparse
+import json
+import os
+import random
+import time
+
+# Name of the file holding the generated entities, one entry per line
+BESTIARY = 'bestiary'
+
+# Objects per key at scale 1, roughly the size of the fantasy system. Stats
+# aren't scaled, entities only understand the eight stats listed here.
+COUNTS = {
+    'skills': 36,
+    'effects': 20,
+    'languages': 5,
+    'abilities': 26,
+    'items': 58,
+    'techniques': 61,
+    'races': 7,
+    'classes': 9,
+    BESTIARY: 40,
+}
+
+# Share of the abilities, items and techniques which come from templated
+# entries (each expanding to one object per template element)
+TEMPLATED = 0.3
+
+_STATS = [
+    ('Dexterity', 'DEX'),
+    ('Endurance', 'END'),
+    ('Health Points', 'HP'),
+    ('Intelligence', 'INT'),
+    ('Speed', 'SPD'),
+    ('Spirit', 'SPR'),
+    ('Strength', 'STR'),
+    ('Technical Points', 'TP'),
+]
+
+_TEMPLATES = {
+    'elements': [
+        { 'name': 'Fire', 'weak': 'ice' },
+        { 'name': 'Ice', 'weak': 'fire' },
+        { 'name': 'Lightning', 'weak': 'earth' },
+        { 'name': 'Earth', 'weak': 'wind' },
+        { 'name': 'Wind', 'weak': 'lightning' },
+        { 'name': 'Water', 'weak': 'fire' },
+    ],
+    'environments': [
+        { 'name': 'Forest', 'adv': 'forest', 'dis': 'prairie' },
+        { 'name': 'Mountain', 'adv': 'mountain', 'dis': 'swamp' },
+        { 'name': 'Swamp', 'adv': 'swamp', 'dis': 'snow' },
+        { 'name': 'Field', 'adv': 'prairie', 'dis': 'mountain' },
+        { 'name': 'Snow', 'adv': 'snowy', 'dis': 'desert' },
+        { 'name': 'Sand', 'adv': 'desert', 'dis': 'forest' },
+    ],
+}
+
+_PREFIXES = [
+    'Ash', 'Storm', 'Iron', 'Shadow', 'Ember', 'Frost', 'Silver', 'Thorn',
+    'Raven', 'Sun', 'Moon', 'Stone', 'Wild', 'Grim', 'Bright', 'Hollow',
+    'Ever', 'Red', 'Deep', 'Star', 'Gale', 'Bone', 'Gold', 'Mist',
+]
+
+_SYLLABLES = [
+    'el', 'dra', 'kor', 'va', 'thi', 'un', 'ri', 'os', 'mar', 'ish', 'zan',
+    'bel', 'gor', 'lu', 'nae', 'tor', 'quin', 'sa', 'ven', 'yth',
+]
+
+_SENTENCES = [
+    'Favored by {who} across the northern reaches.',
+    'Commonly seen among {who}, though rarely mastered.',
+    'Originally developed by {who} during the long war.',
+    'Requires steady hands and a great deal of patience to use well.',
+    'The DM may choose to restrict access to this during character creation.',
+    'Its effects end at the end of the combat unless stated otherwise.',
+    'Cannot be combined with other effects of the same type.',
+    'Counts as a full action when used during combat.',
+    'Can be used outside of combat at the discretion of the DM.',
+    'Sought after by {who} for generations.',
+]
+
+_WHO = [
+    'mercenaries', 'scholars', 'mountain clans', 'river folk', 'knights',
+    'wandering bards', 'temple guards', 'desert nomads', 'court mages',
+]
+
+# Collections each key's objects are spread across, with the root words
+# their names are built from
+_SKILLS = {
+    'Combat Skills': [ 'Blades', 'Archery', 'Bashing', 'Fencing', 'Marksmanship', 'Martial Arts' ],
+    'General Skills': [ 'Perception', 'Stealth', 'Athletics', 'Persuasion', 'Survival' ],
+    'Specialized Skills': [ 'Magic', 'Music', 'Alchemy', 'Ninjitsu', 'Bushido' ],
+    'Crafting Skills': [ 'Smithing', 'Tailoring', 'Carpentry', 'Cooking' ],
+    'Lore and Knowledge': [ 'History', 'Arcana', 'Religion', 'Nature' ],
+}
+_EFFECTS = {
+    'Effects': [ 'Haste', 'Guard', 'Regen', 'Focus', 'Barrier' ],
+    'Status Conditions': [ 'Burn', 'Chill', 'Daze', 'Blight', 'Curse', 'Bleed', 'Root', 'Fear' ],
+}
+_ABILITIES = {
+    'Active': [ 'Roar', 'Dash', 'Rally', 'Feint', 'Howl', 'Surge' ],
+    'Passive': [ 'Sight', 'Stride', 'Blood', 'Skin', 'Resolve', 'Instinct', 'Heart', 'Grip' ],
+}
+_ITEMS = {
+    'Weapons': [ 'Sword', 'Axe', 'Spear', 'Bow', 'Crossbow', 'Dagger', 'Mace', 'Rapier', 'Staff', 'Pistol' ],
+    'Armor & Clothing': [ 'Mail', 'Plate', 'Robe', 'Cloak', 'Helm', 'Gauntlets', 'Vest', 'Shield' ],
+    'General Use': [ 'Potion', 'Tonic', 'Rope', 'Torch', 'Ration', 'Lantern', 'Bandage', 'Elixir' ],
+    'Accessories': [ 'Ring', 'Amulet', 'Charm', 'Bracelet', 'Circlet', 'Talisman' ],
+    'Specialized': [ 'Lute', 'Flute', 'Tome', 'Orb', 'Lens', 'Toolkit' ],
+}
+_TECHNIQUES = {
+    'Light Magic Techniques': [ 'Ray', 'Halo', 'Blessing', 'Ward' ],
+    'Dark Magic Techniques': [ 'Hex', 'Drain', 'Veil', 'Shade' ],
+    'Arcane Magic Techniques': [ 'Bolt', 'Nova', 'Lance', 'Pulse' ],
+    'Status Techniques': [ 'Seal', 'Snare', 'Lull', 'Taunt' ],
+    'Combat Techniques': [ 'Strike', 'Slash', 'Cleave', 'Barrage' ],
+    'Music Techniques': [ 'Song', 'Hymn', 'Ballad', 'Dirge' ],
+}
+_CLASSES = [ 'Warden', 'Blade', 'Seer', 'Ranger', 'Monk', 'Sage', 'Knight', 'Hunter', 'Mystic', 'Reaver' ]
+_CREATURES = [ 'Wolf', 'Ooze', 'Wraith', 'Golem', 'Drake', 'Bandit', 'Spider', 'Troll', 'Cultist', 'Serpent' ]
+
+# Skills used by weapons and techniques, and the stat each one rolls with
+_WEAPON_SKILLS = {
+    'Sword': ('Blades', 'str'), 'Axe': ('Bashing', 'str'), 'Spear': ('Fencing', 'str'),
+    'Bow': ('Archery', 'dex'), 'Crossbow': ('Archery', 'dex'), 'Dagger': ('Blades', 'dex'),
+    'Mace': ('Bashing', 'str'), 'Rapier': ('Fencing', 'dex'), 'Staff': ('Magic', 'int'),
+    'Pistol': ('Marksmanship', 'int'),
+}
+_TECHNIQUE_SKILLS = {
+    'Light Magic Techniques': ('Magic', 'int'),
+    'Dark Magic Techniques': ('Magic', 'int'),
+    'Arcane Magic Techniques': ('Magic', 'int'),
+    'Status Techniques': ('Magic', 'spr'),
+    'Combat Techniques': ('Martial Arts', 'str'),
+    'Music Techniques': ('Music', 'int'),
+}
+
+class _Names:
+    """
+    Hands out names which haven't been used yet under a key
+    """
+    def __init__(self, rng : random.Random) -> None:
+        self.__rng = rng
+        self.__used : Set[str] = set()
+
+    def take(self, name : str) -> str:
+        """
+        Returns the name, numbered if it was already taken
+        """
+        unique, i = name, 1
+        while unique.lower() in self.__used:
+            i += 1
+            unique = f'{name} {i}'
+        self.__used.add(unique.lower())
+        return unique
+
+    def pick(self, roots : List[str]) -> str:
+        """
+        Returns a new name made of a prefix and one of the roots
+        """
+        return self.take(f'{self.__rng.choice(_PREFIXES)} {self.__rng.choice(roots)}')
+
+    def word(self) -> str:
+        """
+        Returns a new made up word, i.e. a language or race name
+        """
+        count = self.__rng.randrange(2, 4)
+        return self.take(''.join(self.__rng.choice(_SYLLABLES) for _ in range(count)).title())
+
+def _count(key : str, scale : float) -> int:
+    return max(1, round(COUNTS[key] * scale))
+
+def _describe(rng : random.Random, first : str) -> str:
+    sentences = [ first ] + [
+        x.format(who=rng.choice(_WHO))
+        for x in rng.sample(_SENTENCES, rng.randrange(1, 4))
+    ]
+    return ' '.join(sentences)
+
+def _spread(
+    rng    : random.Random,
+    groups : Dict[str, List[str]],
+    count  : int
+) -> List[Tuple[str, int]]:
+    """
+    Splits a number of objects across collections, every collection gets at
+    least one
+    """
+    names = list(groups)
+    sizes = { x: 1 for x in names }
+    for _ in range(max(0, count - len(names))):
+        sizes[rng.choice(names)] += 1
+    return list(sizes.items())
+
+def _split(
+    rng      : random.Random,
+    count    : int,
+    template : int
+) -> List[bool]:
+    """
+    Returns whether each entry of a collection is templated, so roughly
+    TEMPLATED of the `count` objects come from templates of `template`
+    elements
+    """
+    templated = int(count * TEMPLATED / template + rng.random())
+    templated = min(templated, count // template)
+    flags = [ True ] * templated + [ False ] * (count - templated * template)
+    rng.shuffle(flags)
+    return flags
+
+def _collection(
+    name     : str,
+    kind     : str,
+    children : List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    return {
+        'kind': 'collection',
+        'name': name,
+        'description': f'Synthetic {name.lower()}',
+        'children_kind': kind,
+        'children': children,
+    }
+
+def _children(entry : Dict[str, Any]) -> List[Dict[str, Any]]:
+    return entry['children'] if entry.get('kind') == 'collection' else [ entry ]
+
+def _expanded(entry : Dict[str, Any]) -> List[str]:
+    """
+    Returns the names an entry expands to
+    """
+    if not isinstance(entry.get('template'), str):
+        return [ entry['name'] ]
+    return [ entry['name'].format(**x) for x in _TEMPLATES[entry['template']] ]
+
+def generateCatalog(
+    scale : float = 1,
+    seed  : int = 0
+) -> Dict[str, Any]:
+    """
+    Generates a catalog of skills, effects, languages, abilities, items,
+    techniques, races, classes and entities. Objects are grouped into
+    collections like the fantasy system's, part of the abilities, items and
+    techniques are templated (see TEMPLATED) and the objects refer to each
+    other the same way hand written data does: weapons and techniques name
+    the catalog's skills, races the catalog's abilities and languages,
+    classes the catalog's skills and items, and entities carry copies of
+    the catalog's weapons, armor, abilities and techniques.
+
+    Parameters
+    ----------
+    scale : `float`
+        Size of the catalog, 1 is about as large as the fantasy system (see
+        COUNTS)
+    seed : `int`
+        Seed for the random names and values, the same seed and scale always
+        generate the same catalog
+
+    Returns
+    -------
+    catalog : `Dict[str, Any]`
+        The contents of each data file by name (see writeCatalog): the
+        shared templates, one {"kind", "entries"} object per key in the
+        order keys have to be loaded in, and the list of entities
+    """
+    rng = random.Random(seed)
+    catalog : Dict[str, Any] = { TEMPLATES: _TEMPLATES }
+
+    # Stats
+    catalog['stats'] = {
+        'kind': 'stat',
+        'entries': [
+            {
+                'name': name,
+                'abbr': abbr,
+                'description': _describe(rng, f'{name} measures a character\'s {name.lower()}.'),
+            }
+            for name, abbr in _STATS
+        ],
+    }
+
+    # Skills
+    names = _Names(rng)
+    skills = {}
+    for group, size in _spread(rng, _SKILLS, _count('skills', scale)):
+        roots = _SKILLS[group]
+        entries = [ names.take(x) for x in roots[:size] ]
+        entries += [ names.pick(roots) for _ in range(size - len(entries)) ]
+        skills[group] = [
+            {
+                'name': x,
+                'description': _describe(rng, f'Governs rolls involving {x.lower()}.'),
+            }
+            for x in entries
+        ]
+    catalog['skills'] = {
+        'kind': 'skill',
+        'entries': [ _collection(x, 'skill', y) for x, y in skills.items() ],
+    }
+
+    # Effects
+    names = _Names(rng)
+    catalog['effects'] = {
+        'kind': 'effect',
+        'entries': [
+            _collection(group, 'effect', [
+                {
+                    'name': name,
+                    'description': _describe(
+                        rng,
+                        f'Lasts {rng.randrange(1, 6)} turns or until removed.'
+                    ),
+                }
+                for name in ( names.pick(_EFFECTS[group]) for _ in range(size) )
+            ])
+            for group, size in _spread(rng, _EFFECTS, _count('effects', scale))
+        ],
+    }
+
+    # Languages
+    names = _Names(rng)
+    languages = [ names.word() for _ in range(_count('languages', scale)) ]
+    catalog['languages'] = {
+        'kind': 'language',
+        'entries': [
+            {
+                'name': x,
+                'description': _describe(rng, f'{x} is spoken by {rng.choice(_WHO)}.'),
+            }
+            for x in languages
+        ],
+    }
+
+    # Abilities, templated ones have a variant per environment
+    names = _Names(rng)
+    entries = []
+    for group, size in _spread(rng, _ABILITIES, _count('abilities', scale)):
+        children = []
+        for templated in _split(rng, size, len(_TEMPLATES['environments'])):
+            if templated:
+                root = names.take(f'{rng.choice(_ABILITIES[group])} of the {rng.choice(_PREFIXES)}')
+                children.append({
+                    'name': f'{{name}} {root}',
+                    'type': group[0].lower(),
+                    'description': (
+                        f'+{rng.randrange(1, 4)} to rolls in a {{adv}} region, '
+                        f'-{rng.randrange(1, 3)} in a {{dis}} region.'
+                    ),
+                    'template': 'environments',
+                })
+            else:
+                name = names.pick(_ABILITIES[group])
+                children.append({
+                    'name': name,
+                    'type': group[0].lower(),
+                    'description': _describe(rng, f'Grants the {name.lower()} trait.'),
+                })
+        entries.append(_collection(group, 'ability', children))
+    catalog['abilities'] = { 'kind': 'ability', 'entries': entries }
+
+    # Items, templated ones have a variant per element
+    names = _Names(rng)
+    entries = []
+    for group, size in _spread(rng, _ITEMS, _count('items', scale)):
+        children = []
+        for templated in _split(rng, size, len(_TEMPLATES['elements'])):
+            root = rng.choice(_ITEMS[group])
+            name = names.pick([ root ])
+            item = {
+                'cost': rng.choice([ 0, 5, 10, 25, 50, 100, 250, 500, 1000, 5000 ]),
+                'notes': rng.sample([ x.format(who=rng.choice(_WHO)) for x in _SENTENCES ], rng.randrange(0, 3)),
+            }
+            if group == 'Weapons':
+                skill, stat = _WEAPON_SKILLS[root]
+                damage = 'm_damage' if stat == 'int' else 'p_damage'
+                item.update({
+                    damage: rng.randrange(1, 10),
+                    'linkedSkill': skill,
+                    'stat': stat,
+                    'range': 1 if root not in ( 'Bow', 'Crossbow', 'Pistol', 'Staff' ) else rng.randrange(3, 10),
+                    'speedPenalty': rng.randrange(0, 3),
+                    'points': rng.randrange(1, 6),
+                })
+            elif group == 'Armor & Clothing':
+                item.update({
+                    'p_protection': rng.randrange(0, 6),
+                    'm_protection': rng.randrange(0, 4),
+                    'speedPenalty': rng.randrange(0, 4),
+                    'points': rng.randrange(1, 6),
+                })
+            elif group == 'General Use':
+                item['uses'] = rng.randrange(1, 10)
+            else:
+                item['enchanted'] = rng.random() < 0.3
+                item['artifact'] = rng.random() < 0.05
+            if templated:
+                item.update({
+                    'name': f'{{name}} {name}',
+                    'description': f'Imbued with {{name}}, deals +2 damage to {{weak}} aligned enemies.',
+                    'template': 'elements',
+                })
+            else:
+                item.update({
+                    'name': name,
+                    'description': _describe(rng, f'A {root.lower()} made by {rng.choice(_WHO)}.'),
+                })
+            children.append(item)
+        entries.append(_collection(group, 'item', children))
+    catalog['items'] = { 'kind': 'item', 'entries': entries }
+
+    # Techniques, templated ones have a variant per element
+    names = _Names(rng)
+    entries = []
+    for group, size in _spread(rng, _TECHNIQUES, _count('techniques', scale)):
+        skill, stat = _TECHNIQUE_SKILLS[group]
+        children = []
+        for templated in _split(rng, size, len(_TEMPLATES['elements'])):
+            name = names.pick(_TECHNIQUES[group])
+            technique = {
+                'damage': rng.randrange(0, 12),
+                'range': rng.randrange(1, 10),
+                'numTargets': rng.randrange(1, 4),
+                'skill': skill.lower(),
+                'stat': stat,
+                'status': rng.random() < 0.3,
+                'aoe': rng.random() < 0.1,
+                'fnf': rng.random() < 0.1,
+                'points': rng.randrange(1, 6),
+                'cost': rng.randrange(1, 4),
+            }
+            if templated:
+                technique.update({
+                    'name': f'{{name}} {name}',
+                    'description': f'Deals {{name}} damage, {{weak}} aligned targets take double damage.',
+                    'template': 'elements',
+                })
+            else:
+                technique.update({
+                    'name': name,
+                    'description': _describe(rng, f'A technique passed down by {rng.choice(_WHO)}.'),
+                })
+            children.append(technique)
+        entries.append(_collection(group, 'technique', children))
+    catalog['techniques'] = { 'kind': 'technique', 'entries': entries }
+
+    # Races and classes look up the abilities and items they name
+    abilities = [
+        (name, group['name'])
+        for group in catalog['abilities']['entries']
+        for x in group['children']
+        for name in _expanded(x)
+    ]
+    items = [
+        (name, group['name'])
+        for group in catalog['items']['entries']
+        for x in group['children']
+        for name in _expanded(x)
+    ]
+    skillNames = [ x['name'] for group in skills.values() for x in group ]
+
+    names = _Names(rng)
+    catalog['races'] = {
+        'kind': 'race',
+        'entries': [
+            {
+                'name': name,
+                'description': _describe(rng, f'The {name} are a people known to {rng.choice(_WHO)}.'),
+                'stats': [
+                    [ x[1].title(), rng.choice([ -1, 1, 1, 2 ]) ]
+                    for x in rng.sample(_STATS, 2)
+                ],
+                'abilities': [ list(x) for x in rng.sample(abilities, min(2, len(abilities))) ],
+                'languages': rng.sample(languages, min(rng.randrange(1, 3), len(languages))),
+                'notes': [],
+            }
+            for name in ( names.word() for _ in range(_count('races', scale)) )
+        ],
+    }
+
+    names = _Names(rng)
+    catalog['classes'] = {
+        'kind': 'class',
+        'entries': [
+            {
+                'name': name,
+                'description': _describe(rng, f'{name}s train under {rng.choice(_WHO)}.'),
+                'skills': [
+                    [ x, rng.choice([ 0, 0, -1 ]) ]
+                    for x in rng.sample(skillNames, min(2, len(skillNames)))
+                ],
+                'items': [
+                    { 'item': list(x), 'qty': rng.choice([ 1, 1, 1, 5, 10 ]) }
+                    for x in rng.sample(items, min(rng.randrange(0, 4), len(items)))
+                ],
+                'notes': [],
+            }
+            for name in ( names.pick(_CLASSES) for _ in range(_count('classes', scale)) )
+        ],
+    }
+
+    # Entities carry their own copies of the catalog's objects
+    def plain(key : str, group : str = None) -> List[Dict[str, Any]]:
+        return [
+            x
+            for entry in catalog[key]['entries']
+            if group is None or entry['name'] == group
+            for x in _children(entry)
+            if 'template' not in x
+        ]
+    # Entities only roll damage with strength or dexterity
+    weapons = [ x for x in plain('items', 'Weapons') if x['stat'] in ( 'str', 'dex' ) ]
+    armor = [ x for x in plain('items', 'Armor & Clothing') if x.get('p_protection') is not None ]
+    traits = plain('abilities')
+    techniques = plain('techniques')
+
+    names = _Names(rng)
+    entities = []
+    for _ in range(_count(BESTIARY, scale)):
+        name = names.pick(_CREATURES)
+        isBoss = rng.random() < 0.1
+        entities.append({
+            'name': name,
+            'desc': _describe(rng, f'A {name.lower()} often hired by {rng.choice(_WHO)}.'),
+            'stats': {
+                'hp': rng.randrange(3, 40),
+                'tp': rng.randrange(0, 20),
+                **{ x: rng.randrange(0, 6) for x in [ 'str', 'dex', 'int', 'end', 'spr', 'spd' ] },
+            },
+            'weapon': dict(rng.choice(weapons)) if weapons else {
+                'name': 'Claws', 'description': 'Natural weapons', 'cost': 0,
+                'p_damage': 2, 'linkedSkill': 'Martial Arts', 'stat': 'str',
+            },
+            'armor': dict(rng.choice(armor)) if armor else {
+                'name': 'Hide', 'description': 'Natural armor', 'cost': 0, 'p_protection': 1,
+            },
+            'skills': {
+                x: rng.randrange(1, 5)
+                for x in rng.sample(skillNames, min(rng.randrange(1, 5), len(skillNames)))
+            },
+            'abilities': [ dict(x) for x in rng.sample(traits, min(rng.randrange(0, 3), len(traits))) ],
+            'techniques': [ dict(x) for x in rng.sample(techniques, min(rng.randrange(0, 4), len(techniques))) ],
+            'isBoss': isBoss,
+            'shield': rng.random() < 0.2,
+        })
+    catalog[BESTIARY] = entities
+    return catalog
+
+def writeCatalog(
+    catalog : Dict[str, Any],
+    path    : str
+) -> List[str]:
+    """
+    Writes a catalog out as data files, templates.json and one .json file
+    per key which data_loader.fromDirectory() can load, plus a bestiary.jsonl
+    file of entities (see main.py's bestiary target)
+
+    Parameters
+    ----------
+    catalog : `Dict[str, Any]`
+        The catalog to write, see generateCatalog()
+    path : `str`
+        The directory to write the files to, created if needed
+
+    Returns
+    -------
+    files : `List[str]`
+        The files written
+    """
+    os.makedirs(path, exist_ok=True)
+    files = []
+    for name, contents in catalog.items():
+        if name == BESTIARY:
+            file = os.path.join(path, f'{name}{JSONL}')
+            with open(file, 'w', encoding='utf-8') as fout:
+                fout.writelines(f'{json.dumps(x)}\n' for x in contents)
+        else:
+            file = os.path.join(path, f'{name}.json')
+            with open(file, 'w', encoding='utf-8') as fout:
+                json.dump(contents, fout, indent=1)
+        files.append(file)
+    return files
+
+def catalogData(
+    catalog : Dict[str, Any]
+) -> DataManager:
+    """
+    Loads every key of a catalog into a new data manager, the same way
+    fromDirectory() would load the catalog's files but without reading
+    them from disk
+
+    Parameters
+    ----------
+    catalog : `Dict[str, Any]`
+        The catalog to load, see generateCatalog()
+
+    Returns
+    -------
+    data : `DataManager`
+        The data manager holding the catalog's keys
+    """
+    data = DataManager({})
+    templates = catalog[TEMPLATES]
+    for key, contents in catalog.items():
+        if key in ( TEMPLATES, BESTIARY ):
+            continue
+        data.addKey(key, [
+            loadEntry(x, contents['kind'], templates, data)
+            for x in contents['entries']
+        ])
+    return data
+
+def catalogEntities(
+    catalog : Dict[str, Any]
+) -> List[LinasEntity]:
+    """
+    Returns the entities of a catalog
+    """
+    return [ loadEntry(x, 'entity') for x in catalog[BESTIARY] ]
+
+def catalogObjects(
+    catalog : Dict[str, Any]
+) -> List[Any]:
+    """
+    Returns every data object of a catalog, including the children of its
+    collections and its entities
+    """
+    data = catalogData(catalog)
+    return [
+        x for key in data.getKeys() for x in data.query(key)
+    ] + catalogEntities(catalog)
+
+def catalogSystem(
+    catalog : Dict[str, Any]
+) -> Fantasy:
+    """
+    Returns the fantasy system with its data replaced by a catalog's, its
+    sections render the catalog
+    """
+    system = Fantasy()
+    system.setData(catalogData(catalog))
+    return system
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--scale', type=float, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default=None, help='directory to write the data files to')
+    parser.add_argument('--pdf', default=None, help='render the fantasy handbook with the catalog to this pdf')
+    parser.add_argument('--wkhtmltopdf', default=WKHTMLTOPDF)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    catalog = generateCatalog(args.scale, args.seed)
+    generated = time.perf_counter() - start
+
+    start = time.perf_counter()
+    data = catalogData(catalog)
+    entities = catalogEntities(catalog)
+    loaded = time.perf_counter() - start
+
+    print(f'Catalog at scale {args.scale:g} (seed {args.seed})')
+    print(f'{"key":<14}{"entries":>9}{"objects":>9}')
+    for key in data.getKeys():
+        entries = sum(len(_children(x)) for x in catalog[key]['entries'])
+        print(f'{key:<14}{entries:>9,}{len(data.query(key)):>9,}')
+    print(f'{BESTIARY:<14}{len(catalog[BESTIARY]):>9,}{len(entities):>9,}')
+    print(f'Generated in {generated * 1e3:,.0f}ms, loaded in {loaded * 1e3:,.0f}ms')
+
+    if args.out:
+        files = writeCatalog(catalog, args.out)
+        size = sum(os.path.getsize(x) for x in files)
+        print(f'Wrote {len(files)} files ({size / 1024:,.0f} KiB) to {args.out}')
+    if args.pdf:
+        PDFGenerator(
+            outputPath=os.path.abspath(args.pdf),
+            cm=catalogSystem(catalog),
+            wkhtmltopdf=args.wkhtmltopdf
+        ).writeOutToPDF()
+        print(f'Wrote {args.pdf}')
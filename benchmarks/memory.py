@@ -0,0 +1,144 @@
+"""
+Benchmark comparing the memory footprint of the slotted LINAS data classes
+against the same objects backed by a per-instance __dict__
+
+Run from the repository root with:
+
+    python -m benchmarks.memory [--count N]
+"""
+from __future__ import print_function, division
+from benchmarks.catalog import catalogObjects, generateCatalog, COUNTS
+from obj_classes.data_collection import DataCollection
+from obj_classes.linas_abil import LINASAbility
+from typing import Any, Callable, Dict, List
+from utils.fingerprint import fingerprint, slotNames
+import argparse
+import copy
+import gc
+import sys
+import tracemalloc
+
+# Dict backed stand-ins for each data class, created on demand
+_SHADOWS : Dict[type, type] = {}
+
+def unslotted(
+    obj : Any
+) -> Any:
+    """
+    Returns a copy of a slotted object whose fields live in a per-instance
+    __dict__, i.e. the layout the data classes had before they were slotted.
+    Field values are shared with the original object.
+    """
+    cls = type(obj)
+    shadow = _SHADOWS.get(cls)
+    if shadow is None:
+        shadow = type(f'{cls.__name__}Dict', (), {})
+        _SHADOWS[cls] = shadow
+    copied = shadow()
+    for name in slotNames(cls):
+        if hasattr(obj, name):
+            setattr(copied, name, getattr(obj, name))
+    return copied
+
+def footprint(
+    obj : Any
+) -> int:
+    """
+    Returns the size of an object's own storage in bytes, not counting its
+    field values (which are the same either way)
+    """
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+def traced(
+    build : Callable[[], Any]
+) -> int:
+    """
+    Returns how many bytes are still allocated by a build function once it
+    returns (while the result is alive)
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+def fingerprintGaps(
+    objs : List[Any]
+) -> List[str]:
+    """
+    Returns the slots whose value is left out of their object's fingerprint.
+    Edits to such a field would go unnoticed by BuildGraph and the snapshot
+    cache, so stale sections would be reused.
+
+    Parameters
+    ----------
+    objs : `List[Any]`
+        The objects to check, one of each class is enough
+
+    Returns
+    -------
+    gaps : `List[str]`
+        Each missed slot as Class.slot
+    """
+    gaps = []
+    for obj in objs:
+        for name in slotNames(type(obj)):
+            if not hasattr(obj, name):
+                continue
+            edited = copy.copy(obj)
+            setattr(edited, name, object())
+            if fingerprint(edited) == fingerprint(obj):
+                gaps.append(f'{type(obj).__name__}.{name}')
+    return gaps
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    # Scale 1 holds about sum(COUNTS) objects
+    catalog = catalogObjects(generateCatalog(args.count / sum(COUNTS.values()), args.seed))
+
+    # Slotted fields (private ones included) have to show up in fingerprints,
+    # including edits to a child of a collection
+    child = copy.copy(next(x for x in catalog if isinstance(x, LINASAbility)))
+    collection = DataCollection('Collection', 'A synthetic collection', [ child ])
+    before = fingerprint(collection)
+    child.desc += ' (edited)'
+    gaps = fingerprintGaps(list({ type(x): x for x in catalog + [ collection ] }.values()))
+    if fingerprint(collection) == before:
+        gaps.append('DataCollection children')
+    if gaps:
+        sys.exit(f'fingerprint() misses: {", ".join(gaps)}')
+
+    shadows = [ unslotted(x) for x in catalog ]
+
+    print(f'Per-object footprint ({len(catalog):,} object catalog)')
+    print(f'{"class":<16}{"dict (B)":>10}{"slots (B)":>11}{"saved":>8}')
+    for cls in dict.fromkeys(type(x) for x in catalog):
+        objs = [ (x, y) for x, y in zip(catalog, shadows) if type(x) is cls ]
+        before = sum(footprint(y) for _, y in objs) / len(objs)
+        after = sum(footprint(x) for x, _ in objs) / len(objs)
+        print(
+            f'{cls.__name__:<16}{before:>10.0f}{after:>11.0f}'
+            f'{1 - after / before:>8.0%}'
+        )
+
+    # Measure whole-catalog containers via tracemalloc, field values are
+    # shared with the catalog so only the objects themselves are counted
+    before = traced(lambda: [ unslotted(x) for x in catalog ])
+    after = traced(lambda: [ copy.copy(x) for x in catalog ])
+    print()
+    print('Catalog total (tracemalloc)')
+    print(f'    dict  : {before / 1024:>10,.1f} KiB')
+    print(f'    slots : {after / 1024:>10,.1f} KiB')
+    print(f'    saved : {1 - after / before:>10.0%}')
@@ -0,0 +1,360 @@
+"""
+Benchmark suite timing each stage of a build (and the memory it allocates)
+at several synthetic catalog scales, compared against stored baselines
+
+Run from the repository root with:
+
+    python -m benchmarks.suite [--scales 1 10 100] [--only NAME] [--save]
+                               [--wkhtmltopdf PATH]
+"""
+from __future__ import print_function, division
+from benchmarks.catalog import catalogData, catalogEntities, generateCatalog, writeCatalog
+from campaigns.stirring_echoes import StirringEchoes
+from obj_classes.data_loader import fromDirectory
+from obj_classes.data_manager import DataManager
+from obj_classes.linas_abil import LINASAbility
+from obj_classes.pdf_generator import PDFGenerator, WKHTMLTOPDF
+from systems.fantasy import Fantasy
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List
+import argparse
+import copy
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Where baselines are stored between runs
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+
+# Template used by the template expansion benchmark
+_ENVIRONMENTS = [
+    { 'name': 'Forest', 'adv': 'forest', 'dis': 'prairie' },
+    { 'name': 'Mountain', 'adv': 'mountain', 'dis': 'swamp' },
+    { 'name': 'Swamp', 'adv': 'swamp', 'dis': 'snow' },
+    { 'name': 'Field', 'adv': 'prairie', 'dis': 'mountain' },
+    { 'name': 'Snow', 'adv': 'snowy', 'dis': 'desert' },
+    { 'name': 'Sand', 'adv': 'desert', 'dis': 'forest' },
+]
+
+class Benchmark:
+    """
+    A single benchmark
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the benchmark
+    setup : `Callable[[int, ExitStack], Callable[[], Any]]`
+        Function preparing the benchmark at a catalog scale (untimed) and
+        returning the function to time. Anything it has to clean up (i.e. a
+        temporary directory) is registered on the stack, which is closed
+        once the benchmark has been measured
+    scaled : `bool`
+        If false the benchmark doesn't depend on the catalog and only runs
+        at the first scale
+    """
+    __slots__ = ( 'name', 'setup', 'scaled' )
+
+    def __init__(
+        self,
+        name   : str,
+        setup  : Callable[[int, ExitStack], Callable[[], Any]],
+        scaled : bool = True
+    ) -> None:
+        self.name = name
+        self.setup = setup
+        self.scaled = scaled
+
+def scaledCatalog(
+    data  : DataManager,
+    scale : int
+) -> Dict[str, List[Any]]:
+    """
+    Returns every key of a data manager with each of its objects repeated
+    `scale` times under unique names, so rendering the catalog costs about
+    `scale` times as much as the original. Objects in collections are
+    flattened out and templates are dropped (objects are already expanded).
+    """
+    catalog = {}
+    for key in data.getKeys():
+        items = []
+        for i in range(scale):
+            for obj in data.query(key):
+                obj = copy.copy(obj)
+                if i:
+                    obj.name = f'{obj.name} {i + 1}'
+                if getattr(obj, 'template', None) is not None:
+                    obj.template = None
+                items.append(obj)
+        catalog[key] = items
+    return catalog
+
+def scaledSystem(
+    scale : int
+) -> Fantasy:
+    """
+    Returns the fantasy system with its data replaced by a scaled catalog,
+    its sections render the scaled data
+    """
+    system = Fantasy()
+    data = DataManager(scaledCatalog(system.getData(), scale))
+    system.setData(data)
+    return system
+
+def templatedAbilities(
+    scale : int
+) -> List[LINASAbility]:
+    """
+    Returns 50 templated abilities per scale, each expanding to one ability
+    per environment
+    """
+    return [
+        LINASAbility(
+            name=f'{{name}} Walker {i}',
+            type='p',
+            description=f'+2 speed in a {{adv}} region, -2 in a {{dis}} region ({i})',
+            template=_ENVIRONMENTS
+        )
+        for i in range(50 * scale)
+    ]
+
+def _getItems(scale : int, stack : ExitStack) -> Callable[[], Any]:
+    data = scaledSystem(scale).getData()
+    rng = random.Random(0)
+    keys = data.getKeys()
+    names = [ (key, obj.name) for key in keys for obj in data.query(key) ]
+    lookups = [ rng.choice(names) for _ in range(10000) ]
+    lookups = [ (key, name.upper() if i % 2 else name) for i, (key, name) in enumerate(lookups) ]
+    return lambda: [ data.getItem(key, name) for key, name in lookups ]
+
+def _typeToHTMLList(key : str) -> Callable[[int, ExitStack], Callable[[], Any]]:
+    def setup(scale : int, stack : ExitStack) -> Callable[[], Any]:
+        data = scaledSystem(scale).getData()
+        return lambda: data.typeToHTMLList(key)
+    return setup
+
+def _section(index : int) -> Callable[[int, ExitStack], Callable[[], Any]]:
+    def setup(scale : int, stack : ExitStack) -> Callable[[], Any]:
+        section = scaledSystem(scale).getSections()[index]
+        return lambda: list(section.iterHTML())
+    return setup
+
+def _entities(scale : int, stack : ExitStack) -> Callable[[], Any]:
+    entities = catalogEntities(generateCatalog(scale))
+    return lambda: [ x.toHTMLList() for x in entities ]
+
+def _dataFiles(scale : int, stack : ExitStack) -> Callable[[], Any]:
+    path = stack.enter_context(tempfile.TemporaryDirectory())
+    writeCatalog(generateCatalog(scale), path)
+    def load() -> List[Any]:
+        data = fromDirectory(path)
+        return [ data.query(key) for key in data.getKeys() ]
+    return load
+
+def _queries(scale : int, stack : ExitStack) -> Callable[[], Any]:
+    data = catalogData(generateCatalog(scale))
+    queries = [
+        ('items', { 'linkedSkill': 'Blades' }),
+        ('items', { 'cost__le': 100 }),
+        ('items', { 'stat': 'dex', 'speedPenalty__le': 1 }),
+        ('techniques', { 'skill': 'magic', 'points__ge': 3 }),
+    ]
+    # Indexes are built on first use, only lookups are timed
+    for key, filters in queries:
+        data.query(key, **filters)
+    return lambda: [
+        data.query(key, **filters) for _ in range(100) for key, filters in queries
+    ]
+
+def _pdf(wkhtmltopdf : str) -> Callable[[int, ExitStack], Callable[[], Any]]:
+    def setup(scale : int, stack : ExitStack) -> Callable[[], Any]:
+        system = scaledSystem(scale)
+        outDir = stack.enter_context(tempfile.TemporaryDirectory())
+        generator = PDFGenerator(
+            outputPath=os.path.join(outDir, 'handbook.pdf'),
+            cm=system,
+            wkhtmltopdf=wkhtmltopdf
+        )
+        return generator.writeOutToPDF
+    return setup
+
+def benchmarks(
+    wkhtmltopdf : str = None
+) -> List[Benchmark]:
+    """
+    Returns every benchmark in the suite
+
+    Parameters
+    ----------
+    wkhtmltopdf : `str`
+        Location of wkhtmltopdf, the pdf benchmark is left out if None
+    """
+    sample = Fantasy()
+    keys = sample.getData().getKeys()
+    sections = [ type(x).__name__ for x in sample.getSections() ]
+    suite = [
+        Benchmark('Fantasy()', lambda scale, stack: lambda: Fantasy().getData(), scaled=False),
+        Benchmark('StirringEchoes()', lambda scale, stack: lambda: StirringEchoes().dm, scaled=False),
+        Benchmark(
+            'template expansion',
+            lambda scale, stack: (
+                lambda abilities: lambda: DataManager({ 'abilities': abilities })
+            )(templatedAbilities(scale))
+        ),
+        Benchmark('getItem x10000', _getItems),
+    ]
+    suite += [ Benchmark(f'typeToHTMLList {x}', _typeToHTMLList(x)) for x in keys ]
+    suite += [ Benchmark(f'section {x}', _section(i)) for i, x in enumerate(sections) ]
+    suite.append(Benchmark('LinasEntity.toHTMLList x40', _entities))
+    suite.append(Benchmark('load data files', _dataFiles))
+    suite.append(Benchmark('query x400', _queries))
+    if wkhtmltopdf:
+        suite.append(Benchmark('PDFGenerator handbook', _pdf(wkhtmltopdf)))
+    return suite
+
+def measure(
+    run     : Callable[[], Any],
+    repeat  : int = 5,
+    minTime : float = 0.5,
+    maxTime : float = 5.0
+) -> Dict[str, float]:
+    """
+    Times a function and measures the memory it allocates
+
+    The function is run at least `repeat` times and for at least `minTime`
+    seconds, unless that would take longer than `maxTime` seconds (it
+    always runs once), then once more under tracemalloc for its peak
+    allocation.
+
+    Returns
+    -------
+    result : `Dict[str, float]`
+        The median and fastest time in ms, the number of timed runs and the
+        peak memory allocated during a run in KiB
+    """
+    times = []
+    start = time.perf_counter()
+    while not times or (
+        time.perf_counter() - start < maxTime and
+        (len(times) < repeat or time.perf_counter() - start < minTime)
+    ):
+        gc.collect()
+        began = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - began)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        'ms': statistics.median(times) * 1e3,
+        'minMs': min(times) * 1e3,
+        'runs': len(times),
+        'peakKiB': (peak - base) / 1024,
+    }
+
+def compare(
+    result    : Dict[str, float],
+    baseline  : Dict[str, float],
+    tolerance : float
+) -> List[str]:
+    """
+    Returns what regressed in a result compared to its baseline, changes
+    below 1ms or 64 KiB are treated as noise
+    """
+    regressions = []
+    if result['ms'] > baseline['ms'] * (1 + tolerance) and result['ms'] - baseline['ms'] > 1:
+        regressions.append(f'time {result["ms"] / baseline["ms"] - 1:+.0%}')
+    if (
+        result['peakKiB'] > baseline['peakKiB'] * (1 + tolerance) and
+        result['peakKiB'] - baseline['peakKiB'] > 64
+    ):
+        regressions.append(f'memory {result["peakKiB"] / baseline["peakKiB"] - 1:+.0%}')
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[ 1, 10, 100 ])
+    parser.add_argument('--only', default='', help='only run benchmarks whose name contains this')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--tolerance', type=float, default=0.5)
+    parser.add_argument('--save', action='store_true', help='store the results as the new baselines')
+    parser.add_argument('--baselines', default=BASELINES)
+    parser.add_argument('--wkhtmltopdf', default=None)
+    args = parser.parse_args()
+
+    # The pdf benchmark needs a local wkhtmltopdf
+    wkhtmltopdf = args.wkhtmltopdf or shutil.which('wkhtmltopdf')
+    if not wkhtmltopdf and os.path.exists(WKHTMLTOPDF):
+        wkhtmltopdf = WKHTMLTOPDF
+    if not wkhtmltopdf:
+        print('wkhtmltopdf not found, skipping the pdf benchmark (see --wkhtmltopdf)')
+
+    try:
+        with open(args.baselines, 'r') as fin:
+            stored = json.load(fin)
+    except (OSError, ValueError):
+        stored = {}
+    baselines = stored.get('results', {})
+    machine = f'{platform.python_implementation()} {platform.python_version()} {platform.machine()}'
+    if stored and stored.get('machine') != machine:
+        print(f'Baselines were recorded on {stored.get("machine")}, not {machine}')
+    if not any(x.startswith('PDFGenerator') for x in baselines):
+        print(
+            'No pdf baseline is stored, pdf regressions go unnoticed until one '
+            'is recorded (--wkhtmltopdf PATH --only PDFGenerator --save)'
+        )
+
+    results = {}
+    regressed = []
+    print(f'{"benchmark":<36}{"scale":>6}{"median ms":>12}{"min ms":>10}{"peak KiB":>11}  vs baseline')
+    for benchmark in benchmarks(wkhtmltopdf):
+        if args.only.lower() not in benchmark.name.lower():
+            continue
+        for scale in args.scales if benchmark.scaled else args.scales[:1]:
+            with ExitStack() as stack:
+                result = measure(benchmark.setup(scale, stack), args.repeat)
+            label = f'{benchmark.name} @{scale}x' if benchmark.scaled else benchmark.name
+            results[label] = result
+            note = ''
+            if label in baselines:
+                old = baselines[label]
+                regressions = compare(result, old, args.tolerance)
+                note = f'{result["ms"] / old["ms"] - 1:+.0%}'
+                if regressions:
+                    note += f'  REGRESSED ({", ".join(regressions)})'
+                    regressed.append(label)
+            else:
+                note = 'no baseline'
+            print(
+                f'{benchmark.name:<36}{scale if benchmark.scaled else "-":>6}'
+                f'{result["ms"]:>12.2f}{result["minMs"]:>10.2f}'
+                f'{result["peakKiB"]:>11.0f}  {note}'
+            )
+
+    if args.save:
+        baselines.update(results)
+        with open(args.baselines, 'w') as fout:
+            json.dump(
+                { 'machine': machine, 'results': baselines },
+                fout,
+                indent=2,
+                sort_keys=True
+            )
+        print(f'Saved {len(results)} baselines to {args.baselines}')
+    if regressed:
+        print(f'{len(regressed)} benchmark(s) regressed by more than {args.tolerance:.0%}')
+        sys.exit(1)
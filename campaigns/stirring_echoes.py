@@ -11,6 +11,7 @@ from   obj_classes.linas_technique import LinasTechnique
 from   obj_classes.linas_skill     import LINASSkill
 from   obj_classes.linas_entity    import LinasEntity
 from   sections.data_package       import LINASDataPackage
+from   utils.snapshot_cache        import snapshots
 import os
 class StirringEchoes (ContentManager):
     def __init__(self):
@@ -23,7 +24,21 @@ class StirringEchoes (ContentManager):
             "Items",
             "Entities",
         ]
-        self.dm = DataManager({
+        # Data is only built the first time it is accessed
+        self.__dm = None
+
+    @property
+    def dm(self) -> DataManager:
+        """
+        The data manager holding the campaign's data, built (or loaded from its
+        snapshot) on first access
+        """
+        if self.__dm is None:
+            self.__dm = snapshots.load(self.__buildData)
+        return self.__dm
+
+    def __buildData(self) -> DataManager:
+        dm = DataManager({
             "abilities":[
                 DataCollection(
                     name="Active",
@@ -1055,7 +1070,7 @@ class StirringEchoes (ContentManager):
                 )
             ],
         })
-        self.dm.addKey(
+        dm.addKey(
             # Define Races Here
             keyName="races",
             keyData=[
@@ -1112,7 +1127,7 @@ class StirringEchoes (ContentManager):
                          )
                     ],
                     languages=[ "Common", "Thraxian" ],
-                    data=self.dm
+                    data=dm
                 ),
                 LINASRace(
                     name="The Oracles",
@@ -1163,11 +1178,11 @@ class StirringEchoes (ContentManager):
                          )
                     ],
                     languages=[ "Common", "Better Common" ],
-                    data=self.dm
+                    data=dm
                 ),
             ]
         )
-        self.dm.addKey(
+        dm.addKey(
             # Define Races Here
             keyName="entities",
             keyData=[
@@ -1347,4 +1362,5 @@ class StirringEchoes (ContentManager):
         # Define Effects Here
         # Define Status Conditions Here
         # Define Items Here
-        # Define Entities Here
\ No newline at end of file
+        # Define Entities Here
+        return dm
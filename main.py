@@ -7,111 +7,414 @@
 Main driver class used to run pdf generation
 """
 from __future__ import print_function, division
+from obj_classes.build_orchestrator import BuildOrchestrator
+from obj_classes.build_watcher import BuildWatcher
+from obj_classes.preview_server import PreviewServer
 from obj_classes.content_manager import ContentManager
 from obj_classes.pdf_generator import PDFGenerator
 from sections.character_sheet import CharacterSheet
 from sections.data_package import LINASDataPackage
+from sections.bestiary import Bestiary
+from sections.card_sheet import CardSheet
 from obj_classes.linas_entity import LinasEntity
-from obj_classes.linas_item import LINASItem
-from obj_classes.linas_abil import LINASAbility
 from obj_classes.linas_technique import LinasTechnique
+from obj_classes.data_loader import loadEntries, loadEntry
 from campaigns.stirring_echoes import StirringEchoes
 from systems.fantasy import Fantasy
-from json import loads
+from utils.assets import loadStyles
+from utils.profiler import profiler
+from utils.snapshot_cache import snapshots
+from functools import lru_cache, partial
+from json import dumps, loads
 import os
+import subprocess
+import sys
 from sys import argv
 import re
 
-if __name__ == "__main__":
-    # Define filenames and systems here
-    cm=Fantasy()
+def openCaches() -> None:
+    """
+    Opens the caches used while building, run once in every build process
+    """
+    # Reuse system data built on earlier runs, the orchestrator's own process
+    # rebuilds it first if asked to so workers never have to
+    if not snapshots.enabled():
+        snapshots.open(f"{os.getcwd()}/.linas_cache/snapshots")
 
-    if 'campaign' in argv:
-        if 'stirring_echoes' in argv:
-            outFile = f"{os.getcwd()}/pdfs/stirring_echoes.pdf"
+@lru_cache(maxsize=None)
+def system() -> Fantasy:
+    """
+    Returns the system shared by every target in a process, only built the
+    first time a target asks for it
+    """
+    return Fantasy()
 
-            # Create pdf generator
-            se = StirringEchoes()
+def buildSystem() -> None:
+    # Load the system's data (and stylesheet) once up front, worker processes
+    # forked afterwards start with both already loaded
+    system().getData()
+    loadStyles(f"{os.getcwd()}/styles.css")
 
-            generator = PDFGenerator(
-                outputPath=outFile,
-                cm=LINASDataPackage(se.contents, se.dm),
-                debug=True
-            )
-            generator.writeOutToPDF()
-    if 'technique' in argv:
-        file = ""
-        for arg in argv:
-            if ".json" in arg:
-                file = arg
-        if os.path.exists(file):
-            print(f'Writing out {os.path.basename(file).replace(".json","")} to disk ...')
-            # Generate path to save file to
-            outFile = f"{os.getcwd()}/pdfs/{os.path.basename(file).replace('.json','')}.pdf"
-
-            # Load data from json and do some preprocessing
-            f = open(file,'r')
-            jdata = loads(f.read())
-            f.close()
-
-            # Create pdf generator
-            generator = PDFGenerator(
-                outputPath=outFile,
-                cm=LinasTechnique(**jdata),
-                debug=True
-            )
-            # Write out to file
-            generator.writeOutToPDF()
-        else:
-            print(f'ERROR: Specified "{file}" as file to read but file does not exist.')
-    if 'entity' in argv:
-        file = ""
-        for arg in argv:
-            if ".json" in arg:
-                file = arg
-        if os.path.exists(file):
-            print(f'Writing out {os.path.basename(file).replace(".json","")} to disk ...')
-            # Generate path to save file to
-            outFile = f"{os.getcwd()}/pdfs/{os.path.basename(file).replace('.json','')}.pdf"
-
-            # Load data from json and do some preprocessing
-            f = open(file,'r')
-            jdata = loads(f.read())
-            f.close()
-            jdata['weapon'] = LINASItem(**jdata['weapon'])
-            jdata['armor'] = LINASItem(**jdata['armor'])
-            jdata['abilities'] = [ LINASAbility(**x) for x in jdata['abilities']]
-            jdata['items'] = [ LINASItem(**x) for x in jdata['items'] ]
-
-            # Create pdf generator
-            generator = PDFGenerator(
-                outputPath=outFile,
-                cm=LinasEntity(**jdata),
-                debug=True
-            )
-            # Write out to file
-            generator.writeOutToPDF()
-        else:
-            print(f'ERROR: Specified "{file}" as file to read but file does not exist.')
-    if 'book' in argv or 'all' in argv:
-        print(f'Writing out handbook to disk ...')
+def campaignDocument() -> LINASDataPackage:
+    se = StirringEchoes()
+    return LINASDataPackage(se.contents, se.dm)
+
+def techniqueDocument(file : str) -> LinasTechnique:
+    # Load data from json and do some preprocessing
+    f = open(file,'r')
+    jdata = loads(f.read())
+    f.close()
+    return LinasTechnique(**jdata)
+
+def entityDocument(file : str) -> LinasEntity:
+    # Load data from json and do some preprocessing
+    f = open(file,'r')
+    jdata = loads(f.read())
+    f.close()
+    return loadEntry(jdata, 'entity')
+
+def buildCampaign() -> None:
+    outFile = f"{os.getcwd()}/pdfs/stirring_echoes.pdf"
+
+    # Create pdf generator
+    generator = PDFGenerator(
+        outputPath=outFile,
+        cm=campaignDocument(),
+        debug=True
+    )
+    generator.writeOutToPDF()
+
+def buildTechnique(file : str) -> None:
+    if os.path.exists(file):
+        print(f'Writing out {os.path.basename(file).replace(".json","")} to disk ...')
         # Generate path to save file to
-        outFile = f"{os.getcwd()}/pdfs/handbook.pdf"
+        outFile = f"{os.getcwd()}/pdfs/{os.path.basename(file).replace('.json','')}.pdf"
 
         # Create pdf generator
         generator = PDFGenerator(
             outputPath=outFile,
-            cm=cm,
+            cm=techniqueDocument(file),
             debug=True
         )
         # Write out to file
         generator.writeOutToPDF()
-    if 'sheet' in argv or 'all' in argv:
-        print("Writing out Character Sheet to disk ...")
-        charSheetGenerator = PDFGenerator(
-            outputPath=f"{os.getcwd()}/pdfs/character_sheet.pdf",
-            cm=CharacterSheet(cm),
+    else:
+        print(f'ERROR: Specified "{file}" as file to read but file does not exist.')
+
+def buildTechniques(patterns : list) -> None:
+    workers = os.cpu_count() or 1
+
+    print('Loading techniques ...')
+    techniques, errors = loadEntries(patterns, 'technique')
+    for source, error in errors:
+        print(f'ERROR: Skipping "{source}": {error}')
+
+    print(f'Writing out {len(techniques)} technique cards to disk ...')
+    generator = PDFGenerator(
+        outputPath=f"{os.getcwd()}/pdfs/technique_cards.pdf",
+        cm=CardSheet(techniques),
+        debug=True,
+        workers=workers,
+        cacheDir=f"{os.getcwd()}/.linas_cache"
+    )
+    generator.writeOutToPDF()
+
+def buildEntity(file : str) -> None:
+    if os.path.exists(file):
+        print(f'Writing out {os.path.basename(file).replace(".json","")} to disk ...')
+        # Generate path to save file to
+        outFile = f"{os.getcwd()}/pdfs/{os.path.basename(file).replace('.json','')}.pdf"
+
+        # Create pdf generator
+        generator = PDFGenerator(
+            outputPath=outFile,
+            cm=entityDocument(file),
             debug=True
         )
-        charSheetGenerator.writeOutToPDF()
-    
\ No newline at end of file
+        # Write out to file
+        generator.writeOutToPDF()
+    else:
+        print(f'ERROR: Specified "{file}" as file to read but file does not exist.')
+
+def buildBestiary(
+    patterns : list,
+    split    : bool,
+    cards    : bool
+) -> None:
+    workers = os.cpu_count() or 1
+
+    print('Loading entities ...')
+    entities, errors = loadEntries(patterns, 'entity')
+    for source, error in errors:
+        print(f'ERROR: Skipping "{source}": {error}')
+
+    bestiary = CardSheet(entities) if cards else Bestiary(entities)
+    if split:
+        print(f'Writing out {len(entities)} entities to disk ...')
+        outDir = f"{os.getcwd()}/pdfs/bestiary"
+        os.makedirs(outDir, exist_ok=True)
+        generator = PDFGenerator(
+            outputPath=outDir,
+            cm=bestiary,
+            workers=workers,
+            cacheDir=f"{os.getcwd()}/.linas_cache"
+        )
+
+        # Name each pdf after its entity, numbering any repeated names
+        documents = []
+        seen = {}
+        for entity in entities:
+            name = re.sub(r'[^\w-]+', '_', entity.name.strip()).strip('_')
+            name = name or 'entity'
+            seen[name] = seen.get(name, 0) + 1
+            if seen[name] > 1:
+                name = f'{name}_{seen[name]}'
+            documents.append((f'{outDir}/{name}.pdf', entity))
+        generator.writeOutEachToPDF(documents)
+    else:
+        print(f'Writing out bestiary of {len(entities)} entities to disk ...')
+        generator = PDFGenerator(
+            outputPath=f"{os.getcwd()}/pdfs/bestiary{'_cards' if cards else ''}.pdf",
+            cm=bestiary,
+            debug=True,
+            workers=workers,
+            cacheDir=f"{os.getcwd()}/.linas_cache"
+        )
+        generator.writeOutToPDF()
+
+def buildBook() -> None:
+    print(f'Writing out handbook to disk ...')
+    # Generate path to save file to
+    outFile = f"{os.getcwd()}/pdfs/handbook.pdf"
+
+    # Create pdf generator
+    generator = PDFGenerator(
+        outputPath=outFile,
+        cm=system(),
+        debug=True,
+        workers=os.cpu_count() or 1,
+        cacheDir=f"{os.getcwd()}/.linas_cache"
+    )
+    # Write out to file
+    generator.writeOutToPDF()
+
+def buildSheet() -> None:
+    print("Writing out Character Sheet to disk ...")
+    charSheetGenerator = PDFGenerator(
+        outputPath=f"{os.getcwd()}/pdfs/character_sheet.pdf",
+        cm=CharacterSheet(system()),
+        debug=True
+    )
+    charSheetGenerator.writeOutToPDF()
+
+def rebuild(
+    targets : list,
+    changed : list
+) -> None:
+    """
+    Rebuilds targets after the files they are built from changed. Each
+    rebuild runs in a fresh process so edited code is imported again, only
+    data, sections and chunks whose inputs changed are rendered again since
+    everything else is picked up from the caches.
+    """
+    print(f'Changed: {", ".join(os.path.relpath(x) for x in changed)}')
+    print(f'Rebuilding {", ".join(targets)} ...')
+    args = [ x for x in argv[1:] if x != 'watch' and not x.startswith('--') ]
+    result = subprocess.run(
+        [ sys.executable, os.path.abspath(__file__) ] + args +
+        [ f'--targets={",".join(targets)}' ]
+    )
+    if result.returncode == 0:
+        print('Watching for changes (Ctrl+C to stop) ...')
+
+def dumpPreview(document : ContentManager) -> None:
+    """
+    Writes a document's head and sections out to stdout as JSON, run in a
+    fresh process for each preview update so edited code is picked up
+    """
+    openCaches()
+    generator = PDFGenerator(outputPath='', cm=document)
+    sys.stdout.write(dumps({
+        'head': generator.getHead(),
+        'sections': [ '\n'.join(x) for x in generator.iterChunks() ]
+    }))
+
+def renderPreview() -> tuple:
+    """
+    Renders the previewed document in a fresh process, see dumpPreview
+    """
+    args = [
+        x for x in argv[1:]
+        if x not in ( 'preview', 'watch' ) and not x.startswith('--')
+    ]
+    result = subprocess.run(
+        [ sys.executable, os.path.abspath(__file__) ] + args + [ '--preview-json' ],
+        stdout=subprocess.PIPE
+    )
+    if result.returncode != 0:
+        raise RuntimeError('Failed to render the preview')
+    data = loads(result.stdout.decode('utf-8'))
+    return data['head'], data['sections']
+
+def updatePreview(
+    preview : PreviewServer,
+    changed : list
+) -> None:
+    print(f'Changed: {", ".join(os.path.relpath(x) for x in changed)}')
+    try:
+        count = preview.update()
+    except RuntimeError as e:
+        print(f'ERROR: {e}')
+        return
+    if count < 0:
+        print('Reloaded the preview')
+    else:
+        print(f'Updated {count} section(s) of the preview')
+
+# Targets built by 'all'
+ALL = [ 'book', 'sheet' ]
+
+if __name__ == "__main__":
+    # --profile records how long each stage of the build takes, written out
+    # as a Chrome trace (profile.json unless --profile=path is given)
+    trace = next(( x for x in argv if x.split('=', 1)[0] == '--profile' ), None)
+    if trace:
+        trace = trace.split('=', 1)[1] if '=' in trace else f"{os.getcwd()}/profile.json"
+        profiler.enable()
+
+    # Reuse system data built on earlier runs, unless asked to build it again
+    snapshots.open(
+        f"{os.getcwd()}/.linas_cache/snapshots",
+        rebuild='--rebuild-cache' in argv
+    )
+
+    # Define the targets and what they depend on, targets which don't depend
+    # on each other are built at the same time (one after another when
+    # profiling, so every span is recorded by this process)
+    orchestrator = BuildOrchestrator(
+        workers=1 if trace else os.cpu_count() or 1,
+        initializer=openCaches
+    )
+    orchestrator.addTarget('system', buildSystem, inProcess=True)
+    orchestrator.addTarget('book', buildBook, deps=[ 'system' ])
+    orchestrator.addTarget('sheet', buildSheet, deps=[ 'system' ])
+    if 'stirring_echoes' in argv:
+        orchestrator.addTarget('campaign', buildCampaign)
+
+    # Arguments which aren't file patterns
+    flags = lambda x: x in ( 'watch', 'split', 'cards' ) or x.startswith('--')
+    patternsAfter = lambda name: [
+        x for x in argv[argv.index(name) + 1:] if not flags(x)
+    ]
+
+    # Single files are taken from the first .json argument
+    file = next(( x for x in argv if ".json" in x ), "")
+    orchestrator.addTarget('technique', partial(buildTechnique, file))
+    orchestrator.addTarget('entity', partial(buildEntity, file))
+
+    # Everything after 'techniques' is a directory, glob or .json/.jsonl file
+    # of techniques, printed 4 cards to a page
+    if 'techniques' in argv:
+        orchestrator.addTarget('techniques', partial(
+            buildTechniques,
+            patternsAfter('techniques')
+        ))
+
+    # Everything after 'bestiary' is a directory, glob or .json/.jsonl file
+    # of entities, 'split' writes one full page pdf per entity instead and
+    # 'cards' prints compact stat blocks 4 to a page
+    if 'bestiary' in argv:
+        patterns = argv[argv.index('bestiary') + 1:]
+        orchestrator.addTarget('bestiary', partial(
+            buildBestiary,
+            patternsAfter('bestiary'),
+            'split' in patterns,
+            'cards' in patterns
+        ))
+
+    targets = [ x for x in orchestrator.getTargets() if x in argv ]
+    if 'all' in argv:
+        targets += [ x for x in ALL if x not in targets ]
+
+    # --targets=book,sheet narrows the run down, used by watch rebuilds
+    only = next(( x for x in argv if x.startswith('--targets=') ), None)
+    if only:
+        only = only.split('=', 1)[1].split(',')
+        targets = [ x for x in targets if x in only ]
+
+    # 'preview' serves the first target as HTML instead of building it and
+    # updates the page as its sources change, i.e. python main.py preview book
+    if 'preview' in argv or '--preview-json' in argv:
+        documents = {
+            'book': system,
+            'sheet': lambda: CharacterSheet(system()),
+            'campaign': campaignDocument,
+            'technique': lambda: techniqueDocument(file),
+            'entity': lambda: entityDocument(file),
+        }
+        if 'techniques' in targets:
+            documents['techniques'] = lambda: CardSheet(
+                loadEntries(patternsAfter('techniques'), 'technique')[0]
+            )
+        if 'bestiary' in targets:
+            documents['bestiary'] = lambda: (
+                CardSheet if 'cards' in argv else Bestiary
+            )(loadEntries(patternsAfter('bestiary'), 'entity')[0])
+        name = next(( x for x in targets if x in documents ), None)
+        if name is None:
+            print(f'ERROR: Nothing to preview, pick one of {", ".join(documents)}')
+            sys.exit(1)
+        if '--preview-json' in argv:
+            dumpPreview(documents[name]())
+            sys.exit(0)
+        port = next(( x for x in argv if x.startswith('--port=') ), '--port=8000')
+        preview = PreviewServer(renderPreview, port=int(port.split('=', 1)[1]))
+        try:
+            preview.serve()
+        except (RuntimeError, OSError) as e:
+            print(f'ERROR: {e}')
+            sys.exit(1)
+        print(f'Previewing {name} on http://{preview.host}:{preview.port}/')
+        targets = [ name ]
+    else:
+        try:
+            timings = orchestrator.run(targets)
+        except RuntimeError as e:
+            print(f'ERROR: {e}')
+            if 'watch' not in argv:
+                sys.exit(1)
+            timings = {}
+        for name, seconds in timings.items():
+            print(f'Built {name} in {seconds:.2f}s')
+        if trace:
+            profiler.writeTrace(trace)
+            print(profiler.summary())
+            print(f'Wrote trace to {trace}')
+
+    # 'watch' keeps rebuilding the targets as the files they're built from
+    # change, i.e. python main.py all watch
+    if 'watch' in argv or 'preview' in argv:
+        cwd = os.getcwd()
+        if 'preview' in argv:
+            watcher = BuildWatcher(
+                lambda targets, changed: updatePreview(preview, changed),
+                debounce=0.1
+            )
+        else:
+            watcher = BuildWatcher(rebuild)
+
+        # Rendering code, the stylesheet and the assets feed into everything
+        for path in ( 'obj_classes', 'sections', 'utils', 'styles.css', 'assets' ):
+            watcher.watch(f'{cwd}/{path}', targets)
+        watcher.watch(f'{cwd}/systems', [ x for x in targets if x in ( 'book', 'sheet' ) ])
+        watcher.watch(f'{cwd}/campaigns', [ x for x in targets if x == 'campaign' ])
+        if file:
+            watcher.watch(os.path.abspath(file), [
+                x for x in targets if x in ( 'technique', 'entity' )
+            ])
+        for name in ( 'techniques', 'bestiary' ):
+            if name in targets:
+                for pattern in patternsAfter(name):
+                    watcher.watch(os.path.abspath(pattern), [ name ])
+        print('Watching for changes (Ctrl+C to stop) ...')
+        watcher.run()
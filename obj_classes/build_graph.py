@@ -0,0 +1,193 @@
+"""
+Class used to track which data each section of a system reads so that only
+the sections whose inputs changed are rebuilt
+"""
+from __future__ import print_function, division
+from obj_classes.content_manager import ContentManager
+from utils.fingerprint import fingerprint, rendererVersion
+from utils.profiler import profiler
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+import hashlib
+import inspect
+import json
+import os
+
+class BuildGraph:
+    """
+    Class used to track which data each section of a system reads so that only
+    the sections whose inputs changed are rebuilt
+
+    Each section (plus the title page and table of contents) is a node in the
+    graph. A node's inputs are the source of its section class, the source of
+    the title page and table of contents classes (every section's heading comes
+    from the table of contents), the renderer version, the table of contents,
+    a salt passed in by the caller and a hash of every DataManager key the
+    node read the last time it was rendered (e.g. TechniqueSection reads
+    'techniques', LangRaceSection reads 'languages' and 'races'). When none of
+    a node's inputs changed, the digest of the HTML it produced last time is
+    reused instead of rendering it again.
+
+    Parameters
+    ----------
+    system : `ContentManager`
+        The system whose sections make up the graph
+    statePath : `str`
+        Location of the file the graph is saved to between builds
+    salt : `str`
+        An extra input every node depends on, e.g. a hash of the document head
+        and pdf options
+    """
+    def __init__(
+        self,
+        system    : ContentManager,
+        statePath : str,
+        salt      : str = ''
+    ) -> None:
+        self.__system = system
+        self.__data = system.getData()
+        self.__statePath = statePath
+        self.__salt = salt
+        self.__fingerprints : Dict[str, str] = {}
+        self.__next : Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(statePath, 'r') as fin:
+                self.__state = json.load(fin)
+        except (OSError, ValueError):
+            self.__state = {}
+
+    def __keyFingerprint(self, key : str) -> str:
+        if key not in self.__fingerprints:
+            with profiler.span(f'fingerprint key {key}', 'data'):
+                self.__fingerprints[key] = self.__data.keyFingerprint(key)
+        return self.__fingerprints[key]
+
+    def __sourceHash(self, obj : Any) -> str:
+        with open(inspect.getsourcefile(type(obj)), 'rb') as fin:
+            return hashlib.sha1(fin.read()).hexdigest()
+
+    def __inputs(self, section : Any) -> Dict[str, str]:
+        inputs = {
+            'salt': self.__salt,
+            'renderer': rendererVersion(),
+            'cwd': os.getcwd(),
+            'contents': fingerprint(self.__system.getContents().contentList),
+            'shared': self.__sourceHash(self.__system.getTitle())
+                + self.__sourceHash(self.__system.getContents()),
+        }
+        if section is None:
+            inputs['source'] = self.__sourceHash(self.__system)
+            inputs['title'] = fingerprint(self.__system.getTitle())
+        else:
+            inputs['source'] = self.__sourceHash(section)
+        return inputs
+
+    def __clean(
+        self,
+        old    : Optional[Dict[str, Any]],
+        inputs : Dict[str, str]
+    ) -> bool:
+        if not old or old['inputs'] != inputs:
+            return False
+        if old['deps'] and self.__data is None:
+            return False
+        for key, digest in old['deps'].items():
+            if self.__keyFingerprint(key) != digest:
+                return False
+        return True
+
+    def __render(
+        self,
+        name    : str,
+        section : Any,
+        inputs  : Dict[str, str]
+    ) -> Iterator[str]:
+        """
+        Renders a node, recording the keys it reads once it has been consumed
+        """
+        if section is None:
+            render = self.__system.iterFrontMatter
+            stage = 'front matter'
+        else:
+            render = section.iterHTML
+            stage = f'section {type(section).__name__}'
+        deps = set()
+        if self.__data is None:
+            yield from profiler.iterate(stage, render())
+        else:
+            with self.__data.track() as deps:
+                yield from profiler.iterate(stage, render())
+        self.__next[name] = {
+            'inputs': inputs,
+            'deps': { key: self.__keyFingerprint(key) for key in sorted(deps) },
+            'digest': None
+        }
+
+    def iterChunks(
+        self,
+        available : Callable[[str], bool] = lambda digest: True
+    ) -> Iterator[Tuple[str, Optional[str], Optional[Iterator[str]]]]:
+        """
+        Yields every node of the graph in document order
+
+        Parameters
+        ----------
+        available : `Callable[[str], bool]`
+            Used to check if the output for an HTML digest from an earlier
+            build is still around, nodes whose output is gone are re-rendered
+
+        Yields
+        ------
+        name : `str`
+            The name of the node, passed back to record()
+        digest : `Optional[str]`
+            The digest of the node's HTML from the last build if the node is
+            clean, None if it has to be rendered
+        lines : `Optional[Iterator[str]]`
+            The node's HTML if it has to be rendered, None if it is clean
+        """
+        sections = [ None ] + list(self.__system.getSections())
+        for i, section in enumerate(sections):
+            if section is None:
+                name = 'front-matter'
+            else:
+                name = f'{i}-{type(section).__name__}'
+            inputs = self.__inputs(section)
+            old = self.__state.get(name)
+            if self.__clean(old, inputs) and available(old['digest']):
+                self.__next[name] = old
+                yield name, old['digest'], None
+            else:
+                yield name, None, self.__render(name, section, inputs)
+
+    def record(
+        self,
+        name   : str,
+        digest : str
+    ) -> None:
+        """
+        Records the digest of the HTML a node rendered to
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the node, as yielded by iterChunks()
+        digest : `str`
+            The digest of the node's HTML
+        """
+        self.__next[name]['digest'] = digest
+
+    def save(self) -> None:
+        """
+        Saves the graph so the next build can skip clean nodes
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(self.__statePath)), exist_ok=True)
+        with open(self.__statePath, 'w') as fout:
+            json.dump(
+                {
+                    name: node
+                    for name, node in self.__next.items()
+                    if node['digest']
+                },
+                fout,
+                indent=2
+            )
@@ -0,0 +1,226 @@
+"""
+Class used to run build targets (i.e. the handbook and character sheet) in
+dependency order, independent targets in parallel processes
+"""
+from __future__ import print_function, division
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from utils.profiler import profiler
+from typing import Callable, Dict, List
+import time
+import traceback
+
+class BuildTarget:
+    """
+    Internal struct describing a single build target
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the target, i.e. 'book'
+    build : `Callable[[], None]`
+        The function building the target, must be picklable (a module level
+        function or a functools.partial of one) unless the target is run in
+        process
+    deps : `List[str]`
+        The names of the targets which have to be built first
+    inProcess : `bool`
+        If true, the target always runs in the orchestrator's own process so
+        anything it builds is shared with the targets depending on it
+    """
+    __slots__ = ( 'name', 'build', 'deps', 'inProcess' )
+
+    def __init__(
+        self,
+        name      : str,
+        build     : Callable[[], None],
+        deps      : List[str] = [],
+        inProcess : bool = False
+    ) -> None:
+        self.name = name
+        self.build = build
+        self.deps = list(deps)
+        self.inProcess = inProcess
+
+def _timed(
+    name  : str,
+    build : Callable[[], None]
+) -> float:
+    """
+    Runs a build function and returns how long it took, used by the worker
+    processes
+    """
+    start = time.perf_counter()
+    with profiler.span(f'target {name}'):
+        build()
+    return time.perf_counter() - start
+
+class BuildOrchestrator:
+    """
+    Class used to run build targets in dependency order. Targets which don't
+    depend on each other are run at the same time in separate processes, so
+    building several pdfs takes about as long as the slowest of them.
+
+    Targets marked inProcess run in the orchestrator's own process before
+    anything depending on them is started. On platforms where worker
+    processes are forked (Linux) they inherit whatever those targets built,
+    i.e. a system whose data was already loaded, elsewhere each worker loads
+    it again (from the snapshot cache if one is open).
+
+    Parameters
+    ----------
+    workers : `int`
+        The most targets to build at once, default value is 1 (build every
+        target in this process, one after another)
+    initializer : `Callable[[], None]`
+        An (optional) function run once in each process building targets
+        (this one included when not building in parallel), i.e. to open
+        caches which can't be shared between processes
+    """
+    def __init__(
+        self,
+        workers     : int = 1,
+        initializer : Callable[[], None] = None
+    ) -> None:
+        self.workers = max(1, workers)
+        self.__initializer = initializer
+        self.__targets : Dict[str, BuildTarget] = {}
+
+    def addTarget(
+        self,
+        name      : str,
+        build     : Callable[[], None],
+        deps      : List[str] = [],
+        inProcess : bool = False
+    ) -> None:
+        """
+        Adds a target to the orchestrator, see BuildTarget
+        """
+        self.__targets[name] = BuildTarget(name, build, deps, inProcess)
+
+    def getTargets(self) -> List[str]:
+        """
+        Returns the names of every target, in the order they were added
+        """
+        return list(self.__targets)
+
+    def resolve(
+        self,
+        names : List[str]
+    ) -> List[str]:
+        """
+        Returns the targets needed to build the given targets (including
+        their dependencies) in an order they can be built in
+
+        Parameters
+        ----------
+        names : `List[str]`
+            The targets to build
+
+        Returns
+        -------
+        order : `List[str]`
+            Every target to build, dependencies first
+        """
+        order = []
+        state = {}
+        def visit(name : str, path : List[str]) -> None:
+            if name not in self.__targets:
+                raise KeyError(f'Unknown build target "{name}"')
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(
+                    f'Build targets depend on each other: {" -> ".join(path + [ name ])}'
+                )
+            state[name] = 'visiting'
+            for dep in self.__targets[name].deps:
+                visit(dep, path + [ name ])
+            state[name] = 'done'
+            order.append(name)
+        for name in names:
+            visit(name, [])
+        return order
+
+    def run(
+        self,
+        names : List[str]
+    ) -> Dict[str, float]:
+        """
+        Builds the given targets and everything they depend on. A target
+        which fails is reported and anything depending on it is skipped,
+        unrelated targets still get built.
+
+        Parameters
+        ----------
+        names : `List[str]`
+            The targets to build
+
+        Returns
+        -------
+        timings : `Dict[str, float]`
+            How long each target took to build in seconds, targets which
+            failed or were skipped are left out
+
+        Raises
+        ------
+        RuntimeError
+            If any target failed
+        """
+        pending = self.resolve(names)
+        parallel = self.workers > 1 and sum(
+            not self.__targets[x].inProcess for x in pending
+        ) > 1
+        if not parallel and self.__initializer:
+            self.__initializer()
+
+        timings : Dict[str, float] = {}
+        failed : Dict[str, str] = {}
+        running = {}
+        pool = None
+        try:
+            while pending or running:
+                started = False
+                for name in list(pending):
+                    target = self.__targets[name]
+                    if any(x in failed for x in target.deps):
+                        pending.remove(name)
+                        failed[name] = 'skipped, a dependency failed'
+                        continue
+                    if not all(x in timings for x in target.deps):
+                        continue
+                    pending.remove(name)
+                    if parallel and not target.inProcess:
+                        if pool is None:
+                            pool = ProcessPoolExecutor(
+                                max_workers=self.workers,
+                                initializer=self.__initializer
+                            )
+                        running[pool.submit(_timed, name, target.build)] = name
+                        continue
+
+                    # Run in this process, then look for newly ready targets
+                    try:
+                        timings[name] = _timed(name, target.build)
+                    except Exception:
+                        failed[name] = traceback.format_exc()
+                    started = True
+                    break
+                if started or not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        timings[name] = future.result()
+                    except Exception:
+                        failed[name] = traceback.format_exc()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        if failed:
+            raise RuntimeError(
+                'Failed to build ' + ', '.join(failed) + '\n' + '\n'.join(
+                    f'[{name}] {error}' for name, error in failed.items()
+                )
+            )
+        return timings
@@ -0,0 +1,166 @@
+"""
+Class used to watch source, data and asset files and rebuild the targets
+they feed into whenever they change
+"""
+from __future__ import print_function, division
+from typing import Callable, Dict, List, Set, Tuple
+import glob
+import os
+import time
+
+# Directory names never looked into when watching a directory
+_SKIP = { '__pycache__', '.git', '.linas_cache' }
+
+class BuildWatcher:
+    """
+    Class used to watch source, data and asset files and rebuild the targets
+    they feed into whenever they change. Files are polled (only their
+    modification time and size are read) so no platform specific file
+    notifications are needed.
+
+    A burst of saves (i.e. an editor writing several files, or saving the
+    same file twice) is debounced: once something changes the watcher waits
+    until nothing has changed for `debounce` seconds, then rebuilds every
+    target any of the changed files feeds into in one go.
+
+    Parameters
+    ----------
+    rebuild : `Callable[[List[str], List[str]], None]`
+        Function called with the targets to rebuild and the files which
+        changed, in the order the targets were first watched
+    interval : `float`
+        Seconds between polls
+    debounce : `float`
+        Seconds without any changes to wait for before rebuilding
+    """
+    def __init__(
+        self,
+        rebuild  : Callable[[List[str], List[str]], None],
+        interval : float = 0.5,
+        debounce : float = 0.3
+    ) -> None:
+        self.rebuild = rebuild
+        self.interval = interval
+        self.debounce = debounce
+        self.__rules : List[Tuple[str, List[str]]] = []
+        self.__order : List[str] = []
+
+        # Targets each file fed into as of the last scan, so removed files
+        # still trigger a rebuild
+        self.__owners : Dict[str, Set[str]] = {}
+
+    def watch(
+        self,
+        pattern : str,
+        targets : List[str]
+    ) -> None:
+        """
+        Watches a file, a directory (every file under it) or a glob
+
+        Parameters
+        ----------
+        pattern : `str`
+            The file, directory or glob to watch
+        targets : `List[str]`
+            The targets rebuilt when anything it matches changes
+        """
+        self.__rules.append((pattern, list(targets)))
+        self.__order += [ x for x in targets if x not in self.__order ]
+
+    def __expand(self, pattern : str) -> List[str]:
+        if os.path.isdir(pattern):
+            files = []
+            for root, dirs, names in os.walk(pattern):
+                dirs[:] = [ x for x in dirs if x not in _SKIP ]
+                files += [ os.path.join(root, x) for x in names ]
+            return files
+        if any(x in pattern for x in '*?['):
+            return glob.glob(pattern, recursive=True)
+        return [ pattern ] if os.path.isfile(pattern) else []
+
+    def scan(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Returns the modification time and size of every watched file
+
+        Returns
+        -------
+        state : `Dict[str, Tuple[int, int]]`
+            The (mtime in ns, size) of each file by path
+        """
+        state = {}
+        owners = {}
+        for pattern, targets in self.__rules:
+            for file in self.__expand(pattern):
+                try:
+                    stat = os.stat(file)
+                except FileNotFoundError:
+                    continue
+                state[file] = (stat.st_mtime_ns, stat.st_size)
+                owners.setdefault(file, set()).update(targets)
+        for file, targets in owners.items():
+            self.__owners.setdefault(file, set()).update(targets)
+        return state
+
+    def targetsFor(
+        self,
+        files : List[str]
+    ) -> List[str]:
+        """
+        Returns the targets a set of files feed into
+
+        Parameters
+        ----------
+        files : `List[str]`
+            The files which changed
+
+        Returns
+        -------
+        targets : `List[str]`
+            The targets to rebuild, in the order they were first watched
+        """
+        targets = set()
+        for file in files:
+            targets |= self.__owners.get(file, set())
+        return [ x for x in self.__order if x in targets ]
+
+    def run(
+        self,
+        polls : int = None
+    ) -> None:
+        """
+        Watches the files until interrupted (Ctrl+C)
+
+        Parameters
+        ----------
+        polls : `int`
+            An (optional) number of polls to stop after
+        """
+        state = self.scan()
+        try:
+            while polls is None or polls > 0:
+                time.sleep(self.interval)
+                if polls is not None:
+                    polls -= 1
+                current = self.scan()
+                if current == state:
+                    continue
+
+                # Wait for the burst of saves to settle
+                while True:
+                    time.sleep(self.debounce)
+                    settled = self.scan()
+                    if settled == current:
+                        break
+                    current = settled
+                changed = sorted(
+                    x for x in set(state) | set(current)
+                    if state.get(x) != current.get(x)
+                )
+
+                # Files saved while rebuilding are picked up by the next poll
+                state = current
+                targets = self.targetsFor(changed)
+                if targets:
+                    self.rebuild(targets, changed)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,292 @@
+"""
+Class used to simulate battles between LINAS entities, used to balance
+bestiary entries without playing out every fight by hand
+"""
+from __future__ import print_function, division
+from obj_classes.linas_entity import LinasEntity
+from typing import Any, List
+
+# Skill modifier used when an entity has no points in its weapon's skill
+UNSKILLED = -2
+
+class CombatResult:
+    """
+    Class used to hold the outcome of a batch of simulated battles
+
+    Parameters
+    ----------
+    winners : `numpy.ndarray`
+        The winning side of each battle, 1 for the party, -1 for the enemies
+        and 0 if the battle ran out of rounds
+    rounds : `numpy.ndarray`
+        How many rounds each battle lasted
+    """
+    __slots__ = ( 'winners', 'rounds' )
+
+    def __init__(
+        self,
+        winners : Any,
+        rounds  : Any
+    ) -> None:
+        self.winners = winners
+        self.rounds = rounds
+
+    def battles(self) -> int:
+        """
+        Returns how many battles were simulated
+        """
+        return len(self.winners)
+
+    def winRate(self) -> float:
+        """
+        Returns the fraction of battles won by the party
+        """
+        return float((self.winners == 1).mean())
+
+    def lossRate(self) -> float:
+        """
+        Returns the fraction of battles won by the enemies
+        """
+        return float((self.winners == -1).mean())
+
+    def drawRate(self) -> float:
+        """
+        Returns the fraction of battles which ran out of rounds
+        """
+        return float((self.winners == 0).mean())
+
+    def turnsToKill(
+        self,
+        percentiles : List[float] = [ 50, 90 ]
+    ) -> List[float]:
+        """
+        Returns how many rounds the party needed to defeat the enemies, over
+        every battle the party won
+
+        Parameters
+        ----------
+        percentiles : `List[float]`
+            The percentiles to return
+
+        Returns
+        -------
+        rounds : `List[float]`
+            The rounds at each percentile, NaN if the party never won
+        """
+        import numpy as np
+        won = self.rounds[self.winners == 1]
+        if not len(won):
+            return [ float('nan') for _ in percentiles ]
+        return [ float(x) for x in np.percentile(won, percentiles) ]
+
+    def summary(self) -> str:
+        """
+        Returns a one line summary of the results
+        """
+        median, worst = self.turnsToKill([ 50, 90 ])
+        return (
+            f'{self.battles()} battles: '
+            f'win {self.winRate():.1%}, loss {self.lossRate():.1%}, '
+            f'draw {self.drawRate():.1%}, '
+            f'turns to kill median {median:g} / p90 {worst:g}'
+        )
+
+class CombatSimulator:
+    """
+    Class used to run many battles between a party and a group of enemies at
+    once. Every battle in a batch advances in lockstep as NumPy arrays, so
+    the Python loop only runs once per turn rather than once per battle.
+    Requires numpy.
+
+    The simulation follows the CombatSystem section:
+    - Initiative is 1d6 plus adjusted speed, ties go to the faster entity
+      and then to a re-roll, and the order is kept for the whole battle
+    - Each living entity attacks a random living opponent with its weapon,
+      rolling 1d6 plus its weapon skill modifier (4+ hits, a 1 always fails
+      and a 6 always hits)
+    - Targets faster than their attacker guard, cutting the damage by the
+      difference in speed
+    - Physical damage is absorbed by physical defense and magic damage by
+      magic defense, both of which are used up until the end of the round
+    Techniques, items, abilities and status effects are not simulated.
+
+    Parameters
+    ----------
+    party : `List[LinasEntity]`
+        The entities on the party's side
+    enemies : `List[LinasEntity]`
+        The entities on the enemies' side
+    maxRounds : `int`
+        Rounds after which a battle counts as a draw
+    """
+    def __init__(
+        self,
+        party     : List[LinasEntity],
+        enemies   : List[LinasEntity],
+        maxRounds : int = 50
+    ) -> None:
+        if not party or not enemies:
+            raise ValueError('Both sides of a battle need at least one entity')
+        import numpy as np
+        entities = list(party) + list(enemies)
+        self.__size = len(entities)
+        self.__maxRounds = maxRounds
+        self.__side = np.array([ 1 ] * len(party) + [ -1 ] * len(enemies))
+        self.__hp = np.array([ x.hp for x in entities ], dtype=np.int64)
+        self.__damage = np.array([ x.damage for x in entities ], dtype=np.int64)
+        self.__speed = np.array([ x.adj_spd for x in entities ], dtype=np.int64)
+        self.__p_defense = np.array([ x.p_defense for x in entities ], dtype=np.int64)
+        self.__m_defense = np.array([ x.m_defense for x in entities ], dtype=np.int64)
+        self.__magic = np.array([ x.weapon.damageType() == 'MAG' for x in entities ])
+        self.__modifier = np.array([ self.__skill(x) for x in entities ], dtype=np.int64)
+
+    def __skill(self, entity : LinasEntity) -> int:
+        skill = (entity.weapon.linkedSkill or '').lower()
+        for name, value in entity.skills.items():
+            if name.lower() == skill:
+                return int(value)
+        return UNSKILLED
+
+    def __canHurt(self, side : int) -> bool:
+        """
+        Returns if a side could ever damage one of its opponents, i.e. if
+        all of its attacks landing in one round would get through the
+        opponent's guard and armor
+        """
+        import numpy as np
+        attackers = self.__side == side
+        for target in np.flatnonzero(~attackers):
+            gap = np.maximum(self.__speed[target] - self.__speed[attackers], 0)
+            damage = np.maximum(self.__damage[attackers] - gap, 0)
+            magic = self.__magic[attackers]
+            if (
+                damage[~magic].sum() > self.__p_defense[target] or
+                damage[magic].sum() > self.__m_defense[target]
+            ):
+                return True
+        return False
+
+    def __initiative(self, rng : Any, battles : int) -> Any:
+        """
+        Rolls initiative for every battle, returns the turn order as the
+        entity indices of each battle from first to last
+        """
+        import numpy as np
+        shape = (battles, self.__size)
+        score = rng.integers(1, 7, size=shape) + self.__speed
+
+        # Highest score first, then highest speed, then the re-roll
+        return np.lexsort((
+            rng.random(shape),
+            np.broadcast_to(self.__speed, shape),
+            score
+        ), axis=-1)[:, ::-1]
+
+    def __batch(self, rng : Any, battles : int) -> CombatResult:
+        import numpy as np
+        winners = np.zeros(battles, dtype=np.int8)
+        rounds = np.full(battles, self.__maxRounds, dtype=np.int16)
+        if not (self.__canHurt(1) or self.__canHurt(-1)):
+            return CombatResult(winners, rounds)
+
+        # State of the battles still running, finished ones are dropped at
+        # the end of each round so later rounds only do work for the rest
+        battle = np.arange(battles)
+        order = self.__initiative(rng, battles)
+        hp = np.broadcast_to(self.__hp, (battles, self.__size)).copy()
+        standing = {
+            side: np.full(battles, np.count_nonzero(self.__side == side))
+            for side in (1, -1)
+        }
+
+        for round in range(1, self.__maxRounds + 1):
+            rows = np.arange(len(battle))
+            running = np.ones(len(battle), dtype=bool)
+            p_armor = np.broadcast_to(self.__p_defense, hp.shape).copy()
+            m_armor = np.broadcast_to(self.__m_defense, hp.shape).copy()
+            for turn in range(self.__size):
+                attacker = order[:, turn]
+                acting = running & (hp[rows, attacker] > 0)
+                if not acting.any():
+                    continue
+                side = self.__side[attacker]
+
+                # Pick a random living opponent
+                opponents = (self.__side[None, :] != side[:, None]) & (hp > 0)
+                target = np.where(opponents, rng.random(hp.shape), -1).argmax(axis=1)
+
+                roll = rng.integers(1, 7, size=len(rows))
+                hit = (roll == 6) | ((roll > 1) & (roll + self.__modifier[attacker] >= 4))
+                damage = self.__damage[attacker] * (acting & hit)
+
+                # Faster targets guard against the attack
+                gap = self.__speed[target] - self.__speed[attacker]
+                damage = np.maximum(damage - np.maximum(gap, 0), 0)
+
+                # Armor soaks up what it can until the end of the round
+                magic = self.__magic[attacker]
+                armor = np.where(magic, m_armor[rows, target], p_armor[rows, target])
+                absorbed = np.minimum(damage, armor)
+                p_armor[rows, target] -= absorbed * ~magic
+                m_armor[rows, target] -= absorbed * magic
+                before = hp[rows, target]
+                hp[rows, target] = before - (damage - absorbed)
+
+                # Battles end as soon as one side is down
+                killed = (before > 0) & (hp[rows, target] <= 0)
+                for fallen in (1, -1):
+                    standing[fallen] -= killed & (side != fallen)
+                ended = running & ((standing[1] == 0) | (standing[-1] == 0))
+                winners[battle[ended]] = np.where(standing[1][ended] > 0, 1, -1)
+                rounds[battle[ended]] = round
+                running &= ~ended
+
+            battle, order, hp = battle[running], order[running], hp[running]
+            standing = { x: y[running] for x, y in standing.items() }
+            if not len(battle):
+                break
+        return CombatResult(winners, rounds)
+
+    def run(
+        self,
+        battles   : int,
+        seed      : int = None,
+        batchSize : int = 100000
+    ) -> CombatResult:
+        """
+        Simulates a number of battles between the party and the enemies
+
+        Parameters
+        ----------
+        battles : `int`
+            How many battles to simulate
+        seed : `int`
+            Seed for the random number generator, for repeatable results
+        batchSize : `int`
+            How many battles are simulated at once, bounds memory use
+
+        Returns
+        -------
+        result : `CombatResult`
+            The outcome of every battle
+
+        Raises
+        ------
+        ValueError
+            If fewer than one battle is asked for, or the batch size is
+            less than one
+        """
+        if battles < 1:
+            raise ValueError(f'At least one battle has to be simulated, got {battles}')
+        if batchSize < 1:
+            raise ValueError(f'The batch size has to be at least one, got {batchSize}')
+        import numpy as np
+        rng = np.random.default_rng(seed)
+        results = [
+            self.__batch(rng, min(batchSize, battles - start))
+            for start in range(0, battles, batchSize)
+        ]
+        return CombatResult(
+            np.concatenate([ x.winners for x in results ]),
+            np.concatenate([ x.rounds for x in results ])
+        )
@@ -5,7 +5,9 @@ data for a given system (techniques, items, enemies, etc.)
 from __future__ import print_function, division
 from sections.title_section import TitleSection
 from sections.content_section import ContentSection
-from typing import List
+from obj_classes.data_manager import DataManager
+from utils.profiler import profiler
+from typing import Any, Callable, List, Iterator, Union
 
 class ContentManager:
     """
@@ -37,16 +39,18 @@ class ContentManager:
             revision
         )
 
-        # Begin initializing HTML list for class
-        self.__html = self.__title.toHTMLList()
-
         # Initialize contents
         self.__contents = ContentSection(
             contents
         )
 
-        # Add contents to HTML list
-        self.__html += self.__contents.toHTMLList()
+        # Sections (or functions creating them) are kept as-is and only
+        # rendered when the HTML is iterated
+        self.__sections = []
+
+        # Data used by the sections (or a function building it) set by the
+        # system
+        self.__data = None
 
         self.__indent = "&emsp;"*3
         self.__page = '<p style="page-break-before: always;"><p/>'
@@ -94,25 +98,100 @@ class ContentManager:
             collapsed.append(par)
         return collapsed
 
+    def getTitle(self):
+        """
+        Used to access title page data for the class
+        """
+        return self.__title
+
     def getContents(self):
         """
         Used to access table of contents data for the class
         """
         return self.__contents
 
+    def setData(
+        self,
+        data : Union[DataManager, Callable[[], DataManager]]
+    ) -> None:
+        """
+        Sets the data manager holding the data for the system
+
+        Parameters
+        ----------
+        data : `Union[DataManager, Callable[[], DataManager]]`
+            The data the system's sections are rendered from, or a function
+            building it. Functions are only called the first time the data is
+            accessed
+        """
+        self.__data = data
+
+    def getData(self) -> DataManager:
+        """
+        Used to access the data manager for the class, None if the system has
+        no data
+        """
+        if callable(self.__data):
+            self.__data = self.__data()
+        return self.__data
+
+    def getSections(self) -> List[Any]:
+        """
+        Used to access the sections added to the class, in render order. Any
+        section added as a function is created here
+        """
+        for i, section in enumerate(self.__sections):
+            if callable(section):
+                self.__sections[i] = section()
+        return self.__sections
+
     def addContent(
         self,
         content
     ) -> None:
         """
-        Expand out a section and add to internal HTML
+        Add a section to the document, sections are rendered in the order
+        they are added
 
         Parameters
         ----------
-        content : `Section`
-            The content to add to the internal html
+        content : `Union[Section, Callable[[], Section]]`
+            The content to add to the document, or a function creating it.
+            Functions are only called the first time the sections are accessed
+        """
+        self.__sections.append(content)
+
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
+        yield from profiler.iterate('front matter', self.iterFrontMatter())
+        for section in self.getSections():
+            yield from profiler.iterate(
+                f'section {type(section).__name__}',
+                section.iterHTML()
+            )
+
+    def iterFrontMatter(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields the title page and table of contents, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
         """
-        self.__html += content.toHTMLList()
+        yield from self.__title.iterHTML()
+        yield from self.__contents.iterHTML()
 
     def toHTMLList(
         self
@@ -125,4 +204,4 @@ class ContentManager:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
+        return list(self.iterHTML())
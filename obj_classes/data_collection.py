@@ -2,10 +2,13 @@
 Class used to organize data in the LINAS system by type
 """
 from __future__ import print_function, division
-from typing import List, Any
-import copy
+from typing import List, Any, Iterator
+from utils.templates import expandTemplate
 
 class DataCollection:
+    __slots__ = (
+        'name', 'desc', '__children', '__indent',
+    )
     def __init__(
         self,
         name : str,
@@ -19,20 +22,39 @@ class DataCollection:
         self.__children = {}
         self.__indent = "&emsp;"*3
         for child in children:
-            if child.template == None:
-                self.__children[child.name.lower()] = child
-            else:
-                for element in child.template:
-                    ch = copy.deepcopy(child)
-                    ch.name = ch.name.format(**element)
-                    ch.desc = ch.desc.format(**element)
-                    self.__children[ch.name.lower()] = copy.deepcopy(ch)
+            for ch in expandTemplate(child):
+                self.__children[ch.name.lower()] = ch
     
     def getChild(self, name):
         if name.lower() in self.__children:
             return self.__children[name.lower()]
         return None
 
+    def getChildren(self) -> List[Any]:
+        """
+        Returns every child in the collection, sorted by name
+        """
+        return [ self.__children[key] for key in sorted(self.__children) ]
+
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
+        yield from [
+            '<p style="page-break-before: always;"><p/>'
+            f"<u><h3>{self.name}</h3></u>",
+            f"<p>{self.__indent}{self.desc}</p>",
+        ]
+        for key in sorted(self.__children):
+            yield from self.__children[key].iterHTML()
+
     def toHTMLList(
         self
     ) -> List[str]:
@@ -44,12 +66,5 @@ class DataCollection:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        html = [
-            '<p style="page-break-before: always;"><p/>'
-            f"<u><h3>{self.name}</h3></u>",
-            f"<p>{self.__indent}{self.desc}</p>",
-        ]
-        for key in sorted(self.__children):
-            html += self.__children[key].toHTMLList()
-        return html
+        return list(self.iterHTML())
     
\ No newline at end of file
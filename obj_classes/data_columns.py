@@ -0,0 +1,222 @@
+"""
+Functions used to convert data objects to and from columnar NumPy arrays
+"""
+from __future__ import print_function, division
+from operator import attrgetter
+from typing import Any, Dict, List
+
+# Columns exported by default for each data class, anything not listed here
+# exports every field holding plain numbers or strings
+COLUMNS : Dict[str, List[str]] = {
+    'LINASItem': [
+        'name',
+        'cost',
+        'p_damage',
+        'm_damage',
+        'p_protection',
+        'm_protection',
+        'range',
+        'speedPenalty',
+        'uses',
+        'points',
+    ],
+    'LinasTechnique': [
+        'name',
+        'skill',
+        'stat',
+        'cost', # TP cost
+        'damage',
+        'range',
+        'points',
+    ],
+}
+
+# Fields never exported unless asked for
+_SKIPPED = { 'desc', 'template', 'notes' }
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            'Columnar exports require numpy, install it with "pip install numpy"'
+        )
+    return numpy
+
+def _fields(obj : Any) -> List[str]:
+    names = []
+    for cls in type(obj).__mro__:
+        names += getattr(cls, '__slots__', ())
+    names += getattr(obj, '__dict__', {}).keys()
+    return [ x for x in dict.fromkeys(names) if not x.startswith('_') ]
+
+def defaultColumns(
+    items : List[Any]
+) -> List[str]:
+    """
+    Returns the columns exported by default for a list of data objects, the
+    columns of every class in the list are combined
+
+    Parameters
+    ----------
+    items : `List[Any]`
+        The data objects to export
+
+    Returns
+    -------
+    columns : `List[str]`
+        The names of the fields to export
+    """
+    columns = {}
+    for cls, obj in { type(x): x for x in items }.items():
+        if cls.__name__ in COLUMNS:
+            columns.update(dict.fromkeys(COLUMNS[cls.__name__]))
+            continue
+        for field in _fields(obj):
+            if field in _SKIPPED:
+                continue
+            values = [ getattr(x, field, None) for x in items if type(x) is cls ]
+            if all(v is None or isinstance(v, (int, float, str)) for v in values):
+                columns[field] = None
+    columns = list(columns)
+    if 'name' in columns:
+        columns.remove('name')
+    return [ 'name' ] + columns
+
+def _dtype(values : List[Any]) -> Any:
+    """
+    Picks the column type for a list of field values, None is stored as NaN
+    in number columns and as '' in string columns
+    """
+    types = { type(v) for v in values }
+    nullable = type(None) in types
+    types.discard(type(None))
+    if types == { bool }:
+        return object if nullable else bool
+    if types <= { int }:
+        return 'f8' if nullable or not types else 'i8'
+    if types <= { int, float }:
+        return 'f8'
+    if types == { str }:
+        return f'U{max(len(v) for v in values if v is not None)}'
+    return object
+
+def toColumns(
+    items   : List[Any],
+    columns : List[str] = None
+) -> Any:
+    """
+    Converts a list of data objects into a NumPy structured array with one
+    field per column and one row per object
+
+    Parameters
+    ----------
+    items : `List[Any]`
+        The data objects to convert
+    columns : `List[str]`
+        The fields to export, if none are provided defaultColumns() is used.
+        Methods taking no arguments (i.e. 'damageType') can be exported too
+
+    Returns
+    -------
+    array : `numpy.ndarray`
+        The structured array, missing values are NaN (numbers) or '' (strings)
+    """
+    np = _numpy()
+    if columns is None:
+        columns = defaultColumns(items)
+    classes = { type(x) for x in items }
+    data = {}
+    for column in columns:
+        if any(callable(getattr(cls, column, None)) for cls in classes):
+            data[column] = [ getattr(x, column)() for x in items ]
+        else:
+            try:
+                data[column] = list(map(attrgetter(column), items))
+            except AttributeError:
+                data[column] = [ getattr(x, column, None) for x in items ]
+    dtype = [ (column, _dtype(data[column])) for column in columns ]
+    array = np.empty(len(items), dtype=dtype)
+    for column, kind in dtype:
+        if kind == 'f8':
+            array[column] = [ np.nan if v is None else v for v in data[column] ]
+        elif isinstance(kind, str) and kind.startswith('U'):
+            array[column] = [ '' if v is None else v for v in data[column] ]
+        else:
+            array[column] = data[column]
+    return array
+
+def _python(value : Any) -> Any:
+    """
+    Converts a value read from a column back to the plain python value stored
+    on a data object
+    """
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float):
+        if value != value: # NaN
+            return None
+        if value.is_integer():
+            return int(value)
+    if value == '':
+        return None
+    return value
+
+def fromColumns(
+    items : List[Any],
+    array : Any
+) -> int:
+    """
+    Writes the columns of a structured array back onto the data objects with
+    the same names, i.e. after recomputing a column with vectorized code
+
+    Parameters
+    ----------
+    items : `List[Any]`
+        The data objects to update
+    array : `numpy.ndarray`
+        A structured array with a 'name' column, every other column is
+        written to the field of the same name (computed columns are skipped)
+
+    Returns
+    -------
+    updated : `int`
+        How many objects were updated
+
+    Raises
+    ------
+    KeyError
+        If a row names no data object
+    ValueError
+        If a row names several data objects (i.e. in different collections),
+        so which one it belongs to is ambiguous
+    """
+    byName = {}
+    shared = set()
+    for x in items:
+        if x.name.lower() in byName:
+            shared.add(x.name.lower())
+        byName[x.name.lower()] = x
+    names = [ str(x).lower() for x in array['name'] ]
+    unknown = [ x for x in names if x not in byName ]
+    if unknown:
+        raise KeyError(f'No data objects named {", ".join(unknown)}')
+    ambiguous = sorted({ x for x in names if x in shared })
+    if ambiguous:
+        raise ValueError(
+            f'Several data objects are named {", ".join(ambiguous)}, rows '
+            'for them can\'t be matched to a single object'
+        )
+
+    # Columns computed by methods (i.e. 'damageType') can't be written back
+    classes = { type(x) for x in items }
+    columns = [
+        x for x in array.dtype.names
+        if x != 'name' and not any(
+            callable(getattr(cls, x, None)) for cls in classes
+        )
+    ]
+    for column in columns:
+        for name, value in zip(names, array[column].tolist()):
+            setattr(byName[name], column, _python(value))
+    return len(names)
@@ -0,0 +1,186 @@
+"""
+Class used to index the data objects stored under a key by one of their fields
+"""
+from __future__ import print_function, division
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Placeholder for objects without a given field
+MISSING = object()
+
+# Comparison operators usable in queries, i.e. cost__le=100
+OPERATORS : Dict[str, Callable[[Any, Any], bool]] = {
+    'eq': lambda value, target: value == target,
+    'ne': lambda value, target: value != target,
+    'lt': lambda value, target: value is not None and value < target,
+    'le': lambda value, target: value is not None and value <= target,
+    'gt': lambda value, target: value is not None and value > target,
+    'ge': lambda value, target: value is not None and value >= target,
+    'in': lambda value, target: value in target,
+    'contains': lambda value, target: value is not None and target in value,
+}
+
+def normalize(value : Any) -> Any:
+    """
+    Normalizes a value for comparison, strings are compared case-insensitively
+    (the same way item names are looked up)
+    """
+    if isinstance(value, str):
+        return value.lower()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return type(value)(normalize(x) for x in value)
+    return value
+
+def mismatch(
+    field  : str,
+    op     : str,
+    target : Any
+) -> ValueError:
+    """
+    Returns the error raised when a filter's target can't be compared with
+    the values of its field, i.e. cost__le='10'
+    """
+    return ValueError(
+        f'Cannot compare "{field}" values using "{op}" with {target!r} '
+        f'({type(target).__name__})'
+    )
+
+def fieldValue(
+    obj   : Any,
+    field : str
+) -> Any:
+    """
+    Returns the normalized value of a field on a data object. Fields can be
+    attributes or methods taking no arguments (i.e. LINASItem.damageType)
+
+    Parameters
+    ----------
+    obj : `Any`
+        The data object to read the field from
+    field : `str`
+        The name of the field
+
+    Returns
+    -------
+    value : `Any`
+        The normalized value, or MISSING if the object has no such field
+    """
+    value = getattr(obj, field, MISSING)
+    if value is MISSING:
+        return MISSING
+    if callable(value):
+        value = value()
+    return normalize(value)
+
+def parseFilter(
+    name : str
+) -> Tuple[str, str]:
+    """
+    Splits a query keyword into its field and operator, i.e. 'cost__le'
+    becomes ('cost', 'le') and 'stat' becomes ('stat', 'eq')
+    """
+    field, _, op = name.partition('__')
+    op = op or 'eq'
+    if op not in OPERATORS:
+        raise ValueError(
+            f'Unknown query operator "{op}" in "{name}", expected one of '
+            f'{", ".join(OPERATORS)}'
+        )
+    return field, op
+
+class DataIndex:
+    """
+    Class used to index the data objects stored under a key by one of their
+    fields. Equality lookups use a hash map and range lookups a sorted list,
+    so neither has to visit every object.
+
+    Parameters
+    ----------
+    items : `List[Any]`
+        The data objects to index
+    field : `str`
+        The field to index the objects by
+    """
+    def __init__(
+        self,
+        items : List[Any],
+        field : str
+    ) -> None:
+        self.field = field
+        self.__byValue : Dict[Any, List[Any]] = {}
+        ordered = []
+        for item in items:
+            value = fieldValue(item, field)
+            if value is MISSING:
+                continue
+            try:
+                self.__byValue.setdefault(value, []).append(item)
+            except TypeError:
+                # Unhashable values (i.e. lists of notes) can't be indexed
+                self.__byValue = None
+                break
+            if value is not None:
+                ordered.append((value, item))
+
+        # Only fields holding a single comparable type support range lookups
+        self.__keys : Optional[List[Any]] = None
+        self.__ordered : Optional[List[Any]] = None
+        if self.__byValue is not None:
+            try:
+                ordered.sort(key=lambda x: x[0])
+                self.__keys = [ x[0] for x in ordered ]
+                self.__ordered = [ x[1] for x in ordered ]
+            except TypeError:
+                pass
+
+    def supports(
+        self,
+        op : str
+    ) -> bool:
+        """
+        Returns if the index can answer a query using the given operator
+        """
+        if self.__byValue is None:
+            return False
+        if op in ('eq', 'in'):
+            return True
+        return op in ('lt', 'le', 'gt', 'ge') and self.__keys is not None
+
+    def lookup(
+        self,
+        op     : str,
+        target : Any
+    ) -> List[Any]:
+        """
+        Returns the objects whose field matches a filter
+
+        Parameters
+        ----------
+        op : `str`
+            The comparison operator, must be supported by the index
+        target : `Any`
+            The (normalized) value to compare against
+
+        Returns
+        -------
+        items : `List[Any]`
+            The matching data objects, in no particular order
+        """
+        if op == 'eq':
+            return self.__byValue.get(target, [])
+        if op == 'in':
+            # Repeated values would return the same objects more than once
+            return [
+                x for value in dict.fromkeys(target)
+                for x in self.__byValue.get(value, [])
+            ]
+        try:
+            if op == 'lt':
+                return self.__ordered[:bisect_left(self.__keys, target)]
+            if op == 'le':
+                return self.__ordered[:bisect_right(self.__keys, target)]
+            if op == 'gt':
+                return self.__ordered[bisect_right(self.__keys, target):]
+            return self.__ordered[bisect_left(self.__keys, target):]
+        except TypeError:
+            raise mismatch(self.field, op, target) from None
@@ -0,0 +1,341 @@
+"""
+Functions used to load data for a system from declarative data files
+"""
+from __future__ import print_function, division
+from obj_classes.data_manager import DataManager
+from obj_classes.data_collection import DataCollection
+from obj_classes.linas_abil import LINASAbility
+from obj_classes.linas_class import LINASClass, ItemRecord
+from obj_classes.linas_effect import LINASEffect
+from obj_classes.linas_entity import LinasEntity
+from obj_classes.linas_item import LINASItem
+from obj_classes.linas_lang import LINASLanguage
+from obj_classes.linas_race import LINASRace
+from obj_classes.linas_skill import LINASSkill
+from obj_classes.linas_stat import LINASStat
+from obj_classes.linas_technique import LinasTechnique
+from functools import partial
+from typing import Any, Dict, Iterator, List, Tuple
+import glob
+import json
+import os
+
+try:
+    import tomllib
+except ImportError: # Python < 3.11, TOML files are unsupported
+    tomllib = None
+
+# Data classes which can be named by an entry's "kind"
+TYPES = {
+    'ability': LINASAbility,
+    'class': LINASClass,
+    'effect': LINASEffect,
+    'entity': LinasEntity,
+    'item': LINASItem,
+    'language': LINASLanguage,
+    'race': LINASRace,
+    'skill': LINASSkill,
+    'stat': LINASStat,
+    'technique': LinasTechnique,
+}
+
+# Kinds whose constructors take the data manager to look up other keys
+_NEEDS_DATA = { 'class', 'race' }
+
+# Nested fields holding data objects, by kind
+_NESTED = {
+    'entity': {
+        'weapon': 'item',
+        'armor': 'item',
+        'abilities': 'ability',
+        'items': 'item',
+        'techniques': 'technique',
+    },
+}
+
+# Name of the file holding templates shared by every key in a directory
+TEMPLATES = 'templates'
+
+# Supported data file extensions
+EXTENSIONS = [ '.json', '.toml' ]
+
+# Extension of files holding one JSON entry per line
+JSONL = '.jsonl'
+
+def readDataFile(
+    path : str
+) -> Dict[str, Any]:
+    """
+    Reads a JSON or TOML data file
+
+    Parameters
+    ----------
+    path : `str`
+        Location of the file to read
+
+    Returns
+    -------
+    contents : `Dict[str, Any]`
+        The parsed contents of the file
+    """
+    if path.endswith('.toml'):
+        if tomllib is None:
+            raise RuntimeError(f'Reading "{path}" requires Python 3.11+ (tomllib)')
+        with open(path, 'rb') as fin:
+            return tomllib.load(fin)
+    with open(path, 'r', encoding='utf-8') as fin:
+        return json.load(fin)
+
+def _hydrate(
+    entry     : Dict[str, Any],
+    kind      : str,
+    templates : Dict[str, List[Dict[str, str]]],
+    data      : DataManager
+) -> Any:
+    """
+    Creates the data object described by a single entry
+    """
+    entry = dict(entry)
+    kind = entry.pop('kind', kind)
+    if kind == 'collection':
+        return DataCollection(
+            name=entry['name'],
+            description=entry['description'],
+            children=[
+                _hydrate(x, entry.get('children_kind'), templates, data)
+                for x in entry.get('children', [])
+            ]
+        )
+    if kind not in TYPES:
+        raise ValueError(f'Unknown data kind "{kind}" for "{entry.get("name")}"')
+
+    # Templates can be named instead of written out
+    if isinstance(entry.get('template'), str):
+        entry['template'] = templates[entry['template']]
+
+    # JSON has no tuples, convert the fields which are looked up as tuples
+    if kind == 'race':
+        entry['stats'] = [ tuple(x) for x in entry.get('stats', []) ]
+        entry['abilities'] = [ tuple(x) for x in entry.get('abilities', []) ]
+    elif kind == 'class':
+        entry['skills'] = [ tuple(x) for x in entry.get('skills', []) ]
+        entry['items'] = [
+            ItemRecord(item=tuple(x['item']), qty=x['qty'])
+            for x in entry.get('items', [])
+        ]
+    for field, nestedKind in _NESTED.get(kind, {}).items():
+        value = entry.get(field)
+        if isinstance(value, dict):
+            entry[field] = _hydrate(value, nestedKind, templates, data)
+        elif isinstance(value, list):
+            entry[field] = [
+                _hydrate(x, nestedKind, templates, data)
+                if isinstance(x, dict) else x
+                for x in value
+            ]
+    if kind in _NEEDS_DATA:
+        entry['data'] = data
+    return TYPES[kind](**entry)
+
+def loadEntry(
+    entry     : Dict[str, Any],
+    kind      : str,
+    templates : Dict[str, List[Dict[str, str]]] = {},
+    data      : DataManager = None
+) -> Any:
+    """
+    Creates the data object described by a single entry, i.e. an entity
+    read from its own JSON file. Nested data objects (e.g. an entity's
+    weapon and abilities) are created as well.
+
+    Parameters
+    ----------
+    entry : `Dict[str, Any]`
+        The keyword arguments for the kind's constructor, plus an optional
+        "kind" overriding the one passed in
+    kind : `str`
+        The kind of data object the entry describes, e.g. "entity"
+    templates : `Dict[str, List[Dict[str, str]]]`
+        Templates the entry can refer to by name
+    data : `DataManager`
+        The data manager used by kinds which look up other data (races and
+        classes)
+
+    Returns
+    -------
+    obj : `Any`
+        The data object
+    """
+    return _hydrate(entry, kind, templates, data)
+
+def iterEntries(
+    patterns : List[str]
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Yields the raw entries stored in a set of files without creating any data
+    objects. Each pattern can be a file, a directory (every .json and .jsonl
+    file in it) or a glob. JSON files can hold a single entry or a list of
+    entries, JSONL files hold one entry per line.
+
+    Parameters
+    ----------
+    patterns : `List[str]`
+        The files, directories and globs to read
+
+    Yields
+    ------
+    entry : `Tuple[str, Any]`
+        Where the entry came from (file, and line or index where needed) and
+        the entry itself. Entries which fail to parse are yielded as the
+        ValueError raised instead, and files which can't be read as the
+        OSError raised.
+    """
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files = [
+                os.path.join(pattern, x) for x in sorted(os.listdir(pattern))
+                if os.path.splitext(x)[1].lower() in ( '.json', JSONL )
+            ]
+        elif any(x in pattern for x in '*?['):
+            files = sorted(glob.glob(pattern, recursive=True))
+        else:
+            files = [ pattern ]
+        for file in files:
+            if file.lower().endswith(JSONL):
+                try:
+                    with open(file, 'r', encoding='utf-8') as fin:
+                        for i, line in enumerate(fin, 1):
+                            if not line.strip():
+                                continue
+                            try:
+                                entry = json.loads(line)
+                            except ValueError as e:
+                                entry = e
+                            yield f'{file}:{i}', entry
+                except OSError as e:
+                    yield file, e
+                continue
+            try:
+                contents = readDataFile(file)
+            except (OSError, ValueError) as e:
+                yield file, e
+                continue
+            if isinstance(contents, list):
+                for i, entry in enumerate(contents):
+                    yield f'{file}[{i}]', entry
+            else:
+                yield file, contents
+
+def loadEntries(
+    patterns : List[str],
+    kind     : str
+) -> Tuple[List[Any], List[Tuple[str, str]]]:
+    """
+    Creates the data objects for every entry in a set of files (see
+    iterEntries), e.g. a directory of entities. Entries are validated by
+    creating their objects, any which fail are skipped and reported.
+
+    Parameters
+    ----------
+    patterns : `List[str]`
+        The files, directories and globs to read
+    kind : `str`
+        The kind of data object the entries describe, e.g. "entity"
+
+    Returns
+    -------
+    loaded : `Tuple[List[Any], List[Tuple[str, str]]]`
+        The data objects in the order they were read, and where each entry
+        which failed came from along with the reason it failed
+    """
+    objs, errors = [], []
+    for source, entry in iterEntries(patterns):
+        if isinstance(entry, OSError):
+            errors.append((source, f'Could not read file: {entry.strerror or entry}'))
+        elif isinstance(entry, Exception):
+            errors.append((source, f'Invalid JSON: {entry}'))
+        elif not isinstance(entry, dict):
+            errors.append((source, 'Expected an object'))
+        else:
+            try:
+                objs.append(loadEntry(entry, kind))
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                errors.append((source, f'{type(e).__name__}: {e}'))
+    return objs, errors
+
+def loadKeyFile(
+    path      : str,
+    data      : DataManager,
+    templates : Dict[str, List[Dict[str, str]]] = {}
+) -> List[Any]:
+    """
+    Loads the data objects defined in a single data file. A data file holds
+    an object with the default "kind" of its entries (e.g. "item"),
+    (optionally) named "templates" and the "entries" themselves. Each entry
+    is the keyword arguments for its kind's constructor, plus an optional
+    "kind" overriding the default. Entries of kind "collection" take a
+    "name", "description", "children" and the "children_kind" of the
+    children.
+
+    Parameters
+    ----------
+    path : `str`
+        Location of the data file
+    data : `DataManager`
+        The data manager the key is loaded into, used by kinds which look up
+        other data (races and classes)
+    templates : `Dict[str, List[Dict[str, str]]]`
+        Templates entries can refer to by name, templates defined in the file
+        take precedence
+
+    Returns
+    -------
+    items : `List[Any]`
+        The data objects defined in the file
+    """
+    contents = readDataFile(path)
+    templates = { **templates, **contents.get('templates', {}) }
+    kind = contents.get('kind')
+    return [
+        _hydrate(entry, kind, templates, data)
+        for entry in contents.get('entries', [])
+    ]
+
+def fromDirectory(
+    path : str,
+    data : DataManager = None
+) -> DataManager:
+    """
+    Adds every data file in a directory to a data manager as a lazily loaded
+    key named after the file, i.e. techniques.json becomes 'techniques' and is
+    only parsed the first time 'techniques' is accessed. A file named
+    templates.json (or .toml) holds templates shared by every key.
+
+    Parameters
+    ----------
+    path : `str`
+        The directory holding the data files
+    data : `DataManager`
+        The data manager to add the keys to, if none is provided a new one is
+        created
+
+    Returns
+    -------
+    data : `DataManager`
+        The data manager the keys were added to
+    """
+    if data is None:
+        data = DataManager({})
+    templates = {}
+    files = {}
+    for file in sorted(os.listdir(path)):
+        key, ext = os.path.splitext(file)
+        if ext.lower() not in EXTENSIONS:
+            continue
+        if key.lower() == TEMPLATES:
+            templates.update(readDataFile(os.path.join(path, file)))
+        else:
+            files[key] = os.path.join(path, file)
+    for key, file in files.items():
+        data.addLazyKey(key, partial(loadKeyFile, file, data, templates))
+    return data
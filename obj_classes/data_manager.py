@@ -2,14 +2,30 @@
 Class used to manage storing and retrieving data for a given system
 """
 from __future__ import print_function, division
-from typing import Dict, List, Any
-import copy
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Any, Iterator, Set, Tuple
 
 from obj_classes.data_collection import DataCollection
+from obj_classes.data_index import DataIndex, fieldValue, mismatch, normalize, parseFilter, MISSING, OPERATORS
+from obj_classes import data_columns
+from utils.fingerprint import fingerprint
+from utils.profiler import profiler
+from utils.templates import expandTemplate
 class DataManager:
+    # Fields indexed by default, see query()
+    DEFAULT_INDEXES = [
+        'linkedSkill',
+        'stat',
+        'cost',
+        'damageType',
+        'skill',
+        'points',
+    ]
+
     def __init__(
         self,
-        data : Dict[str, List[Any]]
+        data    : Dict[str, List[Any]],
+        indexes : List[str] = DEFAULT_INDEXES
     )-> None:
         """
         Class used to manage storing and retrieving data for a given system
@@ -19,26 +35,122 @@ class DataManager:
         data : `Dict[str, List[Any]]`
             A list of section objects defining the various data parameters for
             the system
+        indexes : `List[str]`
+            Fields to keep secondary indexes on for query(), indexes are built
+            per key the first time they are used
         """
         self.__dataMap = {}
+
+        # Fields to index and the indexes built so far, by (key, field)
+        self.__indexFields : Set[str] = set(indexes)
+        self.__indexes : Dict[Tuple[str, str], DataIndex] = {}
+        self.__flat : Dict[str, List[Any]] = {}
+
+        # Functions loading keys which haven't been accessed yet
+        self.__loaders : Dict[str, Callable[[], List[Any]]] = {}
+
+        # Keys read while a track() block is open, None when not tracking
+        self.__reads = None
         for key in data:
-            self.__dataMap[key.lower()] = {}
-            for item in data[key]:
-                if isinstance(item, DataCollection) or item.template == None:
-                    self.__dataMap[key.lower()][item.name.lower()] = item
-                else:
-                    for element in item.template:
-                        it = copy.deepcopy(item)
-                        it.name = it.name.format(**element)
-                        it.desc = it.desc(**element)
-                        self.__dataMap[key.lower()][it.name.lower()] = copy.deepcopy(it)
+            with profiler.span(f'key {key.lower()}', 'data'):
+                self.__dataMap[key.lower()] = {}
+                for item in data[key]:
+                    for it in expandTemplate(item):
+                        self.__dataMap[key.lower()][it.name.lower()] = it
 
     
+    def __read(self, section : str) -> None:
+        if self.__reads is not None:
+            self.__reads.add(section.lower())
+
+    def __key(self, section : str) -> Dict[str, Any]:
+        """
+        Returns the items stored under a key, loading the key first if it was
+        added lazily and hasn't been accessed yet
+        """
+        sectionL = section.lower()
+        if sectionL in self.__loaders:
+            with profiler.span(f'key {sectionL}', 'data'):
+                self.addKey(sectionL, self.__loaders.pop(sectionL)())
+        return self.__dataMap.get(sectionL)
+
+    @contextmanager
+    def track(self) -> Iterator[Set[str]]:
+        """
+        Records which keys are read while the block is open, used to work out
+        which data a section depends on
+
+        Yields
+        ------
+        reads : `Set[str]`
+            The set of keys read, filled in as the block runs
+        """
+        outer = self.__reads
+        reads = set()
+        self.__reads = reads
+        try:
+            yield reads
+        finally:
+            self.__reads = outer
+            if outer is not None:
+                outer.update(reads)
+
+    def keyFingerprint(
+        self,
+        section : str
+    ) -> str:
+        """
+        Returns a hash of all the data stored under a key, the hash only
+        changes when an item under the key changes
+
+        Parameters
+        ----------
+        section : `str`
+            The key to hash
+
+        Returns
+        -------
+        digest : `str`
+            A hex digest of the key's data
+        """
+        return fingerprint(self.__key(section) or {})
+
     def addKey(self, keyName : str, keyData : List[Any]):
+        self.__loaders.pop(keyName.lower(), None)
+        self.__dropIndexes(keyName)
         self.__dataMap[keyName.lower()] = {}
         for item in keyData:
-            self.__dataMap[keyName.lower()][item.name.lower()] = item
+            for it in expandTemplate(item):
+                self.__dataMap[keyName.lower()][it.name.lower()] = it
     
+    def addLazyKey(
+        self,
+        keyName : str,
+        loader  : Callable[[], List[Any]]
+    ) -> None:
+        """
+        Adds a key whose data is only loaded the first time the key is
+        accessed, e.g. a key defined in a data file
+
+        Parameters
+        ----------
+        keyName : `str`
+            The name of the key
+        loader : `Callable[[], List[Any]]`
+            A function returning the data objects for the key, templates are
+            expanded the same way as for addKey
+        """
+        self.__dataMap.pop(keyName.lower(), None)
+        self.__dropIndexes(keyName)
+        self.__loaders[keyName.lower()] = loader
+
+    def getKeys(self) -> List[str]:
+        """
+        Returns the names of every key in the data manager, including keys
+        which haven't been loaded yet
+        """
+        return sorted(set(self.__dataMap) | set(self.__loaders))
+
     def getItem(
         self,
         section : str,
@@ -59,15 +171,223 @@ class DataManager:
         item : `Any`
             The retrieved item if it was found; or None if it was not found
         """
-        if section.lower() in self.__dataMap:
-            if itemName.lower() in self.__dataMap[section.lower()]:
-                return self.__dataMap[
-                    section.lower()
-                ][
-                    itemName.lower()
-                ]
+        self.__read(section)
+        items = self.__key(section)
+        if items is not None:
+            if itemName.lower() in items:
+                return items[itemName.lower()]
         return None
 
+    def __dropIndexes(self, section : str) -> None:
+        self.__flat.pop(section.lower(), None)
+        for indexKey in [ x for x in self.__indexes if x[0] == section.lower() ]:
+            del self.__indexes[indexKey]
+
+    def __flatten(self, section : str) -> List[Any]:
+        """
+        Returns every data object under a key, with collections replaced by
+        their children
+        """
+        sectionL = section.lower()
+        if sectionL not in self.__flat:
+            flat = []
+            for item in (self.__key(section) or {}).values():
+                if isinstance(item, DataCollection):
+                    flat += item.getChildren()
+                else:
+                    flat.append(item)
+            self.__flat[sectionL] = flat
+        return self.__flat[sectionL]
+
+    def addIndex(
+        self,
+        field : str
+    ) -> None:
+        """
+        Adds a secondary index on a field, used by query() for every key
+
+        Parameters
+        ----------
+        field : `str`
+            The name of the field (attribute or method taking no arguments)
+            to index, i.e. 'linkedSkill' or 'damageType'
+        """
+        self.__indexFields.add(field)
+
+    def query(
+        self,
+        section : str,
+        **filters
+    ) -> List[Any]:
+        """
+        Finds the data objects under a key matching every given filter. Items
+        inside collections are searched as well. Filters are written as
+        field=value or field__op=value, where op is one of eq, ne, lt, le, gt,
+        ge, in or contains, i.e.
+
+            data.query('items', stat='dex', speedPenalty__le=1)
+            data.query('techniques', skill='fire')
+
+        Strings are compared case-insensitively. Indexed fields (see
+        DEFAULT_INDEXES and addIndex) are answered from the index, anything
+        else is checked object by object. Indexes assume objects aren't
+        modified once added, they are rebuilt whenever a key is replaced.
+
+        Parameters
+        ----------
+        section : `str`
+            The key to search
+        filters : `Dict[str, Any]`
+            The filters to apply
+
+        Returns
+        -------
+        items : `List[Any]`
+            The matching data objects, sorted by name
+
+        Raises
+        ------
+        ValueError
+            If an operator is unknown, or a target can't be compared with
+            its field's values (i.e. cost__le='10' or cost__in=10)
+        """
+        self.__read(section)
+        sectionL = section.lower()
+        parsed = [
+            (field, op, normalize(target))
+            for (field, op), target in (
+                (parseFilter(name), target) for name, target in filters.items()
+            )
+        ]
+        for field, op, target in parsed:
+            if op == 'in' and not isinstance(target, (list, tuple, set, frozenset)):
+                raise mismatch(field, op, target)
+
+        # Start from the smallest set of objects an index can give, then check
+        # the remaining filters against those objects only
+        items = None
+        remaining = []
+        for field, op, target in parsed:
+            index = None
+            if field in self.__indexFields:
+                indexKey = (sectionL, field)
+                if indexKey not in self.__indexes:
+                    self.__indexes[indexKey] = DataIndex(
+                        self.__flatten(section),
+                        field
+                    )
+                index = self.__indexes[indexKey]
+            if index is not None and index.supports(op):
+                found = index.lookup(op, target)
+                if items is None or len(found) < len(items):
+                    if items is not None:
+                        remaining.append(best)
+                    items = found
+                    best = (field, op, OPERATORS[op], target)
+                    continue
+            remaining.append((field, op, OPERATORS[op], target))
+        if items is None:
+            items = self.__flatten(section)
+
+        matches = []
+        for item in items:
+            for field, op, compare, target in remaining:
+                value = fieldValue(item, field)
+                if value is MISSING:
+                    break
+                try:
+                    if not compare(value, target):
+                        break
+                except TypeError:
+                    raise mismatch(field, op, target) from None
+            else:
+                matches.append(item)
+        matches.sort(key=lambda x: x.name.lower())
+        return matches
+
+    def toColumns(
+        self,
+        section : str,
+        columns : List[str] = None
+    ) -> Any:
+        """
+        Exports the data objects under a key (including the children of any
+        collections) as a NumPy structured array, one row per object. Requires
+        numpy.
+
+        Parameters
+        ----------
+        section : `str`
+            The key to export
+        columns : `List[str]`
+            The fields to export, if none are provided the defaults for the
+            key's data classes are used (see data_columns.COLUMNS)
+
+        Returns
+        -------
+        array : `numpy.ndarray`
+            The structured array, missing values are NaN (numbers) or ''
+            (strings)
+        """
+        self.__read(section)
+        return data_columns.toColumns(self.__flatten(section), columns)
+
+    def fromColumns(
+        self,
+        section : str,
+        array   : Any
+    ) -> int:
+        """
+        Writes the columns of a structured array (i.e. one made by toColumns()
+        and recomputed with vectorized code) back onto the data objects under
+        a key, matching rows to objects by name
+
+        Parameters
+        ----------
+        section : `str`
+            The key to update
+        array : `numpy.ndarray`
+            A structured array with a 'name' column
+
+        Returns
+        -------
+        updated : `int`
+            How many objects were updated
+
+        Raises
+        ------
+        KeyError
+            If a row names no data object under the key
+        ValueError
+            If a row names several data objects under the key
+        """
+        updated = data_columns.fromColumns(self.__flatten(section), array)
+        self.__dropIndexes(section)
+        return updated
+
+    def iterHTML(
+        self,
+        section : str
+    ) -> Iterator[str]:
+        """
+        Yields the data for a given section as HTML tags, one tag at a time
+
+        Parameters
+        ----------
+        section : `str`
+            The section to convert to HTML
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
+        self.__read(section)
+        items = self.__key(section)
+        if items is not None:
+            for key in sorted(items):
+                yield from items[key].iterHTML()
+
     def typeToHTMLList(
         self,
         section : str
@@ -85,10 +405,4 @@ class DataManager:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        html = []
-        sectionL = section.lower()
-        if sectionL in self.__dataMap:
-            for key in sorted(self.__dataMap[sectionL]):
-                item= self.__dataMap[sectionL][key]
-                html += [ f'{x}' for x in item.toHTMLList() ]
-        return html
\ No newline at end of file
+        return list(self.iterHTML(section))
\ No newline at end of file
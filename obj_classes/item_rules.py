@@ -0,0 +1,262 @@
+"""
+Class used to hold the formulas for an item's max points, protection and
+damage
+"""
+from __future__ import print_function, division
+from typing import Any
+
+def _atMost(value : Any, high : Any) -> Any:
+    # Works the same on plain numbers and NumPy arrays
+    return value + (high - value) * (value > high)
+
+class ItemRules:
+    """
+    Class used to hold the formulas for an item's max points, protection and
+    damage. Every formula works on single values (as used by LINASItem) and
+    on NumPy arrays, so a whole item catalog can be re-validated in a single
+    vectorized pass. Missing values are passed in as 0 and flags as 0/1.
+
+    Parameters
+    ----------
+    basePoints : `int`
+        Max points equipment starts with
+    equipmentPerPoint : `int`
+        Damage/protection per point removed (rounded down)
+    magicPoints : `int`
+        Points removed if the item does magic damage
+    enchantedPoints : `int`
+        Points removed if the item is enchanted
+    speedPenaltyPerPoint : `int`
+        Speed penalty per point added back (rounded down)
+    maxPoints : `int`
+        The most max points an item can have
+    """
+    # Fields read from each object by evaluate()
+    COLUMNS = [
+        'name',
+        'p_damage',
+        'm_damage',
+        'p_protection',
+        'm_protection',
+        'speedPenalty',
+        'enchanted',
+        'artifact',
+        'points',
+    ]
+
+    def __init__(
+        self,
+        basePoints           : int = 5,
+        equipmentPerPoint    : int = 2,
+        magicPoints          : int = 1,
+        enchantedPoints      : int = 2,
+        speedPenaltyPerPoint : int = 2,
+        maxPoints            : int = 5
+    ) -> None:
+        self.basePoints           = basePoints
+        self.equipmentPerPoint    = equipmentPerPoint
+        self.magicPoints          = magicPoints
+        self.enchantedPoints      = enchantedPoints
+        self.speedPenaltyPerPoint = speedPenaltyPerPoint
+        self.maxPoints            = maxPoints
+
+    def damage(
+        self,
+        p_damage : Any,
+        m_damage : Any
+    ) -> Any:
+        """
+        Computes the damage of one item (or many), physical damage wins over
+        magical damage
+        """
+        return p_damage + (p_damage == 0) * m_damage
+
+    def protection(
+        self,
+        p_protection : Any,
+        m_protection : Any
+    ) -> Any:
+        """
+        Computes the protection of one item (or many), physical and magical
+        protection add up
+        """
+        return p_protection + m_protection
+
+    def equipment(
+        self,
+        p_damage     : Any,
+        m_damage     : Any,
+        p_protection : Any,
+        m_protection : Any
+    ) -> Any:
+        """
+        Computes the equipment value (protection, or damage for items without
+        protection) of one item (or many), 0 for items which aren't equipment
+        """
+        protection = self.protection(p_protection, m_protection)
+        return protection + (protection == 0) * self.damage(p_damage, m_damage)
+
+    def points(
+        self,
+        equipment    : Any,
+        m_damage     : Any,
+        speedPenalty : Any,
+        enchanted    : Any,
+        artifact     : Any
+    ) -> Any:
+        """
+        Computes the max points of one item (or many), artifacts and items
+        which aren't equipment have 0 points
+
+        Returns
+        -------
+        points : `Any`
+            The max point(s)
+        """
+        points = self.basePoints - equipment // self.equipmentPerPoint
+        points = points - (m_damage != 0) * self.magicPoints
+        points = points - enchanted * self.enchantedPoints
+        points = points + speedPenalty // self.speedPenaltyPerPoint
+        points = points * (1 - artifact) * (equipment != 0)
+        return _atMost(points, self.maxPoints)
+
+    def compute(
+        self,
+        data    : Any,
+        section : str = 'items'
+    ) -> Any:
+        """
+        Computes the damage, damage type, protection and max points of every
+        item under a key (including items in collections) in one vectorized
+        pass. Requires numpy.
+
+        Parameters
+        ----------
+        data : `DataManager`
+            The data holding the items
+        section : `str`
+            The key holding the items
+
+        Returns
+        -------
+        array : `numpy.ndarray`
+            A structured array with each item's name, damage, damageType,
+            protection, current points and the points under these rules
+            (rulePoints)
+        """
+        return self.evaluate(data.toColumns(section, self.COLUMNS))
+
+    def evaluate(
+        self,
+        columns : Any
+    ) -> Any:
+        """
+        Same as compute() but on columns already exported with
+        data.toColumns(section, ItemRules.COLUMNS), so several sets of
+        rules can be tried against one export without reading every object
+        again
+
+        Parameters
+        ----------
+        columns : `numpy.ndarray`
+            The exported columns
+
+        Returns
+        -------
+        array : `numpy.ndarray`
+            See compute()
+        """
+        import numpy as np
+        number = lambda name: np.nan_to_num(
+            columns[name].astype(np.float64)
+        ).astype(np.int64)
+        p_damage = number('p_damage')
+        m_damage = number('m_damage')
+        p_protection = number('p_protection')
+        m_protection = number('m_protection')
+        equipment = self.equipment(p_damage, m_damage, p_protection, m_protection)
+
+        result = np.empty(
+            len(columns),
+            dtype=[
+                ('name', columns.dtype['name']),
+                ('damage', np.int64),
+                ('damageType', 'U4'),
+                ('protection', np.int64),
+                ('points', np.int64),
+                ('rulePoints', np.int64),
+            ]
+        )
+        result['name'] = columns['name']
+        result['damage'] = self.damage(p_damage, m_damage)
+        result['damageType'] = np.where(m_damage != 0, 'MAG', 'PHYS')
+        result['protection'] = self.protection(p_protection, m_protection)
+        result['points'] = columns['points']
+        result['rulePoints'] = self.points(
+            equipment,
+            m_damage,
+            number('speedPenalty'),
+            number('enchanted'),
+            number('artifact')
+        )
+        return result
+
+    def diff(
+        self,
+        data    : Any,
+        section : str = 'items'
+    ) -> Any:
+        """
+        Returns the items whose max points differ from what these rules give,
+        i.e. items with hand-set points
+
+        Parameters
+        ----------
+        data : `DataManager`
+            The data holding the items
+        section : `str`
+            The key holding the items
+
+        Returns
+        -------
+        array : `numpy.ndarray`
+            The rows of compute() where points != rulePoints
+        """
+        result = self.compute(data, section)
+        return result[result['points'] != result['rulePoints']]
+
+    def apply(
+        self,
+        data    : Any,
+        section : str = 'items'
+    ) -> int:
+        """
+        Re-applies these rules to every item under a key, overwriting their
+        max points
+
+        Parameters
+        ----------
+        data : `DataManager`
+            The data holding the items
+        section : `str`
+            The key holding the items
+
+        Returns
+        -------
+        changed : `int`
+            How many items had their points changed
+        """
+        import numpy as np
+        result = self.compute(data, section)
+        changed = int(np.count_nonzero(result['points'] != result['rulePoints']))
+        updated = np.empty(
+            len(result),
+            dtype=[ ('name', result.dtype['name']), ('points', np.int64) ]
+        )
+        updated['name'] = result['name']
+        updated['points'] = result['rulePoints']
+        data.fromColumns(section, updated)
+        return changed
+
+# Rules used for items which don't set their own points
+RULES = ItemRules()
@@ -2,10 +2,13 @@
 Class used to hold and modify data for LINAS' skills
 """
 from __future__ import print_function, division
-from typing import List, Dict
+from typing import List, Dict, Iterator
 import re
 
 class LINASAbility:
+    __slots__ = (
+        'name', 'type', 'desc', 'template',
+    )
     def __init__(
         self,
         name : str,
@@ -33,19 +36,19 @@ class LINASAbility:
         self.desc = re.sub(r'[\ \n]+', ' ', description)
         self.template = template
     
-    def toHTMLList(
+    def iterHTML(
         self
-    ) -> List[str]:
+    ) -> Iterator[str]:
         """
-        Returns contents of class as a formatted HTML block
+        Yields contents of class as a formatted HTML block, one tag at a time
 
-        Returns
-        -------
-        html_tags : `List[str]`
-            A list of strings representing the contained HTML
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
         """
         indent = "&emsp;"*3
-        return [
+        yield from [
                 f'<div class="container">',
                 f'    <div class="{self.type}-abil-title cont-inner">',
                 f'        <strong>{self.name}</strong>',
@@ -55,3 +58,16 @@ class LINASAbility:
                 f'    </div>',
                 f'</div>'
             ]
+
+    def toHTMLList(
+        self
+    ) -> List[str]:
+        """
+        Returns contents of class as a formatted HTML block
+
+        Returns
+        -------
+        html_tags : `List[str]`
+            A list of strings representing the contained HTML
+        """
+        return list(self.iterHTML())
@@ -2,7 +2,7 @@
 Class used to hold and modify data for LINAS' classes
 """
 from __future__ import print_function, division
-from typing import Any, List, Tuple, Dict
+from typing import Any, List, Tuple, Dict, Iterator
 from obj_classes.data_manager import DataManager
 from obj_classes.data_collection import DataCollection
 from obj_classes.linas_item import LINASItem
@@ -23,6 +23,9 @@ class ItemRecord:
     qty : `int`
         The number (quantity) of items to give 
     """
+    __slots__ = (
+        'item', 'qty',
+    )
     def __init__(
         self,
         item : Any,
@@ -32,6 +35,9 @@ class ItemRecord:
         self.qty = qty
 
 class LINASClass:
+    __slots__ = (
+        'name', 'desc', 'skills', 'items', 'image', 'template', 'notes',
+    )
     def __init__(
         self,
         name        : str,
@@ -92,18 +98,18 @@ class LINASClass:
                 expandedItems.append((foundItem, record.qty))
         self.items = expandedItems
 
-    def toHTMLList(
+    def iterHTML(
         self
-    ) -> List[str]:
+    ) -> Iterator[str]:
         """
-        Returns contents of class as a formatted HTML block
+        Yields contents of class as a formatted HTML block, one tag at a time
 
-        Returns
-        -------
-        html_tags : `List[str]`
-            A list of strings representing the contained HTML
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
         """
-        html = [
+        yield from [
             f'<div style="page-break-before: always;"></div>',
             f'<div class="container pop">',
             f'    <div class="cont-title">',
@@ -122,8 +128,8 @@ class LINASClass:
         for skill in self.skills:
             skillName, skillValue = skill
             skillValue = f'+{skillValue}' if skillValue >= 0 else skillValue
-            html.append(f'            <li>{skillName.title()}: {skillValue}</li>')
-        html+= [
+            yield f'            <li>{skillName.title()}: {skillValue}</li>'
+        yield from [
             f'        </ul>',
             f'    </div>',
             f'    <div class="cont-sub-title cont-inner">',
@@ -132,24 +138,36 @@ class LINASClass:
             f'    <div class="cont-inner" style="font-size:11pt;">'
         ]
         for item, qty in self.items:
-            it = copy.deepcopy(item)
+            it = copy.copy(item)
             it.cost = qty
-            html += [ 
+            yield from (
                 x.replace("Cost:","Qty:")
-                for x in it.toHTMLList() 
-            ]
+                for x in it.iterHTML()
+            )
             break
-        html += [
+        yield from [
             f'    </div>',
             f'</div>'
         ]
         if len(self.notes):
-            html += [
+            yield from [
                 f'<strong><u>Notes: </u></strong>',
                 f'<ul>'
             ]
             for note in self.notes:
                 note = re.sub(r'[\ \n]+',' ', note)
-                html.append(f"    <li>{note}</li>")
-            html.append('</ul>')
-        return html
\ No newline at end of file
+                yield f"    <li>{note}</li>"
+            yield '</ul>'
+
+    def toHTMLList(
+        self
+    ) -> List[str]:
+        """
+        Returns contents of class as a formatted HTML block
+
+        Returns
+        -------
+        html_tags : `List[str]`
+            A list of strings representing the contained HTML
+        """
+        return list(self.iterHTML())
\ No newline at end of file
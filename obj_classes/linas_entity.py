@@ -2,7 +2,7 @@
 Class used to hold and modify data for LINAS' entities
 """
 from __future__ import print_function, division
-from typing import List, Dict
+from typing import List, Dict, Iterator
 from utils.assets import AssetManager
 from obj_classes.linas_stat      import LINASStat
 from obj_classes.linas_skill     import LINASSkill
@@ -12,6 +12,12 @@ from obj_classes.linas_item      import LINASItem
 import re
 
 class LinasEntity:
+    __slots__ = (
+        'name', 'desc', 'weapon', 'armor', 'skills', 'abilities', 'image',
+        'techniques', 'items', 'dualWield', 'shield', 'adj_spd', 'damage',
+        'p_defense', 'm_defense', 'hp', 'tp', 'str', 'dex', 'int', 'end',
+        'spr', 'spd',
+    )
     __am = AssetManager()
     __image_style='style="height:16px; width:autopx;"'
 
@@ -228,18 +234,18 @@ class LinasEntity:
         html.append('    </div>')
         return html
 
-    def toHTMLList(
+    def iterHTML(
         self
-    ) -> List[str]:
+    ) -> Iterator[str]:
         """
-        Returns contents of class as a formatted HTML block
+        Yields contents of class as a formatted HTML block, one tag at a time
 
-        Returns
-        -------
-        html_tags : `List[str]`
-            A list of strings representing the contained HTML
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
         """
-        html = [
+        yield from [
             f'<div style="page-break-before: always;"></div>',
             f'<div class="container pop">',
             f'    <div class="cont-title">',
@@ -250,11 +256,86 @@ class LinasEntity:
             f'        {self.desc}',
             f'    </div>',
         ] 
-        html += self.__stats_block()
-        html += self.__skills_block()
-        html += self.__abilities_block()
-        html += self.__equipment_block()
-        html += self.__items_block()
-        html.append('</div>')
-        return html
-        
\ No newline at end of file
+        yield from self.__stats_block()
+        yield from self.__skills_block()
+        yield from self.__abilities_block()
+        yield from self.__equipment_block()
+        yield from self.__items_block()
+        yield '</div>'
+
+    def iterCardHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a compact stat block card (see
+        CardSheet), one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
+        am = LinasEntity.__am
+        stats = [
+            ('hp', self.hp), ('tp', self.tp), ('spd', self.spd),
+            ('str', self.str), ('int', self.int), ('dex', self.dex),
+            ('end', self.end), ('spr', self.spr),
+        ]
+        derived = [
+            (f'&#8645;{am.tag("spd")}', self.adj_spd),
+            (f'&#8645;{am.tag("patk")}', self.damage),
+            (f'&#8645;{am.tag("pdef")}', self.p_defense),
+            (f'&#8645;{am.tag("mdef")}', self.m_defense),
+        ]
+        skills = ', '.join(
+            f'{x.title()}: {self.skills[x]}' for x in self.skills.keys()
+        )
+        items = ', '.join(f'{x.name} x{x.uses}' for x in self.items)
+        yield from [
+            '<div class="container" style="height: 100%; margin: 0px; box-sizing: border-box; font-size: 85%;">',
+            '    <div class="cont-title">',
+            f'        <strong>{self.name}</strong>',
+            '    </div>',
+            '    <div class="cont-inner">',
+        ]
+        yield from (
+            f'        <span class="rel" style="width: 9%;">{am.tag(x)}<br/>{y}</span>'
+            for x, y in stats
+        )
+        yield '        <br/>'
+        yield from (
+            f'        <span class="rel" style="width: 20%;">{x}<br/>{y}</span>'
+            for x, y in derived
+        )
+        yield from [
+            '        <hr style="border: 1px solid #dddddd;">',
+            f'        <strong>Skills:</strong> {skills}<br/>',
+            f'        <strong>Weapon:</strong> {self.weapon.name}',
+            f'        ({am.tag("patk")} {self.weapon.damage()} {self.weapon.damageType()},',
+            f'        Range {self.weapon.range}{", DUAL" if self.dualWield else ""})<br/>',
+            f'        <strong>Armor:</strong> {self.armor.name}',
+            f'        ({am.tag("pdef")} {self.__nullable(self.armor.p_protection)},',
+            f'        {am.tag("mdef")} {self.__nullable(self.armor.m_protection)}{", SHLD" if self.shield else ""})<br/>',
+            f'        <strong>Items:</strong> {items or "-"}',
+            '        <hr style="border: 1px solid #dddddd;">',
+        ]
+        for abil in self.abilities:
+            t = 'Active' if abil.type.upper() == 'A' else 'Passive'
+            yield f'        <strong>{abil.name.title()} [{t}]</strong> {abil.desc}<br/>'
+        yield from [
+            '    </div>',
+            '</div>',
+        ]
+
+    def toHTMLList(
+        self
+    ) -> List[str]:
+        """
+        Returns contents of class as a formatted HTML block
+
+        Returns
+        -------
+        html_tags : `List[str]`
+            A list of strings representing the contained HTML
+        """
+        return list(self.iterHTML())
\ No newline at end of file
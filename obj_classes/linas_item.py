@@ -2,11 +2,17 @@
 Class used to hold and modify data for LINAS' items
 """
 from __future__ import print_function, division
-from typing import List, Dict
+from typing import List, Dict, Iterator
 from utils.assets import AssetManager
+from obj_classes.item_rules import RULES
 import re
 
 class LINASItem:
+    __slots__ = (
+        'name', 'desc', 'cost', 'linkedSkill', 'range', 'p_damage', 'm_damage',
+        'p_protection', 'm_protection', 'stat', 'speedPenalty', 'uses',
+        'notes', 'template', 'points', 'enchanted', 'artifact',
+    )
     __am = AssetManager()
     __image_style='style="height:16px; width:autopx;"'
 
@@ -83,20 +89,18 @@ class LINASItem:
         self.template        = template
         self.points          = points
 
+        self.enchanted       = enchanted
+        self.artifact        = artifact
+
+        # Fill in the points from the rules if they weren't set by hand
         if self.points == -1:
-            if artifact or not self.equipment():
-                self.points = 0
-            else:
-                self.points = 5
-                self.points -= self.equipment() // 2
-                if self.m_damage:
-                    self.points -= 1
-                if enchanted:
-                    self.points -= 2
-                if speedPenalty:
-                    self.points += speedPenalty // 2
-            if self.points > 5:
-                self.points = 5
+            self.points = RULES.points(
+                self.equipment() or 0,
+                self.m_damage or 0,
+                speedPenalty or 0,
+                int(bool(enchanted)),
+                int(bool(artifact))
+            )
     
 
     def damage(self):
@@ -295,6 +299,25 @@ class LINASItem:
         ]
         return html      
     
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
+        if self.equipment() == None:   
+            yield from self.__generalItemToHtmlList()
+        else:
+            if self.damage():
+                yield from self.__weaponToHtmlList()
+            else:
+                yield from self.__armorToHtmlList()
+
     def toHTMLList(
         self
     ) -> List[str]:
@@ -306,11 +329,4 @@ class LINASItem:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        if self.equipment() == None:   
-            return self.__generalItemToHtmlList()
-        else:
-            if self.damage():
-                return self.__weaponToHtmlList()
-            else:
-                return self.__armorToHtmlList()
-           
\ No newline at end of file
+        return list(self.iterHTML())
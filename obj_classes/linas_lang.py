@@ -2,10 +2,13 @@
 Class used to hold and modify data for LINAS' skills
 """
 from __future__ import print_function, division
-from typing import List, Dict
+from typing import List, Dict, Iterator
 import re
 
 class LINASLanguage:
+    __slots__ = (
+        'name', 'desc', 'template',
+    )
     def __init__(
         self,
         name : str,
@@ -28,6 +31,19 @@ class LINASLanguage:
         self.desc = re.sub(r'[\ \n]+', ' ', description)
         self.template = template
     
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
+        yield f'<p><u><strong>{self.name}</strong></u> -- {self.desc}<p>'
+
     def toHTMLList(
         self
     ) -> List[str]:
@@ -39,8 +55,6 @@ class LINASLanguage:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return [
-            f'<p><u><strong>{self.name}</strong></u> -- {self.desc}<p>'
-        ]
+        return list(self.iterHTML())
 
 # ==============================================================================
\ No newline at end of file
@@ -2,7 +2,7 @@
 Class used to hold and modify data for LINAS' skills
 """
 from __future__ import print_function, division
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Iterator
 from obj_classes.data_manager import DataManager
 from obj_classes.data_collection import DataCollection
 from obj_classes.linas_abil import LINASAbility
@@ -12,6 +12,10 @@ import os
 from obj_classes.linas_abil import LINASAbility
 
 class LINASRace:
+    __slots__ = (
+        'name', 'desc', 'stats', 'abilities', 'languages', 'image', 'template',
+        'notes',
+    )
     def __init__(
         self,
         name        : str,
@@ -77,21 +81,21 @@ class LINASRace:
                 expandedAbilities.append(abil)
         self.abilities = expandedAbilities
 
-    def toHTMLList(
+    def iterHTML(
         self
-    ) -> List[str]:
+    ) -> Iterator[str]:
         """
-        Returns contents of class as a formatted HTML block
+        Yields contents of class as a formatted HTML block, one tag at a time
 
-        Returns
-        -------
-        html_tags : `List[str]`
-            A list of strings representing the contained HTML
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
         """
         noSpace="padding: 0px; spacing: 0px; margin: 0px;"
         langStyle=f'width:50%; float: right; {noSpace}'
         statStyle=f'width:50%; {noSpace}'
-        html = [
+        yield from [
             f'<div class="container pop">',
             f'    <div class="cont-title">',
             f'        <h3 class="nopad">{self.name}</h3>',
@@ -109,8 +113,8 @@ class LINASRace:
             f'                <ul>'
         ]
         for lang in self.languages:
-            html.append(f'                <li>{lang}</li>')
-        html += [
+            yield f'                <li>{lang}</li>'
+        yield from [
             f'                </ul>',
             f'            </div>',
             f'        </div>'
@@ -124,10 +128,8 @@ class LINASRace:
         for stat in self.stats:
             name, val = stat
             fVal = f'+{val}' if val >= 0 else val
-            html.append(
-                f'                <li>{name.upper()}: {fVal}</li>'
-            )
-        html+=[
+            yield f'                <li>{name.upper()}: {fVal}</li>'
+        yield from [
             f'                </ul>',
             f'            </div>',
             f'        </div>',
@@ -138,22 +140,34 @@ class LINASRace:
             f'    <div class="cont-inner">'
         ]
         for abil in self.abilities:
-            html+=abil.toHTMLList()
-        html+=[
+            yield from abil.iterHTML()
+        yield from [
             f'    </div>',
             f'</div>',
         ]
         if len(self.notes):
-            html += [
+            yield from [
                 f'<strong><u>Notes: </u></strong>',
                 f'<ul>'
             ]
             for note in self.notes:
                 note = re.sub(r'[\ \n]+',' ', note)
-                html.append(f"    <li>{note}</li>")
-            html.append('</ul>')
-        html += [
+                yield f"    <li>{note}</li>"
+            yield '</ul>'
+        yield from [
 
             f'<div style="page-break-before: always;"></div>'
         ]
-        return html
\ No newline at end of file
+
+    def toHTMLList(
+        self
+    ) -> List[str]:
+        """
+        Returns contents of class as a formatted HTML block
+
+        Returns
+        -------
+        html_tags : `List[str]`
+            A list of strings representing the contained HTML
+        """
+        return list(self.iterHTML())
\ No newline at end of file
@@ -2,10 +2,13 @@
 Class used to hold and modify data for Kite's stats
 """
 from __future__ import print_function, division
-from typing import List, Dict
+from typing import List, Dict, Iterator
 import re
 
 class LINASStat:
+    __slots__ = (
+        'name', 'abbr', 'desc', 'template',
+    )
     def __init__(
         self,
         name : str,
@@ -32,6 +35,19 @@ class LINASStat:
         self.desc     = re.sub(r'[\ \n]+', ' ', description)
         self.template = template
     
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
+        yield f'<u><strong>{self.name} ({self.abbr})</strong></u> -- {self.desc}'
+
     def toHTMLList(
         self
     ) -> List[str]:
@@ -43,8 +59,6 @@ class LINASStat:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return [
-            f'<u><strong>{self.name} ({self.abbr})</strong></u> -- {self.desc}'
-        ]
+        return list(self.iterHTML())
 
 # ==============================================================================
\ No newline at end of file
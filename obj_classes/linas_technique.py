@@ -2,12 +2,16 @@
 Class used to hold and modify data for LINAS' spells
 """
 from __future__ import print_function, division
-from typing import List, Dict
+from typing import List, Dict, Iterator
 from utils.assets import AssetManager
+from obj_classes.technique_rules import RULES
 import re
-from math import ceil
 
 class LinasTechnique:
+    __slots__ = (
+        'name', 'skill', 'desc', 'damage', 'cost', 'range', 'points',
+        'numTargets', 'notes', 'template', 'stat', 'status', 'aoe', 'fnf',
+    )
     __am = AssetManager()
     __icon = 'style="height: 16px; width: 16px;"'
     def __init__(
@@ -69,33 +73,30 @@ class LinasTechnique:
         self.template   = template
         self.stat       = stat
 
+        self.status     = status
+        self.aoe        = aoe
+        self.fnf        = fnf
+
+        # Fill in anything not set by hand from the rules, area techniques
+        # don't use their range
+        range = 0 if aoe else self.range
         if self.cost == -1:
-            self.cost = ceil(self.damage / 2)
-            if status:
-                self.cost += 1
-            if aoe:
-                self.cost += 3
-            else:
-                self.cost += (self.range - 3)
-            self.cost += self.numTargets - 1
-            if fnf:
-                self.cost -= 1
-            if self.cost < 1:
-                self.cost = 1
-            
+            self.cost = RULES.cost(
+                self.damage,
+                range,
+                self.numTargets,
+                status,
+                aoe,
+                fnf
+            )
         if self.points == -1:
-            self.points = 5
-            self.points -= self.damage // 2
-            if aoe:
-                self.points -= 3
-            else:
-                self.points -= (self.range - 3)
-            if status:
-                self.points -= 1
-            if fnf:
-                self.points += 1
-            if self.points > 5:
-                self.points = 5
+            self.points = RULES.points(
+                self.damage,
+                range,
+                status,
+                aoe,
+                fnf
+            )
     
         if numTargets == 0:
             if aoe:
@@ -116,18 +117,18 @@ class LinasTechnique:
                 return '-'
             return value.title()
     
-    def toHTMLList(
+    def iterHTML(
         self
-    ) -> List[str]:
+    ) -> Iterator[str]:
         """
-        Returns contents of class as a formatted HTML block
+        Yields contents of class as a formatted HTML block, one tag at a time
 
-        Returns
-        -------
-        html_tags : `List[str]`
-            A list of strings representing the contained HTML
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
         """
-        html = [
+        yield from [
             '<div class="container pop">',
             '    <div class="cont-title">',
             '        <span class="rel" style="width: 30%;">',
@@ -183,10 +184,74 @@ class LinasTechnique:
             '        <ul>',
         ]
         for note in self.notes:
-            html.append(f'            <li>{note}</li>')
-        html += [
+            yield f'            <li>{note}</li>'
+        yield from [
             '        </ul>',
             '    </div>'
             '</div>'
         ]
-        return html
\ No newline at end of file
+
+    def iterCardHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a compact card (see CardSheet), one tag
+        at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
+        yield from [
+            '<div class="container" style="height: 100%; margin: 0px; box-sizing: border-box;">',
+            '    <div class="cont-title">',
+            f'        <strong>{self.name}</strong>',
+            '        <span style="float: right;">',
+            f'            <strong>Max Points:</strong> {self.__formatField(self.points)}',
+            '        </span>',
+            '    </div>',
+            '    <div class="cont-inner">',
+            f'        <strong>Req. Skill:</strong> {self.skill.title()}<br/>',
+            f'        <strong>Req. Stat:</strong> {self.__formatField(self.stat).title()}',
+            '        <hr style="border: 1px solid #dddddd;">',
+            '        <span class="rel" style="width: 20%;">',
+            f'            <strong>{LinasTechnique.__am.tag("matk")}</strong><br/>',
+            f'            {self.__formatField(self.damage)}',
+            '        </span>',
+            '        <span class="rel" style="width: 20%;">',
+            f'            <strong>{LinasTechnique.__am.tag("tp")}</strong><br/>',
+            f'            {self.__formatField(self.cost)}',
+            '        </span>',
+            '        <span class="rel" style="width: 20%;">',
+            '            <strong>Range</strong><br/>',
+            f'            {self.__formatField(self.range)}',
+            '        </span>',
+            '        <span class="rel" style="width: 25%;">',
+            '            <strong>Targets</strong><br/>',
+            f'            {self.numTargets}',
+            '        </span>',
+            '        <hr style="border: 1px solid #dddddd;">',
+            f'        {self.desc}',
+            '        <ul>',
+        ]
+        for note in self.notes:
+            yield f'            <li>{note}</li>'
+        yield from [
+            '        </ul>',
+            '    </div>',
+            '</div>',
+        ]
+
+    def toHTMLList(
+        self
+    ) -> List[str]:
+        """
+        Returns contents of class as a formatted HTML block
+
+        Returns
+        -------
+        html_tags : `List[str]`
+            A list of strings representing the contained HTML
+        """
+        return list(self.iterHTML())
\ No newline at end of file
@@ -3,10 +3,24 @@ Class used to write out stored internal data to file
 """
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
+from obj_classes.build_graph import BuildGraph
+from utils.assets import assetsVersion, loadStyles
+from utils.profiler import profiler
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Dict, Iterator, List, TextIO, Tuple
+import hashlib
+import io
+import json
 import os
+import subprocess
 import sys
+import tempfile
 import pdfkit
 
+# Location wkhtmltopdf is installed to by default
+WKHTMLTOPDF = 'C:/Program Files/wkhtmltopdf/bin/wkhtmltopdf.exe'
+
 class PDFGenerator:
     """
     Class used to write out stored internal data to file
@@ -20,24 +34,44 @@ class PDFGenerator:
     debug : `bool`
         If true is passed in, an HTML file will be printed alongside the PDF,
         default value is False (no html output)
+    workers : `int`
+        The number of wkhtmltopdf processes to run at once. If more than 1 is
+        passed in (or a cacheDir is given), the document is split at each
+        section and every section is rendered on its own before being merged
+        back together, default value is 1 (render the document as a single
+        job)
+    cacheDir : `str`
+        An (optional) directory to keep rendered chunks and build state in
+        between runs, only chunks whose content changed since the last run are
+        rendered again
+    wkhtmltopdf : `str`
+        An (optional) location of the wkhtmltopdf executable, default value
+        is WKHTMLTOPDF
     """
+    __section = '<div class="section">'
+
     def __init__(
         self,
-        outputPath : str,
-        cm         : ContentManager,
-        debug      : bool = False
+        outputPath  : str,
+        cm          : ContentManager,
+        debug       : bool = False,
+        workers     : int = 1,
+        cacheDir    : str = None,
+        wkhtmltopdf : str = None
     ) -> None:
         self.outputPath = outputPath
         self.debug = debug
         self.cm = cm
+        self.workers = workers
+        self.cacheDir = cacheDir
 
         # Get directory of calling file i.e. name
         self.__cwd = os.getcwd()
 
-        # Set up config for pdfkit
-        self.__config   = pdfkit.configuration(
-            wkhtmltopdf='C:/Program Files/wkhtmltopdf/bin/wkhtmltopdf.exe'
-        )
+        # Config for pdfkit, only resolved once a pdf is written so HTML only
+        # uses (i.e. the live preview) don't need wkhtmltopdf installed
+        self.__wkhtmltopdf = wkhtmltopdf or WKHTMLTOPDF
+        self.__config = None
 
         # Set up options for pdfkit
         msize='1.0in'
@@ -50,46 +84,483 @@ class PDFGenerator:
             'margin-right': msize,
         }
 
-        # Initialize internal HTML tag list
-        self.__html = [ 
+        # Initialize document head, content from the content manager is only
+        # rendered once the document is iterated
+        self.__head = [ 
             "<!DOCTYPE html>",
             "<html>",
             "    <head>"
         ]
 
-        # Append CSS to internal HTML
-        self.__html.append("        <style>")
-        fin = open(f"{self.__cwd}/styles.css", "r")
-        for line in [ x.replace("\n","") for x in fin.readlines()]:
-            self.__html.append(f"            {line}")
-        fin.close()
-        self.__html.append("        </style>")
+        # Append CSS to document head
+        with profiler.span('load styles'):
+            self.__head.append("        <style>")
+            for line in loadStyles(f"{self.__cwd}/styles.css"):
+                self.__head.append(f"            {line}")
+            self.__head.append("        </style>")
+
+        # Close head and open body
+        self.__head.append("    </head>")
+        self.__head.append("    <body>")
+
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields the full HTML document, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the document
+        """
+        yield from self.__document(self.cm.iterHTML())
 
-        # Close head and open body for internal HTML
-        self.__html.append("    </head>")
-        self.__html.append("    <body>")
+    def getHead(
+        self
+    ) -> List[str]:
+        """
+        Returns the lines of the document up to (and including) the opening
+        body tag, i.e. the stylesheet
+
+        Returns
+        -------
+        html_tags : `List[str]`
+            A list of strings representing the document head
+        """
+        return list(self.__head)
+
+    def __document(
+        self,
+        lines : Iterator[str]
+    ) -> Iterator[str]:
+        """
+        Wraps content lines in the document head and closing tags
+        """
+        yield from self.__head
 
         # Add content from content manager to pdf
-        self.__html += [ f"        {x}" for x in cm.toHTMLList() ]
+        yield from ( f"        {x}" for x in lines )
+
+        # Finalize HTML
+        yield "    </body>"
+        yield "</html>"
+
+    def iterChunks(
+        self
+    ) -> Iterator[List[str]]:
+        """
+        Splits the content from the content manager at each top level
+        section, anything before the first section (i.e. the title page) is
+        kept with the first section. Used to render sections on their own
+        and by the preview server to only update sections which changed
+
+        Yields
+        ------
+        chunk : `List[str]`
+            The content lines making up a single section
+        """
+        chunk = []
+        hasSection = False
+        for line in self.cm.iterHTML():
+            if line.strip() == PDFGenerator.__section:
+                if hasSection:
+                    yield chunk
+                    chunk = []
+                hasSection = True
+            chunk.append(line)
+        if chunk:
+            yield chunk
+
+    def __pipeToPDF(
+        self,
+        lines      : Iterator[str],
+        outputPath : str,
+        tee        : TextIO = None,
+        pageOffset : int = 0
+    ) -> None:
+        """
+        Streams HTML lines into the stdin of a wkhtmltopdf process as they are
+        rendered, the full document is never held in memory at once
+
+        Parameters
+        ----------
+        lines : `Iterator[str]`
+            The lines of the HTML document to write out
+        outputPath : `str`
+            Location to write out the finalized pdf to
+        tee : `TextIO`
+            An (optional) open file every line is also copied to
+        pageOffset : `int`
+            The number of pages rendered before this document, used to keep
+            page numbers continuous when a document is rendered in pieces
+        """
+        options = self.__options
+        if pageOffset:
+            options = dict(options, **{'page-offset': pageOffset})
+
+        # Let pdfkit build the command line so options are handled the same
+        # way as pdfkit.from_string; '-' tells wkhtmltopdf to read stdin
+        args = pdfkit.PDFKit(
+            '',
+            'string',
+            options=options,
+            configuration=self.__configuration()
+        ).command(outputPath)
+
+        startupinfo = None
+        if sys.platform == 'win32':
+            # hide cmd window
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = subprocess.SW_HIDE
+
+        # stderr goes to a temp file so a chatty wkhtmltopdf can never block
+        # on a full pipe while we are still writing to it
+        with profiler.span('wkhtmltopdf', 'pdf'), tempfile.TemporaryFile() as errors:
+            process = subprocess.Popen(
+                args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=errors,
+                startupinfo=startupinfo
+            )
+            stdin = io.TextIOWrapper(process.stdin, encoding='utf-8')
+            try:
+                sep = ''
+                for line in lines:
+                    stdin.write(sep)
+                    stdin.write(line)
+                    if tee:
+                        tee.write(sep)
+                        tee.write(line)
+                    sep = '\n'
+                stdin.close()
+            except BrokenPipeError:
+                # wkhtmltopdf exited early, the exit code below reports why
+                pass
+            except BaseException:
+                # Rendering failed (or the build was interrupted), never leave
+                # wkhtmltopdf running with its stdin open
+                process.kill()
+                try:
+                    stdin.close()
+                except OSError:
+                    pass
+                process.wait()
+                raise
+            with profiler.span('wkhtmltopdf finish', 'pdf'):
+                exitCode = process.wait()
+            errors.seek(0)
+            pdfkit.PDFKit.handle_error(
+                exitCode,
+                errors.read().decode('utf-8', errors='replace')
+            )
+
+    def __configuration(self) -> Any:
+        """
+        Returns the pdfkit configuration, raising if wkhtmltopdf can't be
+        found
+        """
+        if self.__config is None:
+            self.__config = pdfkit.configuration(wkhtmltopdf=self.__wkhtmltopdf)
+        return self.__config
+
+    def __renderChunk(
+        self,
+        htmlPath   : str,
+        pdfPath    : str,
+        pageOffset : int
+    ) -> int:
+        """
+        Renders a single chunk written out by __writeOutParallel (unless it
+        was already rendered at the same page offset) and returns the number
+        of pages it took up
+        """
+        from pypdf import PdfReader
+
+        if not os.path.exists(pdfPath):
+            with open(htmlPath, 'r', encoding='utf-8') as fin:
+                self.__pipeToPDF(
+                    ( x.rstrip('\n') for x in fin ),
+                    f'{pdfPath}.tmp',
+                    pageOffset=pageOffset
+                )
+            os.replace(f'{pdfPath}.tmp', pdfPath)
+        with profiler.span('count pages', 'pdf'):
+            return len(PdfReader(pdfPath).pages)
+
+    def __pageRecordPath(self) -> str:
+        head, tail = os.path.split(self.outputPath)
+        if self.cacheDir:
+            return os.path.join(self.cacheDir, 'build', f'{tail}.pages.json')
+        return os.path.join(head, f'.{tail}.pages.json')
+
+    def __loadPageRecord(self) -> Dict[str, int]:
+        """
+        Loads the page counts of the chunks from the last parallel build, used
+        to guess page offsets before any chunk has been rendered
+        """
+        try:
+            with open(self.__pageRecordPath(), 'r') as fin:
+                return json.load(fin)
+        except (OSError, ValueError):
+            return {}
+
+    def __salt(self) -> str:
+        """
+        Returns a hash of everything outside the content which ends up in a
+        chunk's pdf, i.e. the document head (CSS), the pdfkit options and the
+        linked assets
+        """
+        return hashlib.sha1(
+            json.dumps([
+                self.__head,
+                self.__options,
+                assetsVersion(f"{self.__cwd}/assets")
+            ]).encode('utf-8')
+        ).hexdigest()
+
+    def __iterParts(
+        self,
+        graph : BuildGraph
+    ) -> Iterator[Tuple[str, str, Iterator[str]]]:
+        """
+        Yields the chunks to render as (node name, known digest, lines), see
+        BuildGraph.iterChunks
+        """
+        if graph:
+            yield from graph.iterChunks(
+                lambda digest: os.path.exists(self.__chunkPath(digest, 'html'))
+            )
+        else:
+            for lines in self.iterChunks():
+                yield None, None, lines
+
+    def __chunkPath(
+        self,
+        name : str,
+        ext  : str
+    ) -> str:
+        return os.path.join(self.__chunkDir, f'{name}.{ext}')
+
+    def __writeOutParallel(
+        self,
+        tee : TextIO = None
+    ) -> None:
+        """
+        Renders each section of the document in its own wkhtmltopdf process
+        and merges the results into a single pdf
+
+        Every chunk is rendered with a page offset guessed from the page
+        counts recorded on the last build. Once every chunk has finished the
+        real offsets are known and only the chunks which were guessed wrong
+        are rendered again, so a rebuild of an unchanged layout runs each
+        chunk exactly once.
+
+        If a cache directory was given, chunks are stored there by the digest
+        of their HTML (and pdfs by digest and page offset) so unchanged chunks
+        are never rendered twice. When the content manager is a system, a
+        BuildGraph also skips generating the HTML of any section whose data
+        did not change.
+
+        Parameters
+        ----------
+        tee : `TextIO`
+            An (optional) open file the full HTML document is copied to
+        """
+        # pypdf is only needed when splitting the document up
+        with profiler.span('import pypdf'):
+            from pypdf import PdfWriter
+
+        # Chunk digests cover the salt too, so a changed asset or option
+        # renders chunks whose HTML is the same again
+        salt = self.__salt()
+        with ExitStack() as stack:
+            graph = None
+            if self.cacheDir:
+                name = os.path.basename(self.outputPath)
+                self.__chunkDir = os.path.join(self.cacheDir, 'chunks', name)
+                os.makedirs(self.__chunkDir, exist_ok=True)
+                if isinstance(self.cm, ContentManager):
+                    graph = BuildGraph(
+                        self.cm,
+                        os.path.join(self.cacheDir, 'build', f'{name}.json'),
+                        salt=salt
+                    )
+            else:
+                self.__chunkDir = stack.enter_context(tempfile.TemporaryDirectory())
+            pool = stack.enter_context(
+                ThreadPoolExecutor(max_workers=max(1, self.workers))
+            )
+
+            pageRecord = self.__loadPageRecord()
+
+            # The record is in document order, so a chunk that changed can
+            # borrow the page count of the chunk it most likely replaced
+            positional = list(pageRecord.values())
+            chunks = []
+            guess = 0
+            if tee:
+                tee.write("\n".join(self.__head))
+            for i, (node, digest, lines) in enumerate(self.__iterParts(graph)):
+                if lines is not None:
+                    # Write the chunk out as a full document so it can be
+                    # rendered (and re-rendered) without holding it in memory
+                    tmpPath = self.__chunkPath(f'.{i}', 'tmp')
+                    sha = hashlib.sha1(salt.encode('utf-8'))
+                    with profiler.span('write chunk'):
+                        with open(tmpPath, 'w', encoding='utf-8') as fout:
+                            for line in self.__document(lines):
+                                fout.write(f'{line}\n')
+                                sha.update(line.encode('utf-8'))
+                    digest = sha.hexdigest()
+                    os.replace(tmpPath, self.__chunkPath(digest, 'html'))
+                    if graph:
+                        graph.record(node, digest)
+                htmlPath = self.__chunkPath(digest, 'html')
+                if tee:
+                    with profiler.span('write debug.html'):
+                        with open(htmlPath, 'r', encoding='utf-8') as fin:
+                            content = fin.read().split('\n')[len(self.__head):-3]
+                        for line in content:
+                            tee.write(f"\n{line}")
+                future = pool.submit(
+                    self.__renderChunk,
+                    htmlPath,
+                    self.__chunkPath(f'{digest}-{guess}', 'pdf'),
+                    guess
+                )
+                chunks.append((digest, guess, future))
+                guess += pageRecord.get(
+                    digest,
+                    positional[i] if i < len(positional) else 0
+                )
+            if tee:
+                tee.write("\n    </body>\n</html>")
+
+            # Fix up any chunks whose page numbers started in the wrong place
+            pageRecord = {}
+            final = []
+            offset = 0
+            for digest, guess, future in chunks:
+                with profiler.span('wait for chunks', 'pdf'):
+                    pages = future.result()
+                if guess != offset:
+                    future = pool.submit(
+                        self.__renderChunk,
+                        self.__chunkPath(digest, 'html'),
+                        self.__chunkPath(f'{digest}-{offset}', 'pdf'),
+                        offset
+                    )
+                final.append((digest, offset, future))
+                pageRecord[digest] = pages
+                offset += pages
+
+            # Merge chunks in order
+            writer = PdfWriter()
+            with profiler.span('wait for chunks', 'pdf'):
+                for digest, offset, future in final:
+                    future.result()
+            with profiler.span('merge chunks', 'pdf'):
+                for digest, offset, future in final:
+                    writer.append(self.__chunkPath(f'{digest}-{offset}', 'pdf'))
+                with open(self.outputPath, 'wb') as fout:
+                    writer.write(fout)
+
+            if self.cacheDir:
+                # Drop chunks this build no longer uses
+                keep = set()
+                for digest, offset, future in final:
+                    keep.add(f'{digest}.html')
+                    keep.add(f'{digest}-{offset}.pdf')
+                for file in os.listdir(self.__chunkDir):
+                    if file not in keep:
+                        os.remove(os.path.join(self.__chunkDir, file))
+            if graph:
+                graph.save()
+
+        recordPath = self.__pageRecordPath()
+        os.makedirs(os.path.dirname(recordPath) or '.', exist_ok=True)
+        with open(recordPath, 'w') as fout:
+            json.dump(pageRecord, fout)
 
     def writeOutToPDF(
         self
     ) -> None:
-        # Finalize HTML
-        self.__html.append("    </body>")
-        self.__html.append("</html>")
+        # wkhtmltopdf is only resolved here, once a pdf is actually written, so
+        # a missing executable fails the build before anything is rendered
+        self.__configuration()
 
-        # if debugging, print out HTML doc
+        # if debugging, copy the HTML doc out as it is streamed to wkhtmltopdf,
+        # it's only moved into place once complete so generators running at
+        # the same time never interleave their output
+        debugFile = None
+        debugPath = f"{self.__cwd}/debug.html"
         if self.debug:
-            f = open(f"{self.__cwd}/debug.html","w")
-            f.write("\n".join(self.__html))
-            f.close()
+            debugFile = open(f"{debugPath}.{os.getpid()}.tmp","w")
 
         # Write out pdf
-        pdfkit.from_string( 
-            "\n".join(self.__html), 
-            self.outputPath, 
-            configuration=self.__config,
-            options=self.__options
-        )
+        try:
+            if self.workers > 1 or self.cacheDir:
+                self.__writeOutParallel(debugFile)
+            else:
+                self.__pipeToPDF(self.iterHTML(), self.outputPath, debugFile)
+        finally:
+            if debugFile:
+                debugFile.close()
+                os.replace(debugFile.name, debugPath)
+
+    def writeOutEachToPDF(
+        self,
+        documents : List[Tuple[str, Any]]
+    ) -> None:
+        """
+        Writes out several documents (e.g. one pdf per entity) sharing this
+        generator's head and options, up to `workers` of them at once. The
+        generator's own outputPath and cm aren't used. If a cache directory
+        was given, documents whose HTML didn't change since they were last
+        written (and whose pdf is still there) are skipped.
+
+        Parameters
+        ----------
+        documents : `List[Tuple[str, Any]]`
+            The location to write each pdf to and the content to write to it,
+            anything with an iterHTML method
+        """
+        self.__configuration()
+        recordPath = None
+        record = {}
+        if self.cacheDir:
+            recordPath = os.path.join(self.cacheDir, 'build', 'documents.json')
+            try:
+                with open(recordPath, 'r') as fin:
+                    record = json.load(fin)
+            except (OSError, ValueError):
+                pass
+        salt = self.__salt()
+
+        def write(outputPath : str, content : Any) -> str:
+            lines = list(self.__document(content.iterHTML()))
+            digest = hashlib.sha1(
+                '\n'.join([ salt ] + lines).encode('utf-8')
+            ).hexdigest()
+            if record.get(outputPath) == digest and os.path.exists(outputPath):
+                return digest
+            self.__pipeToPDF(iter(lines), f'{outputPath}.tmp')
+            os.replace(f'{outputPath}.tmp', outputPath)
+            return digest
 
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as pool:
+            futures = [
+                (path, pool.submit(write, path, content))
+                for path, content in documents
+            ]
+            try:
+                for path, future in futures:
+                    record[path] = future.result()
+            finally:
+                if recordPath:
+                    os.makedirs(os.path.dirname(recordPath), exist_ok=True)
+                    with open(recordPath, 'w') as fout:
+                        json.dump(record, fout)
@@ -0,0 +1,230 @@
+"""
+Class used to serve a live HTML preview of a document, pushing sections to
+the browser as they change
+"""
+from __future__ import print_function, division
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Tuple
+import json
+import mimetypes
+import os
+import queue
+import threading
+
+# Script added to the previewed page, swaps in sections pushed by the server
+# and reloads the page when the document's head or layout changed
+_CLIENT = '''
+<script>
+    (function() {
+        var events = new EventSource('/events');
+        events.addEventListener('section', function(e) {
+            var data = JSON.parse(e.data);
+            var node = document.getElementById('preview-' + data.index);
+            if (node) {
+                node.innerHTML = data.html;
+            } else {
+                location.reload();
+            }
+        });
+        events.addEventListener('reload', function() {
+            location.reload();
+        });
+    })();
+</script>
+'''
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Handles requests for the preview page, its events and its assets
+    """
+    def log_message(self, format, *args):
+        pass
+
+    def __send(self, status : int, contentType : str, body : bytes) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', contentType)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        preview = self.server.preview
+        path = self.path.split('?', 1)[0]
+        if path == '/':
+            self.__send(200, 'text/html; charset=utf-8', preview.page().encode('utf-8'))
+        elif path == '/events':
+            preview.stream(self)
+        elif path.startswith('/assets/') and preview.assetPath(path):
+            file = preview.assetPath(path)
+            with open(file, 'rb') as fin:
+                body = fin.read()
+            self.__send(
+                200,
+                mimetypes.guess_type(file)[0] or 'application/octet-stream',
+                body
+            )
+        else:
+            self.__send(404, 'text/plain', b'Not found')
+
+class PreviewServer:
+    """
+    Class used to serve a live HTML preview of a document, no pdf is
+    rendered. The document is served as its head followed by each of its
+    sections (see PDFGenerator.iterChunks) wrapped in its own element. When
+    update() is called the document is rendered again and only the sections
+    whose HTML changed are pushed to open pages over server-sent events,
+    changes to the head (i.e. the stylesheet) or to the number of sections
+    reload the page instead.
+
+    Assets are linked with file:/// urls in rendered HTML, which browsers
+    won't load from a page served over http, so they are served under
+    /assets/ instead.
+
+    Parameters
+    ----------
+    render : `Callable[[], Tuple[List[str], List[str]]]`
+        Function returning the document's head lines and the HTML of each of
+        its sections
+    host : `str`
+        The address to listen on, default value is localhost only
+    port : `int`
+        The port to listen on
+    """
+    def __init__(
+        self,
+        render : Callable[[], Tuple[List[str], List[str]]],
+        host   : str = '127.0.0.1',
+        port   : int = 8000
+    ) -> None:
+        self.render = render
+        self.host = host
+        self.port = port
+        self.__head : List[str] = []
+        self.__sections : List[str] = []
+        self.__lock = threading.Lock()
+        self.__clients : List[queue.Queue] = []
+        self.__server = None
+
+        # Links to assets in rendered HTML and where they are served from
+        self.__assetDir = f'{os.getcwd()}/assets'
+        self.__assetURL = f'file:///{self.__assetDir}/'.replace('\\', '/')
+
+    def __local(self, html : str) -> str:
+        return html.replace(self.__assetURL, '/assets/')
+
+    def page(self) -> str:
+        """
+        Returns the previewed page as last rendered
+
+        Returns
+        -------
+        html : `str`
+            The full HTML page, including the script receiving updates
+        """
+        with self.__lock:
+            head, sections = self.__head, self.__sections
+        lines = [ self.__local(x) for x in head ]
+        for i, html in enumerate(sections):
+            lines.append(f'<div id="preview-{i}">')
+            lines.append(self.__local(html))
+            lines.append('</div>')
+        lines.append(_CLIENT)
+        lines.append('    </body>')
+        lines.append('</html>')
+        return '\n'.join(lines)
+
+    def __push(self, event : str, data : str) -> None:
+        message = f'event: {event}\n' + ''.join(
+            f'data: {x}\n' for x in data.split('\n')
+        ) + '\n'
+        with self.__lock:
+            clients = list(self.__clients)
+        for client in clients:
+            client.put(message)
+
+    def update(self) -> int:
+        """
+        Renders the document again and pushes whatever changed to open pages
+
+        Returns
+        -------
+        changed : `int`
+            How many sections were pushed, -1 if the pages were reloaded
+        """
+        head, sections = self.render()
+        with self.__lock:
+            oldHead, oldSections = self.__head, self.__sections
+            self.__head, self.__sections = list(head), list(sections)
+        if head != oldHead or len(sections) != len(oldSections):
+            self.__push('reload', '')
+            return -1
+        changed = [
+            i for i, (old, new) in enumerate(zip(oldSections, sections))
+            if old != new
+        ]
+        for i in changed:
+            self.__push('section', json.dumps({
+                'index': i,
+                'html': self.__local(sections[i])
+            }))
+        return len(changed)
+
+    def serve(self) -> None:
+        """
+        Renders the document and starts serving it in a background thread
+        """
+        self.update()
+        self.__server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self.__server.daemon_threads = True
+        self.__server.preview = self
+        threading.Thread(target=self.__server.serve_forever, daemon=True).start()
+
+    def assetPath(self, name : str) -> str:
+        """
+        Returns the location of an asset served under /assets/, None if
+        there is no such asset
+        """
+        path = os.path.join(self.__assetDir, os.path.basename(name))
+        return path if os.path.isfile(path) else None
+
+    def stream(self, handler : BaseHTTPRequestHandler) -> None:
+        """
+        Streams events to a single page until it is closed
+        """
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'text/event-stream')
+        handler.send_header('Cache-Control', 'no-cache')
+        handler.end_headers()
+        client = queue.Queue()
+        with self.__lock:
+            self.__clients.append(client)
+        try:
+            while True:
+                try:
+                    message = client.get(timeout=15)
+                except queue.Empty:
+                    # Keeps idle connections from being dropped
+                    message = ': ping\n\n'
+                if message is None:
+                    break
+                handler.wfile.write(message.encode('utf-8'))
+                handler.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with self.__lock:
+                self.__clients.remove(client)
+
+    def close(self) -> None:
+        """
+        Stops serving and closes any open event streams
+        """
+        with self.__lock:
+            clients = list(self.__clients)
+        for client in clients:
+            client.put(None)
+        if self.__server:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
@@ -0,0 +1,306 @@
+"""
+Class used to hold the formulas for a technique's TP cost and max points
+"""
+from __future__ import print_function, division
+from typing import Any
+
+def _atLeast(value : Any, low : Any) -> Any:
+    # Works the same on plain numbers and NumPy arrays
+    return value + (low - value) * (value < low)
+
+def _atMost(value : Any, high : Any) -> Any:
+    return value + (high - value) * (value > high)
+
+class TechniqueRules:
+    """
+    Class used to hold the formulas for a technique's TP cost and max points,
+    i.e. the guidelines listed at the end of the TechniqueSection. Every
+    formula works on single values (as used by LinasTechnique) and on NumPy
+    arrays, so a tweaked set of rules can be re-applied to a whole catalog in
+    a single vectorized pass.
+
+    Parameters
+    ----------
+    damagePerCost : `int`
+        Damage per 1 TP of base cost (rounded up)
+    statusCost : `int`
+        TP added if the technique causes or heals a status effect
+    aoeCost : `int`
+        TP added if the technique targets the whole field or an area
+    baseRange : `int`
+        The range neither adding nor removing TP or points
+    rangeCost : `int`
+        TP added for each square of range past baseRange (removed for each
+        square short of it), ignored for area techniques
+    targetCost : `int`
+        TP added for each target past the first
+    fnfDiscount : `int`
+        TP removed if the technique targets friend and foe alike
+    minCost : `int`
+        The lowest TP cost a technique can have
+    basePoints : `int`
+        Max points a technique starts with
+    damagePerPoint : `int`
+        Damage per point removed (rounded down)
+    statusPoints : `int`
+        Points removed if the technique causes or heals a status effect
+    aoePoints : `int`
+        Points removed if the technique targets the whole field or an area
+    rangePoints : `int`
+        Points removed for each square of range past baseRange (added for
+        each square short of it), ignored for area techniques
+    fnfPoints : `int`
+        Points added if the technique targets friend and foe alike
+    maxPoints : `int`
+        The most max points a technique can have
+    """
+    # Fields read from each object by evaluate()
+    COLUMNS = [
+        'name',
+        'damage',
+        'range',
+        'numTargets',
+        'status',
+        'aoe',
+        'fnf',
+        'cost',
+        'points',
+    ]
+
+    def __init__(
+        self,
+        damagePerCost  : int = 2,
+        statusCost     : int = 1,
+        aoeCost        : int = 3,
+        baseRange      : int = 3,
+        rangeCost      : int = 1,
+        targetCost     : int = 1,
+        fnfDiscount    : int = 1,
+        minCost        : int = 1,
+        basePoints     : int = 5,
+        damagePerPoint : int = 2,
+        statusPoints   : int = 1,
+        aoePoints      : int = 3,
+        rangePoints    : int = 1,
+        fnfPoints      : int = 1,
+        maxPoints      : int = 5
+    ) -> None:
+        self.damagePerCost  = damagePerCost
+        self.statusCost     = statusCost
+        self.aoeCost        = aoeCost
+        self.baseRange      = baseRange
+        self.rangeCost      = rangeCost
+        self.targetCost     = targetCost
+        self.fnfDiscount    = fnfDiscount
+        self.minCost        = minCost
+        self.basePoints     = basePoints
+        self.damagePerPoint = damagePerPoint
+        self.statusPoints   = statusPoints
+        self.aoePoints      = aoePoints
+        self.rangePoints    = rangePoints
+        self.fnfPoints      = fnfPoints
+        self.maxPoints      = maxPoints
+
+    def cost(
+        self,
+        damage     : Any,
+        range      : Any,
+        numTargets : Any,
+        status     : Any,
+        aoe        : Any,
+        fnf        : Any
+    ) -> Any:
+        """
+        Computes the TP cost of one technique, or of many at once if passed
+        NumPy arrays (flags as 0/1 integers)
+
+        Returns
+        -------
+        cost : `Any`
+            The TP cost(s)
+        """
+        cost = -(-damage // self.damagePerCost)
+        cost = cost + status * self.statusCost
+        cost = cost + aoe * self.aoeCost
+        cost = cost + (1 - aoe) * (range - self.baseRange) * self.rangeCost
+        cost = cost + (numTargets - 1) * self.targetCost
+        cost = cost - fnf * self.fnfDiscount
+        return _atLeast(cost, self.minCost)
+
+    def points(
+        self,
+        damage : Any,
+        range  : Any,
+        status : Any,
+        aoe    : Any,
+        fnf    : Any
+    ) -> Any:
+        """
+        Computes the max points of one technique, or of many at once if passed
+        NumPy arrays (flags as 0/1 integers)
+
+        Returns
+        -------
+        points : `Any`
+            The max point(s)
+        """
+        points = self.basePoints - damage // self.damagePerPoint
+        points = points - aoe * self.aoePoints
+        points = points - (1 - aoe) * (range - self.baseRange) * self.rangePoints
+        points = points - status * self.statusPoints
+        points = points + fnf * self.fnfPoints
+        return _atMost(points, self.maxPoints)
+
+    def compute(
+        self,
+        data    : Any,
+        section : str = 'techniques'
+    ) -> Any:
+        """
+        Computes the TP cost and max points of every technique under a key in
+        one vectorized pass. Requires numpy.
+
+        Parameters
+        ----------
+        data : `DataManager`
+            The data holding the techniques
+        section : `str`
+            The key holding the techniques
+
+        Returns
+        -------
+        array : `numpy.ndarray`
+            A structured array with each technique's name, current cost and
+            points and the cost and points under these rules (ruleCost and
+            rulePoints)
+        """
+        return self.evaluate(data.toColumns(section, self.COLUMNS))
+
+    def evaluate(
+        self,
+        columns : Any
+    ) -> Any:
+        """
+        Same as compute() but on columns already exported with
+        data.toColumns(section, TechniqueRules.COLUMNS), so several sets of
+        rules can be tried against one export without reading every object
+        again
+
+        Parameters
+        ----------
+        columns : `numpy.ndarray`
+            The exported columns
+
+        Returns
+        -------
+        array : `numpy.ndarray`
+            See compute()
+        """
+        import numpy as np
+        flag = lambda name: columns[name].astype(np.int64)
+
+        # Techniques with no targets display 'self' or '-' instead of 0
+        targets = columns['numTargets']
+        if targets.dtype == object:
+            targets = np.array(
+                [ 0 if isinstance(x, str) else x for x in targets ],
+                dtype=np.int64
+            )
+        damage = columns['damage'].astype(np.int64)
+
+        # Area techniques don't use their range (which may be missing)
+        range = np.nan_to_num(columns['range'].astype(np.float64)).astype(np.int64)
+
+        result = np.empty(
+            len(columns),
+            dtype=[
+                ('name', columns.dtype['name']),
+                ('cost', np.int64),
+                ('ruleCost', np.int64),
+                ('points', np.int64),
+                ('rulePoints', np.int64),
+            ]
+        )
+        result['name'] = columns['name']
+        result['cost'] = columns['cost']
+        result['points'] = columns['points']
+        result['ruleCost'] = self.cost(
+            damage, range, targets, flag('status'), flag('aoe'), flag('fnf')
+        )
+        result['rulePoints'] = self.points(
+            damage, range, flag('status'), flag('aoe'), flag('fnf')
+        )
+        return result
+
+    def diff(
+        self,
+        data    : Any,
+        section : str = 'techniques'
+    ) -> Any:
+        """
+        Returns the techniques whose TP cost or max points differ from what
+        these rules give, i.e. techniques with hand-tuned values or every
+        technique a rules tweak would change
+
+        Parameters
+        ----------
+        data : `DataManager`
+            The data holding the techniques
+        section : `str`
+            The key holding the techniques
+
+        Returns
+        -------
+        array : `numpy.ndarray`
+            The rows of compute() where cost != ruleCost or
+            points != rulePoints
+        """
+        result = self.compute(data, section)
+        return result[
+            (result['cost'] != result['ruleCost']) |
+            (result['points'] != result['rulePoints'])
+        ]
+
+    def apply(
+        self,
+        data    : Any,
+        section : str = 'techniques'
+    ) -> int:
+        """
+        Re-applies these rules to every technique under a key, overwriting
+        their TP cost and max points
+
+        Parameters
+        ----------
+        data : `DataManager`
+            The data holding the techniques
+        section : `str`
+            The key holding the techniques
+
+        Returns
+        -------
+        changed : `int`
+            How many techniques had their cost or points changed
+        """
+        import numpy as np
+        result = self.compute(data, section)
+        changed = int(np.count_nonzero(
+            (result['cost'] != result['ruleCost']) |
+            (result['points'] != result['rulePoints'])
+        ))
+        updated = np.empty(
+            len(result),
+            dtype=[
+                ('name', result.dtype['name']),
+                ('cost', np.int64),
+                ('points', np.int64),
+            ]
+        )
+        updated['name'] = result['name']
+        updated['cost'] = result['ruleCost']
+        updated['points'] = result['rulePoints']
+        data.fromColumns(section, updated)
+        return changed
+
+# Rules used for techniques which don't set their own cost or points
+RULES = TechniqueRules()
@@ -4,7 +4,7 @@ Class used to create a section explaining and listing out abilities for a system
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
 from obj_classes.data_manager import DataManager
-from typing import List
+from typing import List, Iterator
 import os
 
 class AbilitySection:
@@ -24,19 +24,31 @@ class AbilitySection:
         data : `DataManager`
             The data for the class, needed load in the abilities for the section
         """
-        # A list of HTML tags to append to a host document
-        self.__html = []
+        # Keep references to the parent system and data for rendering
+        self.__system = system
+        self.__data = data
 
         # Get TOC data from parent
         self.__contents = system.getContents()
 
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
         # Build out HTML here
         # ======================================================================
         # = Abilities Section
         # ======================================================================
-        self.__html.append('<div class="section">') 
-        self.__html.append(f'    {self.__contents.single("abilities")}')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield '<div class="section">'
+        yield f'    {self.__contents.single("abilities")}'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Abilities can be thought of as extra perks or advantages which make
             a character unique or give a character an edge over other characters
@@ -90,16 +102,16 @@ class AbilitySection:
                 </li><br/>
             </ul>
             """
-        )]
+        ))
         
         # Page break
-        self.__html.append(f'    {system.pageBreak()}')
+        yield f'    {self.__system.pageBreak()}'
         
         # Load in skills
-        self.__html += [ f'    {x}' for x in 
-            data.typeToHTMLList('abilities')
-        ]
-        self.__html.append('</div>')
+        yield from ( f'    {x}' for x in
+            self.__data.iterHTML('abilities')
+        )
+        yield '</div>'
 
     def toHTMLList(
         self
@@ -112,4 +124,4 @@ class AbilitySection:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
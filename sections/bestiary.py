@@ -0,0 +1,67 @@
+"""
+Class used to collect many entities into a single bestiary document
+"""
+from __future__ import print_function, division
+from obj_classes.linas_entity import LinasEntity
+from typing import List, Iterator
+
+class Bestiary:
+    def __init__(
+        self,
+        entities  : List[LinasEntity],
+        groupSize : int = 25
+    ) -> None:
+        """
+        Class used to collect many entities into a single bestiary document
+
+        Parameters
+        ----------
+        entities : `List[LinasEntity]`
+            The entities in the bestiary, in the order they're printed
+        groupSize : `int`
+            The number of entities per section. A PDFGenerator with more than
+            1 worker renders each section on its own, so smaller groups spread
+            the work out more and re-render less when a single entity changes
+        """
+        self.entities = entities
+        self.groupSize = max(1, groupSize)
+
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
+        for start in range(0, len(self.entities), self.groupSize):
+            # Sections start on a new page already (so the first entity's
+            # own page break is dropped), keep the entities' line height the
+            # same as when they're printed on their own
+            yield '<div class="section">'
+            yield '<div style="line-height: normal;">'
+            for i, entity in enumerate(
+                self.entities[start:start + self.groupSize]
+            ):
+                lines = entity.iterHTML()
+                if i == 0:
+                    next(lines)
+                yield from ( f'    {x}' for x in lines )
+            yield '</div>'
+            yield '</div>'
+
+    def toHTMLList(
+        self
+    ) -> List[str]:
+        """
+        Returns contents of class as a formatted HTML block
+
+        Returns
+        -------
+        html_tags : `List[str]`
+            A list of strings representing the contained HTML
+        """
+        return list(self.iterHTML())
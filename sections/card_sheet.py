@@ -0,0 +1,88 @@
+"""
+Class used to lay out data objects as printable cards, several to a page
+"""
+from __future__ import print_function, division
+from typing import Any, List, Iterator
+
+class CardSheet:
+    def __init__(
+        self,
+        cards           : List[Any],
+        columns         : int = 2,
+        rows            : int = 2,
+        cardHeight      : str = '4.2in',
+        pagesPerSection : int = 10
+    ) -> None:
+        """
+        Class used to lay out data objects as printable cards, several to a
+        page
+
+        Parameters
+        ----------
+        cards : `List[Any]`
+            The data objects to print, anything with an iterCardHTML method
+            (i.e. LinasTechnique)
+        columns : `int`
+            The number of cards across a page
+        rows : `int`
+            The number of cards down a page
+        cardHeight : `str`
+            The height of a single card (as a CSS length), cards are cut off
+            at this height so every page lines up the same
+        pagesPerSection : `int`
+            The number of pages per section. A PDFGenerator with more than 1
+            worker renders each section on its own, so smaller sections
+            spread the work out more and re-render less when a card changes
+        """
+        self.cards = cards
+        self.columns = max(1, columns)
+        self.rows = max(1, rows)
+        self.cardHeight = cardHeight
+        self.pagesPerSection = max(1, pagesPerSection)
+
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
+        perPage = self.columns * self.rows
+        perSection = perPage * self.pagesPerSection
+        width = 100 // self.columns - 2
+        for start in range(0, len(self.cards), perSection):
+            # Sections start on a new page already, keep the cards' line
+            # height the same as anywhere else
+            yield '<div class="section">'
+            yield '<div style="line-height: normal;">'
+            for page in range(start, min(start + perSection, len(self.cards)), perPage):
+                style = '' if page == start else ' style="page-break-before: always;"'
+                yield f'    <div{style}>'
+                for card in self.cards[page:page + perPage]:
+                    yield (
+                        f'        <div class="rel" style="width: {width}%; '
+                        f'height: {self.cardHeight}; overflow: hidden; '
+                        'margin-bottom: 10px;">'
+                    )
+                    yield from ( f'            {x}' for x in card.iterCardHTML() )
+                    yield '        </div>'
+                yield '    </div>'
+            yield '</div>'
+            yield '</div>'
+
+    def toHTMLList(
+        self
+    ) -> List[str]:
+        """
+        Returns contents of class as a formatted HTML block
+
+        Returns
+        -------
+        html_tags : `List[str]`
+            A list of strings representing the contained HTML
+        """
+        return list(self.iterHTML())
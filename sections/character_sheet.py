@@ -3,7 +3,7 @@ Class used to create the introduction section for a system
 """
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
-from typing import List
+from typing import List, Iterator
 from utils.assets import AssetManager
 import os
 
@@ -22,32 +22,9 @@ class CharacterSheet:
         system : `ContentManager`
             The system this section is a part of
         """
-        # A list of HTML tags to append to a host document
-        self.__html = []
+        # Keep a reference to the parent system for rendering
+        self.__system = system
 
-        # Build out cover page here
-        self.__html += self.__cover_page()
-
-        # Build out HTML here
-        self.__html.append('<div class="section">')
-        self.__html += [
-            f'    <img src="{CharacterSheet.__am.get("logo")}" style="padding: 0px; float: left;"/>',
-            '     <h2 class="nopad" style="font-size: 44pt; padding-top: 24pt; text-align: right;">Character Sheet</h2>'
-        ]
-        self.__html += self.__char_info_block()
-        self.__html += self.__bg_info_block()
-        self.__html += self.__flavor_section()
-        self.__html += self.__notes_section()
-        self.__html += self.__stats_block()
-        self.__html += self.__skills_block()
-        self.__html += self.__abilities_block()
-        self.__html += self.__equipment_block()
-        self.__html.append(f'    {"</br>"*2}')
-        self.__html += self.__item_section()
-        self.__html.append(f'    {"</br>"*4}')
-        self.__html += self.__technique_section()
-        self.__html.append('</div>')
-    
     def __cover_page(self):
         return [
             f'   <strong style="font-size: 16pt;">{"&emsp;"*10}Filling Out Your Character Sheet</strong>',
@@ -491,6 +468,40 @@ class CharacterSheet:
             '    </div>',
         ]
     
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
+        # Build out cover page here
+        yield from self.__cover_page()
+
+        # Build out HTML here
+        yield '<div class="section">'
+        yield from [
+            f'    <img src="{CharacterSheet.__am.get("logo")}" style="padding: 0px; float: left;"/>',
+            '     <h2 class="nopad" style="font-size: 44pt; padding-top: 24pt; text-align: right;">Character Sheet</h2>'
+        ]
+        yield from self.__char_info_block()
+        yield from self.__bg_info_block()
+        yield from self.__flavor_section()
+        yield from self.__notes_section()
+        yield from self.__stats_block()
+        yield from self.__skills_block()
+        yield from self.__abilities_block()
+        yield from self.__equipment_block()
+        yield f'    {"</br>"*2}'
+        yield from self.__item_section()
+        yield f'    {"</br>"*4}'
+        yield from self.__technique_section()
+        yield '</div>'
+
     def toHTMLList(
         self
     ) -> List[str]:
@@ -502,4 +513,4 @@ class CharacterSheet:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
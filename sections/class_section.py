@@ -5,7 +5,7 @@ Class used to create a section explaining and listing out classes
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
 from obj_classes.data_manager import DataManager
-from typing import List
+from typing import List, Iterator
 import os
 
 class ClassSection:
@@ -26,19 +26,31 @@ class ClassSection:
         data : `DataManager`
             The data for the class, needed load in the skills for the section
         """
-        # A list of HTML tags to append to a host document
-        self.__html = []
+        # Keep references to the parent system and data for rendering
+        self.__system = system
+        self.__data = data
 
         # Get TOC data from parent
         self.__contents = system.getContents()
 
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
         # Build out HTML here
         # ======================================================================
         # = Skills Section
         # ======================================================================
-        self.__html.append('<div class="section">') 
-        self.__html.append(f'    {self.__contents.single("classes")}')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield '<div class="section">'
+        yield f'    {self.__contents.single("classes")}'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             <p>Classes in LINAS can be thought of more as templates rather than 
             hard enforced and certainly do not represent all the choices for
@@ -57,16 +69,16 @@ class ClassSection:
             in creating a character, not a container defining what the player
             can or can't do.</p>
             """
-        )]
+        ))
         
         # Page break
-        self.__html.append(f'    {system.pageBreak()}')
+        yield f'    {self.__system.pageBreak()}'
         
         # Load in skills
-        self.__html += [ f'    {x.replace("ZCustom","Custom")}' for x in 
-            data.typeToHTMLList('classes')
-        ]
-        self.__html.append('</div>')
+        yield from ( f'    {x.replace("ZCustom","Custom")}' for x in
+            self.__data.iterHTML('classes')
+        )
+        yield '</div>'
 
     def toHTMLList(
         self
@@ -79,4 +91,4 @@ class ClassSection:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
@@ -4,7 +4,7 @@ If you need specialized combat; you'll need to create a new one
 """
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
-from typing import List
+from typing import List, Iterator
 
 class CombatSystem:
     def __init__(
@@ -21,16 +21,27 @@ class CombatSystem:
         system : `ContentManager`
             The system this section is a part of
         """
-        # A list of HTML tags to append to a host document
-        self.__html = []
+        # Keep references to the parent system for rendering
+        self.__system = system
 
         # Get TOC data from parent
         self.__contents = system.getContents()
 
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
         # Build out HTML here
-        self.__html.append('<div class="section">') 
-        self.__html.append(f'    {self.__contents.single("combat")}')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield '<div class="section">'
+        yield f'    {self.__contents.single("combat")}'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Combat is one area of the system in which special attention was paid.
             The reason being that many systems I've played in the past (including
@@ -42,9 +53,9 @@ class CombatSystem:
             leads to the slowdown. That being said, battle phases are usually very
             short and the flow of battle can be described below.
             """
-        )]
-        self.__html.append('    <u><h3>Pre-Battle</h3></u>')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield '    <u><h3>Pre-Battle</h3></u>'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
              All entities roll 1d6 for initiative (both enemies and party members).
              The speed stat is added to each entity's dice roll and turn order
@@ -79,9 +90,9 @@ class CombatSystem:
              immediately interrupting the entity with a score of 7; even though
              their turn was next.</i>
             """
-        )]
-        self.__html.append('    <u><h3>During Battle</h3></u>')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield '    <u><h3>During Battle</h3></u>'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Each entity gets 1 move and 1 action during their battle round by
             default. Some  abilities or items may change this however. An entity
@@ -96,18 +107,18 @@ class CombatSystem:
             movement. This includes: using items, using skills and attacking,
             etc. Each of these  is outlined in more detail below.            
             """
-        )]
-        self.__html.append('    <u><h4>Using Items</h4></u>')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield '    <u><h4>Using Items</h4></u>'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             By default, an entity doesn't have to roll to use an item. The item
             is simplyused, and any effects of the item go into place. However,
             some items do require a roll to be used and any items which require
             this will have the detailspertaining ot their roll listed on them.
             """
-        )]
-        self.__html.append('    <u><h4>Using Skills</h4></u>')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield '    <u><h4>Using Skills</h4></u>'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             There is virtually no difference between using skills inside battle
             vs. outside.The entity using the skill simply performs their 1d6
@@ -116,9 +127,9 @@ class CombatSystem:
             skills resolve see section 3 of this guide for a fullbreakdown of
             skill usage.
             """
-        )]
-        self.__html.append('    <u><h4>Attacking</h4></u>')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield '    <u><h4>Attacking</h4></u>'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Attacking is very similar to skill usage and uses the same flow
             regardless of whether using a technique or physical weapon.
@@ -182,9 +193,9 @@ class CombatSystem:
             goblin. However, since they failed, no damage is done. The mage still
             loses 1 TP for attempting the technique however.</i>
             """
-        )]
-        self.__html.append('    <u><h3>Reacting To Attacks</h3></u>')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield '    <u><h3>Reacting To Attacks</h3></u>'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             If the target's speed is higher than the attacker's speed, they have
             the option to react to the attack. They can either guard, in which
@@ -219,9 +230,9 @@ class CombatSystem:
             armor has 4 points of armor left for the round and the swordsman
             in chainmail's armor is exhausted for the round. </i>
             """
-        )]
-        self.__html.append('    <u><h3>Adjusted Speed</h3></u>')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield '    <u><h3>Adjusted Speed</h3></u>'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Strength and speed share a unique relationship among stats through
             the calculation of speed penalties for weapons and armor. A
@@ -244,9 +255,9 @@ class CombatSystem:
             heavy hitting attacks easier; effectively making life much harder
             for them.
             """
-        )]
-        self.__html.append('    <u><h3>Destroying The Environment</h3></u>')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield '    <u><h3>Destroying The Environment</h3></u>'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             As a general rule; rocks, trees, and other obstacles can be destroyed
             by attacking them as well as by certain techniques and abilities. Also
@@ -268,9 +279,9 @@ class CombatSystem:
             example is just that, an example at as with most things in the system
             what happens is largely up to the DM</i>
             """
-        )]
-        self.__html.append('    <u><h3>Resolving Combat</h3></u>')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield '    <u><h3>Resolving Combat</h3></u>'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Combat ends when one side has either been completely immobilized in
             some way or willingly surrenders (in some cases this isn't an option).
@@ -284,8 +295,8 @@ class CombatSystem:
             coming to an end or whether the party is able to continue their journey
             i.e. being captured or thrown in prison. 
             """
-        )]
-        self.__html.append("</div>")
+        ))
+        yield "</div>"
 
     def toHTMLList(
         self
@@ -298,4 +309,4 @@ class CombatSystem:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
@@ -2,7 +2,7 @@
 Class used to create a table of contents for a pdf document
 """
 from __future__ import print_function, division
-from typing import List
+from typing import List, Iterator
 
 class ContentSection:
     def __init__(
@@ -44,30 +44,42 @@ class ContentSection:
         num = self.__contentMap[name.lower()]
         return f'<h2>{num}. {name.title()}</h2>'
 
-    def toHTMLList(
+    def iterHTML(
         self
-    ) -> List[str]:
+    ) -> Iterator[str]:
         """
-        Returns contents of class as a formatted HTML block
+        Yields contents of class as a formatted HTML block, one tag at a time
 
-        Returns
-        -------
-        html_tags : `List[str]`
-            A list of strings representing the contained HTML
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
         """
         # Start HTML
-        html = [
+        yield from [
             '<div class="section">',
             '    <h2>Table Of Contents</h2>',
             '    <ol>'
         ]
         # Add contents
         for c in self.contentList:
-            html.append(f'        <h3 class="nopad"><li>{c}</li></h3>')
+            yield f'        <h3 class="nopad"><li>{c}</li></h3>'
 
-        # Finalize HTML and return
-        html += [
+        # Finalize HTML
+        yield from [
             '    </ol>',
             '</div>'
         ]
-        return html
\ No newline at end of file
+
+    def toHTMLList(
+        self
+    ) -> List[str]:
+        """
+        Returns contents of class as a formatted HTML block
+
+        Returns
+        -------
+        html_tags : `List[str]`
+            A list of strings representing the contained HTML
+        """
+        return list(self.iterHTML())
\ No newline at end of file
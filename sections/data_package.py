@@ -1,17 +1,20 @@
 from __future__ import print_function, division
 from obj_classes.data_manager import DataManager
-from typing import List
+from utils.profiler import profiler
+from typing import List, Iterator
 class LINASDataPackage:
     def __init__(self, contents : List[str], data : DataManager):
         self.data : DataManager = data
         self.contents : List[str] = contents
     
-    def toHTMLList(self):
-        html = []
+    def iterHTML(self) -> Iterator[str]:
         for key in self.contents:
-            html += [ f'    {x}' for x in 
-                self.data.typeToHTMLList(key.lower())
-            ]
-        return html
+            yield from ( f'    {x}' for x in profiler.iterate(
+                f'section {key}',
+                self.data.iterHTML(key.lower())
+            ))
+
+    def toHTMLList(self) -> List[str]:
+        return list(self.iterHTML())
     
         
\ No newline at end of file
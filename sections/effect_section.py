@@ -4,7 +4,7 @@ Class used to create a section explaining and listing out skills for a system
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
 from obj_classes.data_manager import DataManager
-from typing import List
+from typing import List, Iterator
 import os
 
 class EffectSection:
@@ -24,19 +24,31 @@ class EffectSection:
         data : `DataManager`
             The data for the class, needed load in the skills for the section
         """
-        # A list of HTML tags to append to a host document
-        self.__html = []
+        # Keep references to the parent system and data for rendering
+        self.__system = system
+        self.__data = data
 
         # Get TOC data from parent
         self.__contents = system.getContents()
 
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
         # Build out HTML here
         # ======================================================================
         # = Skills Section
         # ======================================================================
-        self.__html.append('<div class="section">') 
-        self.__html.append(f'    {self.__contents.single("effects & status conditions")}')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield '<div class="section">'
+        yield f'    {self.__contents.single("effects & status conditions")}'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Effects and status conditions are temporary conditions which alter an
             entity's abilities. The effect may be short term, lasting a single battle
@@ -45,16 +57,16 @@ class EffectSection:
             are determined by the DM and as always the DM has the freedom to define
             new effects or to modify existing effects as needed.
             """
-        )]
+        ))
         
         # Page break
-        self.__html.append(f'    {system.pageBreak()}')
+        yield f'    {self.__system.pageBreak()}'
         
         # Load in skills
-        self.__html += [ f'    {x}' for x in 
-            data.typeToHTMLList('effects')
-        ]
-        self.__html.append('</div>')
+        yield from ( f'    {x}' for x in
+            self.__data.iterHTML('effects')
+        )
+        yield '</div>'
 
     def toHTMLList(
         self
@@ -67,4 +79,4 @@ class EffectSection:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
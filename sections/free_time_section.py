@@ -4,7 +4,7 @@ Class used to create the free time section for a system, defines what players ca
 """
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
-from typing import List
+from typing import List, Iterator
 
 class FreeTimeSection:
     def __init__(
@@ -21,16 +21,27 @@ class FreeTimeSection:
         system : `ContentManager`
             The system this section is a part of
         """
-        # A list of HTML tags to append to a host document
-        self.__html = []
+        # Keep references to the parent system for rendering
+        self.__system = system
 
         # Get TOC data from parent
         self.__contents = system.getContents()
 
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
         # Build out HTML here
-        self.__html.append('<div class="section">') 
-        self.__html.append(f'    {self.__contents.single("free time")}')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield '<div class="section">'
+        yield f'    {self.__contents.single("free time")}'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Free time is time between battles or events in the campaign where the
             players are free to explore and engage in events or activities which
@@ -45,9 +56,9 @@ class FreeTimeSection:
             other as well as the surrounding environment outside of a battle
             setting.  Below is a list of some common free-time activities:
             """
-        )]
-        self.__html.append("    <h3><u>Training</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield "    <h3><u>Training</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Characters can train in order to level up physical skills and stats.
             For example, a fighter might train endurance by sitting under a
@@ -56,9 +67,9 @@ class FreeTimeSection:
             to practice their sword stances or attacks or a blacksmith taking
             some time off to work in the town's forge.
             """
-        )]
-        self.__html.append("    <h3><u>Studying</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield "    <h3><u>Studying</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """            
             Similar to training; studying can learn new skills or techniques either by
             reading books or by training with an NPC who specializes in the
@@ -68,9 +79,9 @@ class FreeTimeSection:
             unwanted one, both will disappear, freeing up the skill points for
             later.
             """
-        )]
-        self.__html.append("    <h3><u>Shopping</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield "    <h3><u>Shopping</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """ 
             As the name suggests, this would be visiting various shops to browse
             items. To make things interesting; the DM might consider doing things
@@ -81,9 +92,9 @@ class FreeTimeSection:
             case the campaign's environment or circumstances make certain items
             more valuable than others.
             """
-        )]
-        self.__html.append("    <h3><u>Information Gathering</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield "    <h3><u>Information Gathering</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """ 
             Gathering information is extremely
             important, especially in cases where none of the party members have any
@@ -92,9 +103,9 @@ class FreeTimeSection:
             obstacles which may appear later and could help avoid nasty surprises.
             <p style="page-break-before: always;"></p>
             """
-        )]
-        self.__html.append("    <h3><u>Sightseeing</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield "    <h3><u>Sightseeing</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """ 
             This primarily refers to exploring the area in which the party is
             currently resting in. This could involve visiting bars to gamble or
@@ -104,9 +115,9 @@ class FreeTimeSection:
             being a purely functional activity and it is up to the DM and players
             to determine how valuable the time spent sightseeing truly is.
             """
-        )]
-        self.__html.append("    <h3><u>Side Quests</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield "    <h3><u>Side Quests</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """ 
             During free time activities, one of the party members may stumble
             across the opportunity for a side quest. That is, a quest not related
@@ -154,9 +165,10 @@ class FreeTimeSection:
             activity during a given free-time space. Although as always; the DM
             may choose to allow more/less free time activities as they see fit.
             """
-        )]
-        self.__html.append("</div>")
+        ))
+        yield "</div>"
 # ================================================================================
+
     def toHTMLList(
         self
     ) -> List[str]:
@@ -168,4 +180,4 @@ class FreeTimeSection:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
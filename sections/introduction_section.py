@@ -3,7 +3,7 @@ Class used to create the introduction section for a system
 """
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
-from typing import List
+from typing import List, Iterator
 
 class IntroductionSection:
     def __init__(
@@ -19,16 +19,27 @@ class IntroductionSection:
         system : `ContentManager`
             The system this section is a part of
         """
-        # A list of HTML tags to append to a host document
-        self.__html = []
+        # Keep references to the parent system for rendering
+        self.__system = system
 
         # Get TOC data from parent
         self.__contents = system.getContents()
 
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
         # Build out HTML here
-        self.__html.append('<div class="section">')
-        self.__html.append(f'    {self.__contents.single("introduction")}')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield '<div class="section">'
+        yield f'    {self.__contents.single("introduction")}'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Welcome to LINAS Tabletop; first I'd like to thank you for picking
             up our system and giving it a try. This system was developed by 
@@ -58,8 +69,8 @@ class IntroductionSection:
 
             <br/>Sincerely,<br/>Joseph Bourque
             """
-        )]
-        self.__html.append('</div>')
+        ))
+        yield '</div>'
 
     def toHTMLList(
         self
@@ -72,4 +83,4 @@ class IntroductionSection:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
@@ -4,7 +4,7 @@ Class used to create a section explaining and listing out items for a system
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
 from obj_classes.data_manager import DataManager
-from typing import List
+from typing import List, Iterator
 from utils.assets import AssetManager
 import os
 
@@ -25,19 +25,31 @@ class ItemSection:
         data : `DataManager`
             The data for the class, needed load in the skills for the section
         """
-        # A list of HTML tags to append to a host document
-        self.__html = []
+        # Keep references to the parent system and data for rendering
+        self.__system = system
+        self.__data = data
 
         # Get TOC data from parent
         self.__contents = system.getContents()
 
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
         # Build out HTML here
         # ======================================================================
         # = Skills Section
         # ======================================================================
-        self.__html.append('<div class="section">') 
-        self.__html.append(f'    {self.__contents.single("items")}')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield '<div class="section">'
+        yield f'    {self.__contents.single("items")}'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             This section contains a list of items for the system. As with most
             things in the system; this shouldn't be considered an absolute list as
@@ -263,17 +275,17 @@ class ItemSection:
             up to the DM and players to work out what exactly about the equipment in question 
             can be modified but the above are good guidelines if you're not sure where to start.
             """
-        )]
+        ))
 
         # Page break
-        self.__html.append(f'    {system.pageBreak()}')
+        yield f'    {self.__system.pageBreak()}'
 
         # Load in skills
-        self.__html += [ f'    {x}' for x in 
-            data.typeToHTMLList('items')
-        ]
+        yield from ( f'    {x}' for x in
+            self.__data.iterHTML('items')
+        )
 
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             <h3 style="page-break-before: always;">Creating Custom Items</h3>
             Items are probably one of the areas which will receive custom entries most often. 
@@ -297,9 +309,9 @@ class ItemSection:
                 <li>Add 1 level for every 2 points in speed penalty</li>
             </ol>
             """
-        )]
+        ))
         
-        self.__html.append('</div>')
+        yield '</div>'
 
     def toHTMLList(
         self
@@ -312,4 +324,4 @@ class ItemSection:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
@@ -4,7 +4,7 @@ Class used to create a section explaining and listing out skills for a system
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
 from obj_classes.data_manager import DataManager
-from typing import List
+from typing import List, Iterator
 import os
 import re
 
@@ -26,19 +26,31 @@ class LangRaceSection:
         data : `DataManager`
             The data for the class, needed load in the skills for the section
         """
-        # A list of HTML tags to append to a host document
-        self.__html = []
+        # Keep references to the parent system and data for rendering
+        self.__system = system
+        self.__data = data
 
         # Get TOC data from parent
         self.__contents = system.getContents()
 
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
         # Build out HTML here
         # ======================================================================
         # = Languages & Races Section
         # ======================================================================
-        self.__html.append('<div class="section">') 
-        self.__html.append(f'    {self.__contents.single("languages & races")}')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield '<div class="section">'
+        yield f'    {self.__contents.single("languages & races")}'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             LINAS includes several races to choose from . Some are traditional
             fantasy tropes such as elves and dwarves and some such as the Mu are
@@ -50,20 +62,20 @@ class LangRaceSection:
             their experience and background and also so long as it's OK with
             the DM.
             """
-        )]
-        self.__html.append("""<u><h3>Languages</h3></u>""")
+        ))
+        yield """<u><h3>Languages</h3></u>"""
         
         # Load in languages
-        self.__html += [ f'    {x}' for x in 
-            data.typeToHTMLList('languages')
-        ]
-        self.__html.append("""
+        yield from ( f'    {x}' for x in
+            self.__data.iterHTML('languages')
+        )
+        yield """
         <u><h3 style="page-break-before: always;">Races</h3></u>
-        """)
-        self.__html += [ f'    {x.replace("ZCustom","Custom")}' for x in 
-            data.typeToHTMLList('races')
-        ]
-        self.__html.append('</div>')
+        """
+        yield from ( f'    {x.replace("ZCustom","Custom")}' for x in
+            self.__data.iterHTML('races')
+        )
+        yield '</div>'
 
     def toHTMLList(
         self
@@ -76,4 +88,4 @@ class LangRaceSection:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
@@ -3,7 +3,7 @@ Class used explain the basics of character creation for a system
 """
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
-from typing import List
+from typing import List, Iterator
 
 class NewPlayerSetupSection:
     def __init__(
@@ -19,16 +19,27 @@ class NewPlayerSetupSection:
         system : `ContentManager`
             The system this section is a part of
         """
-        # A list of HTML tags to append to a host document
-        self.__html = []
+        # Keep references to the parent system for rendering
+        self.__system = system
 
         # Get TOC data from parent
         self.__contents = system.getContents()
 
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
         # Build out HTML here
-        self.__html.append('<div class="section">')
-        self.__html.append(f'    {self.__contents.single("new player setup")}')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield '<div class="section">'
+        yield f'    {self.__contents.single("new player setup")}'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Another one of the major goals of this system is to keep character
             creation as  flexible and open as possible. with this in mind,
@@ -39,9 +50,9 @@ class NewPlayerSetupSection:
             sheets or by sending a link to the character sheet file. Players
             should fill out the sheet in the following way:
             """
-        )]
-        self.__html.append("    <h3><u>1. Create Your Character's Background:</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield "    <h3><u>1. Create Your Character's Background:</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             The first step in character creation should be to flesh out each
             player's character as a living entity. A character's race, stats,
@@ -56,9 +67,9 @@ class NewPlayerSetupSection:
             will be vital for filling out the later sections of the character
             sheet.
             """
-        )]
-        self.__html.append("    <h3><u>2. Fill Out Flavor Section:</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield "    <h3><u>2. Fill Out Flavor Section:</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             The second section players should focus pretty heavily on is the
             flavor section. While this section is mainly just for fun and to add
@@ -92,10 +103,10 @@ class NewPlayerSetupSection:
             quick reminder of the things which are important to their character
             in order to decide how/when to roll for things.
             """
-        )]
+        ))
 
-        self.__html.append("    <h3><u>3. Choose a Race and Class</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield "    <h3><u>3. Choose a Race and Class</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             After players decide on their character's background, the next step
             is to  choose a race and class for the character. The race and class
@@ -109,9 +120,9 @@ class NewPlayerSetupSection:
             sections be used as a template  (respectively) as this will help
             ensure that the created content is somewhat balanced.
             """
-        )]
-        self.__html.append("    <h3><u>4. Fill out Stats Section</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield "    <h3><u>4. Fill out Stats Section</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Filling out the stats section may look intimidating or complex at first
             glance, however the calculations are fairly simple and so it's best to
@@ -155,9 +166,9 @@ class NewPlayerSetupSection:
             stats and pick stats which fit for your race and your character's training
             not ones which will do the most damage.
             """
-        )]
-        self.__html.append('    <h3 style="page-break-before: always;"><u>5. Fill out Abilities Section</u></h3>')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield '    <h3 style="page-break-before: always;"><u>5. Fill out Abilities Section</u></h3>'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Each race has two custom abilities: one active ability which the player
             must consciously elect to use and one passive ability which is in play at
@@ -174,9 +185,9 @@ class NewPlayerSetupSection:
             Additionally the DM may elect to give the character a negative passive ability
             if it fits with their character (see vampire race for example)
             """
-        )]
-        self.__html.append("    <h3><u>6. Fill out Skills Section</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield "    <h3><u>6. Fill out Skills Section</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Filling out skills section is much more straightforward than filling out
             stats. Simply copy the skills and the corresponding values listed under
@@ -188,9 +199,9 @@ class NewPlayerSetupSection:
             may be allocated by the DM, especially in cases where the characters
             are meant to be seasoned warriors or adventurers vs. just starting out.
             """
-        )]
-        self.__html.append("    <h3><u>7. Fill Out Techniques Section</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield "    <h3><u>7. Fill Out Techniques Section</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Techniques are usually related to a character's class and encompass
             both spells and battle techniques. Depending on your class you may
@@ -202,9 +213,9 @@ class NewPlayerSetupSection:
             of taking one or more with the DM. Especially if they feel like their
             character should be able to use it.
             """
-        )]
-        self.__html.append("    <h3><u>8. Fill Out Equipment Section</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield "    <h3><u>8. Fill Out Equipment Section</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             If your class lists out any special weapons or armor look it up and
             fill out the section on the character sheet dealing with equipment.
@@ -216,9 +227,9 @@ class NewPlayerSetupSection:
             box and record the bonus listed on the weapon. Likewise if your character
             plans to use a shield.
             """
-        )]
-        self.__html.append('    <h3 style="page-break-before: always;"><u>9. Take/Buy Items</u></h3>')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield '    <h3 style="page-break-before: always;"><u>9. Take/Buy Items</u></h3>'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Start by taking any specialized items needed by your class. This
             includes things like lockpicks, musical instruments, crafting tools,
@@ -237,9 +248,9 @@ class NewPlayerSetupSection:
             their character a bit of an edge such as buying a better weapon than the one
             provided by their class.
             """
-        )]
-        self.__html.append("    <h3><u>10. Additional Items and finishing Touches</u></h3>")
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield "    <h3><u>10. Additional Items and finishing Touches</u></h3>"
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             The goal here is to polish each character and make sure nothing feels
             off or incomplete. To put it another way; this is where you polish
@@ -249,7 +260,7 @@ class NewPlayerSetupSection:
             to ensure the campaign is satisfying and  adequately takes advantage
             of each character's skill set.
             """
-        )]
+        ))
 
     def toHTMLList(
         self
@@ -262,4 +273,4 @@ class NewPlayerSetupSection:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
@@ -4,7 +4,8 @@ Class used to create a section explaining and listing out skills for a system
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
 from obj_classes.data_manager import DataManager
-from typing import List
+from utils.dice import OUTCOMES, skillOutcomes
+from typing import List, Iterator
 import os
 
 class SkillSection:
@@ -24,19 +25,63 @@ class SkillSection:
         data : `DataManager`
             The data for the class, needed load in the skills for the section
         """
-        # A list of HTML tags to append to a host document
-        self.__html = []
+        # Keep references to the parent system and data for rendering
+        self.__system = system
+        self.__data = data
 
         # Get TOC data from parent
         self.__contents = system.getContents()
 
+    def __oddsTable(self) -> List[str]:
+        spacing="13%"
+        html = [
+            '<div class="container nopad" style="margin:10px;">',
+            '    <div class="cont-inner" style="padding-right: 0px;">',
+            '        <div>',
+            f'            <span class="rel" style="width: {spacing};"><strong>Modifier</strong></span>',
+        ]
+        html += [
+            f'            <span class="rel" style="width: {spacing};"><strong>{x}</strong></span>'
+            for x in OUTCOMES
+        ]
+        html += [
+            '        </div>',
+            '        <hr style="border: 1px solid #dddddd;">',
+        ]
+        for modifier in range(-2, 3):
+            html += [
+                '        <div>',
+                f'            <span class="rel" style="width: {spacing};">{modifier:+d}</span>',
+            ]
+            html += [
+                f'            <span class="rel" style="width: {spacing};">{float(x):.1%}</span>'
+                for x in skillOutcomes(modifier)
+            ]
+            html.append('        </div>')
+        html += [
+            '    </div>',
+            '</div>',
+        ]
+        return html
+
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
         # Build out HTML here
         # ======================================================================
         # = Skills Section
         # ======================================================================
-        self.__html.append('<div class="section">') 
-        self.__html.append(f'    {self.__contents.single("skills")}')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield '<div class="section">'
+        yield f'    {self.__contents.single("skills")}'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             One of the major goals for this system is to present skill usage
             in a way which is flexible and open. This means that the skills
@@ -161,17 +206,22 @@ class SkillSection:
             It is important that both the DM and the players understand the
             restrictions put on both skills and stats moving forward as they 
             play a crucial role in keeping the game balanced
+
+            The table below lists the exact odds of each outcome for every
+            skill modifier. DM bonuses and penalties stack with the skill
+            modifier, e.g. a +1 skill used in the rain rolls on the +0 row.
             """
-        )]
+        ))
+        yield from ( f'    {x}' for x in self.__oddsTable() )
         
         # Page break
-        self.__html.append(f'    {system.pageBreak()}')
+        yield f'    {self.__system.pageBreak()}'
         
         # Load in skills
-        self.__html += [ f'    {x}' for x in 
-            data.typeToHTMLList('skills')
-        ]
-        self.__html.append('</div>')
+        yield from ( f'    {x}' for x in
+            self.__data.iterHTML('skills')
+        )
+        yield '</div>'
 
     def toHTMLList(
         self
@@ -184,4 +234,4 @@ class SkillSection:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
@@ -4,7 +4,7 @@ Class used to create a section explaining and listing out stats for a system
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
 from obj_classes.data_manager import DataManager
-from typing import List
+from typing import List, Iterator
 
 class StatSection:
     def __init__(
@@ -23,16 +23,28 @@ class StatSection:
         data : `DataManager`
             The data for the class, needed load in the stats for the section
         """
-        # A list of HTML tags to append to a host document
-        self.__html = []
+        # Keep references to the parent system and data for rendering
+        self.__system = system
+        self.__data = data
 
         # Get TOC data from parent
         self.__contents = system.getContents()
 
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
         # Build out HTML here
-        self.__html.append('<div class="section">')
-        self.__html.append(f'    {self.__contents.single("stats")}')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield '<div class="section">'
+        yield f'    {self.__contents.single("stats")}'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             LINAS, in general tries to keep it's scale for stat allocation fairly
             low. As stated in the introduction, the main drive for this is to
@@ -40,18 +52,18 @@ class StatSection:
             be represented by numbers or by blocks (&#x25A1). For the fantasy
             system; the following stats are defined:
             """
-        )]
+        ))
 
-        self.__html.append('    <ul>')
-        self.__html += [ 
-            f'        <p><li>{x}</li></p>' for x in  data.typeToHTMLList(
+        yield '    <ul>'
+        yield from (
+            f'        <p><li>{x}</li></p>' for x in  self.__data.iterHTML(
                 'stats'
-        )]
-        self.__html.append('    </ul>')
+        ))
+        yield '    </ul>'
 
-        self.__html.append('    <p style="page-break-before: always;"><p/>')
+        yield '    <p style="page-break-before: always;"><p/>'
 
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             For the most part, a player can put points into whichever stats they
             see fit. However, that being said; there are a few restrictions:<br/>
@@ -74,9 +86,9 @@ class StatSection:
             to try and keep the system from being too broken i.e. having mages
             equipped in steel plate.
             """
-        )]
-        self.__html.append('    <h4>Using Stats Outside Battle</h4>')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        ))
+        yield '    <h4>Using Stats Outside Battle</h4>'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             For the most part, stats are meant for doing battle calculations.
             However, LINAS likes to reward creative thinking and so there may
@@ -94,8 +106,8 @@ class StatSection:
             them. However, it should be noted that this is a viable option
             when creating campaigns in LINAS
             """
-        )]
-        self.__html.append('</div>')
+        ))
+        yield '</div>'
 
     def toHTMLList(
         self
@@ -108,4 +120,4 @@ class StatSection:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
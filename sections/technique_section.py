@@ -4,7 +4,7 @@ Class used to create a section explaining and listing out abilities for a system
 from __future__ import print_function, division
 from obj_classes.content_manager import ContentManager
 from obj_classes.data_manager import DataManager
-from typing import List
+from typing import List, Iterator
 from utils.assets import AssetManager
 import os
 
@@ -27,19 +27,31 @@ class TechniqueSection:
         data : `DataManager`
             The data for the class, needed load in the abilities for the section
         """
-        # A list of HTML tags to append to a host document
-        self.__html = []
+        # Keep references to the parent system and data for rendering
+        self.__system = system
+        self.__data = data
 
         # Get TOC data from parent
         self.__contents = system.getContents()
 
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
         # Build out HTML here
         # ======================================================================
         # = Spell Section
         # ======================================================================
-        self.__html.append('<div class="section">') 
-        self.__html.append(f'    {self.__contents.single("techniques")}')
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield '<div class="section">'
+        yield f'    {self.__contents.single("techniques")}'
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             Spells and battle skills can be thought of as special abilities which entities
             can use to attack with in lieu of weapons. Additionally, techniques can be
@@ -170,18 +182,18 @@ class TechniqueSection:
             once forgotten, all the time spent training that technique will be lost. If you decide
             to re-learn the technique at a later time; you will have to start from scratch.
             """
-        )]
+        ))
         
         # Page break
-        self.__html.append(f'    {system.pageBreak()}')
+        yield f'    {self.__system.pageBreak()}'
         
         # Load in techniques
-        self.__html += [ f'    {x}' for x in 
-            data.typeToHTMLList('techniques')
-        ]
+        yield from ( f'    {x}' for x in
+            self.__data.iterHTML('techniques')
+        )
 
         # Suffix
-        self.__html += [ f'    {x}' for x in system.collapse(
+        yield from ( f'    {x}' for x in self.__system.collapse(
             """
             <h3>Creating Custom Techniques</h3>
 
@@ -246,9 +258,9 @@ class TechniqueSection:
                 <li>+1 level if technique targets friend and foe</li>
             </ol>
             """
-        )]
+        ))
 
-        self.__html.append('</div>')
+        yield '</div>'
 
     def toHTMLList(
         self
@@ -261,4 +273,4 @@ class TechniqueSection:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return self.__html
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
@@ -2,7 +2,7 @@
 Class used to create title pages for PDF documents
 """
 from __future__ import print_function, division
-from typing import List
+from typing import List, Iterator
 class TitleSection:
     """
     Class used to create title pages for PDF documents
@@ -26,6 +26,24 @@ class TitleSection:
         self.author = author
         self.revision = f"{revision:3.2f}"
     
+    def iterHTML(
+        self
+    ) -> Iterator[str]:
+        """
+        Yields contents of class as a formatted HTML block, one tag at a time
+
+        Yields
+        ------
+        html_tag : `str`
+            A single string representing a line of the contained HTML
+        """
+        yield from [
+            '<div class="title">',
+            f'    <h1>{self.title} (v{self.revision})</h1>',
+            f'    <h3>Written By: {self.author}</h3>',
+            f'</div>'
+        ]
+
     def toHTMLList(
         self
     ) -> List[str]:
@@ -37,9 +55,4 @@ class TitleSection:
         html_tags : `List[str]`
             A list of strings representing the contained HTML
         """
-        return [
-            '<div class="title">',
-            f'    <h1>{self.title} (v{self.revision})</h1>',
-            f'    <h3>Written By: {self.author}</h3>',
-            f'</div>'
-        ]
\ No newline at end of file
+        return list(self.iterHTML())
\ No newline at end of file
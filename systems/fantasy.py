@@ -26,6 +26,7 @@ from   obj_classes.linas_item              import LINASItem
 from   obj_classes.linas_technique         import LinasTechnique
 from   obj_classes.linas_class             import LINASClass, ItemRecord
 from   obj_classes.data_collection         import DataCollection
+from   utils.snapshot_cache                import snapshots
 
 class Fantasy (ContentManager):
     def __init__(
@@ -58,9 +59,42 @@ class Fantasy (ContentManager):
         # Get contents from super class
         self.__contents = self.getContents()
 
-        # Get HTML from super class
-        self.__html = self.toHTMLList()
+        # Data is only built (or loaded from its snapshot) the first time it is
+        # accessed so targets which never render the handbook don't pay for it
+        self.setData(lambda: snapshots.load(self.__buildData))
 
+        # ======================================================================
+        # = Add Sections To System Here
+        # ======================================================================
+        # NOTE: Sections are added as functions so they are only created once
+        #       they are needed
+        self.addContent(lambda: IntroductionSection(self))
+        self.addContent(lambda: StatSection(self, self.getData()))
+        self.addContent(lambda: SkillSection(self, self.getData()))
+        self.addContent(lambda: CombatSystem(self))
+        self.addContent(lambda: FreeTimeSection(self))
+        self.addContent(lambda: NewPlayerSetupSection(self))
+        self.addContent(lambda: LangRaceSection(self, self.getData()))
+        self.addContent(lambda: ClassSection(self, self.getData()))
+        self.addContent(lambda: TechniqueSection(self, self.getData()))
+        self.addContent(lambda: AbilitySection(self, self.getData()))
+        self.addContent(lambda: EffectSection(self, self.getData()))
+        self.addContent(lambda: ItemSection(self, self.getData()))
+        # TODO: "Entities"
+        # TODO: "Campaigns"
+        # TODO: "DM Tools (Character Sheets, Quick References, etc.)"
+
+    def __buildData(
+        self
+    ) -> DataManager:
+        """
+        Builds the data manager holding all of the data for the system
+
+        Returns
+        -------
+        data : `DataManager`
+            The data manager for the system
+        """
         # ======================================================================
         # = Set up templates used by data manager
         # ======================================================================
@@ -4097,22 +4131,4 @@ class Fantasy (ContentManager):
         # ======================================================================
         # = End Post-Process Data Definitions
         # ======================================================================
-
-        # ======================================================================
-        # = Add Sections To System Here
-        # ======================================================================
-        self.addContent(IntroductionSection(self))
-        self.addContent(StatSection(self, self.__dataManager))
-        self.addContent(SkillSection(self, self.__dataManager))
-        self.addContent(CombatSystem(self))
-        self.addContent(FreeTimeSection(self))
-        self.addContent(NewPlayerSetupSection(self))
-        self.addContent(LangRaceSection(self, self.__dataManager))
-        self.addContent(ClassSection(self, self.__dataManager))
-        self.addContent(TechniqueSection(self, self.__dataManager))
-        self.addContent(AbilitySection(self, self.__dataManager))
-        self.addContent(EffectSection(self, self.__dataManager))
-        self.addContent(ItemSection(self, self.__dataManager))
-        # TODO: "Entities"
-        # TODO: "Campaigns"
-        # TODO: "DM Tools (Character Sheets, Quick References, etc.)"
\ No newline at end of file
+        return self.__dataManager
@@ -0,0 +1,49 @@
+"""
+Tests for BuildGraph's section level rebuilds
+"""
+from __future__ import print_function, division
+from obj_classes.build_graph import BuildGraph
+from sections.content_section import ContentSection
+from sections.title_section import TitleSection
+from systems.fantasy import Fantasy
+from typing import List
+import hashlib
+import inspect
+import pytest
+
+def build(
+    system    : Fantasy,
+    statePath : str
+) -> List[str]:
+    """
+    Runs one build of the system's graph and returns the nodes it rendered
+    """
+    graph = BuildGraph(system, statePath)
+    rendered = []
+    for name, digest, lines in graph.iterChunks():
+        if lines is not None:
+            html = '\n'.join(lines)
+            graph.record(name, hashlib.sha1(html.encode('utf-8')).hexdigest())
+            rendered.append(name)
+    graph.save()
+    return rendered
+
+@pytest.mark.parametrize('shared', [ TitleSection, ContentSection ])
+def test_shared_section_edit_rerenders_every_chunk(tmp_path, monkeypatch, shared):
+    system = Fantasy()
+    statePath = str(tmp_path / 'handbook.json')
+    nodes = build(system, statePath)
+    assert len(nodes) == len(system.getSections()) + 1
+    assert build(system, statePath) == []
+
+    # Edit a copy of the shared section's source and hash that in its place
+    edited = tmp_path / 'edited.py'
+    with open(inspect.getsourcefile(shared), 'r') as fin:
+        edited.write_text(fin.read() + '\n# edited\n')
+    getsourcefile = inspect.getsourcefile
+    monkeypatch.setattr(
+        inspect,
+        'getsourcefile',
+        lambda obj: str(edited) if obj is shared else getsourcefile(obj)
+    )
+    assert build(system, statePath) == nodes
@@ -0,0 +1,22 @@
+"""
+Tests for the shared template expander
+"""
+from __future__ import print_function, division
+from obj_classes.linas_item import LINASItem
+from utils.templates import expandTemplate
+
+def test_variants_do_not_share_mutable_fields():
+    prototype = LINASItem(
+        name="{metal} Sword",
+        description="A sword forged from {metal}",
+        cost=10,
+        notes=["Two handed"],
+        template=[ { 'metal': x } for x in ( 'Iron', 'Steel', 'Silver' ) ]
+    )
+    variants = list(expandTemplate(prototype))
+    assert [ x.name for x in variants ] == [ 'Iron Sword', 'Steel Sword', 'Silver Sword' ]
+
+    variants[0].notes.append("Rusted")
+    assert variants[0].notes == [ "Two handed", "Rusted" ]
+    for sibling in variants[1:] + [ prototype ]:
+        assert sibling.notes == [ "Two handed" ]
@@ -1,4 +1,7 @@
 from __future__ import print_function, division
+from functools import lru_cache
+from typing import Tuple
+import hashlib
 import os
 import re
 
@@ -18,3 +21,48 @@ class AssetManager:
     
     def tag(self, name):
         return f'<img src="{self.get(name)}" {AssetManager.__icon}/>'
+
+@lru_cache(maxsize=None)
+def _readStyles(path : str, modified : float) -> Tuple[str, ...]:
+    with open(path, 'r') as fin:
+        return tuple( x.replace("\n","") for x in fin.readlines() )
+
+def loadStyles(path : str) -> Tuple[str, ...]:
+    """
+    Returns the lines of a stylesheet, read once and shared by every
+    PDFGenerator until the file changes
+
+    Parameters
+    ----------
+    path : `str`
+        Location of the stylesheet
+
+    Returns
+    -------
+    lines : `Tuple[str, ...]`
+        The lines of the stylesheet, without line endings
+    """
+    return _readStyles(path, os.path.getmtime(path))
+
+def assetsVersion(directory : str) -> str:
+    """
+    Returns a hash of the modification time and size of every asset, assets
+    are linked to rather than copied into rendered HTML so this is what tells
+    a changed image apart
+
+    Parameters
+    ----------
+    directory : `str`
+        Location of the assets
+
+    Returns
+    -------
+    version : `str`
+        A hex digest identifying the current assets
+    """
+    digest = hashlib.sha1()
+    if os.path.isdir(directory):
+        for name in sorted(os.listdir(directory)):
+            stat = os.stat(os.path.join(directory, name))
+            digest.update(f'{name}:{stat.st_mtime_ns}:{stat.st_size};'.encode('utf-8'))
+    return digest.hexdigest()
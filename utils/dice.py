@@ -0,0 +1,191 @@
+"""
+Functions used to compute the exact odds of dice rolls and skill roll outcomes
+"""
+from __future__ import print_function, division
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, Tuple, Union
+import re
+
+# Outcomes of a 1d6 skill roll, from a natural 1 to a natural 6
+OUTCOMES = [
+    'You fail, and...',
+    'You fail',
+    'You fail, but...',
+    'You succeed, but...',
+    'You succeed',
+    'You succeed, and...',
+]
+
+# Outcomes from this one (0-based) onwards are successes
+SUCCESS = 3
+
+_TERM = re.compile(r'([+-])?\s*(?:(\d*)d(\d+)|(\d+))', re.IGNORECASE)
+
+Modifier = Union[int, str]
+_Key = Tuple[int, Tuple[Tuple[int, int], ...]]
+
+@lru_cache(maxsize=None)
+def parseDice(
+    expression : str
+) -> _Key:
+    """
+    Parses a dice expression such as '2d6+1', 'd4' or '-1d4+2'
+
+    Parameters
+    ----------
+    expression : `str`
+        The expression to parse
+
+    Returns
+    -------
+    parsed : `Tuple[int, Tuple[Tuple[int, int], ...]]`
+        The sum of the constants and the dice as sorted (count, sides) pairs,
+        dice which are subtracted have a negative count
+    """
+    text = re.sub(r'\s*([+-])\s*', r'\1', expression.strip())
+    constant, dice, end = 0, [], 0
+    for match in _TERM.finditer(text):
+        if match.start() != end or (end and not match.group(1)):
+            break
+        end = match.end()
+        sign = -1 if match.group(1) == '-' else 1
+        if match.group(4) is not None:
+            constant += sign * int(match.group(4))
+        else:
+            count, sides = int(match.group(2) or 1), int(match.group(3))
+            if sides < 1:
+                raise ValueError(f'Dice need at least one side in "{expression}"')
+            dice.append((sign * count, sides))
+    if not text or end != len(text):
+        raise ValueError(f'Invalid dice expression "{expression}"')
+    return constant, tuple(sorted(dice))
+
+def _normalize(
+    modifiers : Tuple[Modifier, ...]
+) -> _Key:
+    """
+    Combines a stack of modifiers into a single key, so stacks adding up to
+    the same dice and constant share cached results
+    """
+    constant, dice = 0, []
+    for modifier in modifiers:
+        if isinstance(modifier, int):
+            constant += modifier
+            continue
+        value, parsed = parseDice(modifier)
+        constant += value
+        dice += parsed
+    return constant, tuple(sorted(dice))
+
+def _convolve(
+    a : Dict[int, int],
+    b : Dict[int, int]
+) -> Dict[int, int]:
+    out = {}
+    for x, countX in a.items():
+        for y, countY in b.items():
+            out[x + y] = out.get(x + y, 0) + countX * countY
+    return out
+
+@lru_cache(maxsize=None)
+def _counts(
+    key : _Key
+) -> Tuple[Dict[int, int], int]:
+    """
+    Returns how many ways each total can be rolled and the number of
+    possible rolls, built up one die at a time
+    """
+    constant, dice = key
+    counts, total = { constant: 1 }, 1
+    for count, sides in dice:
+        sign = -1 if count < 0 else 1
+        die = { sign * face: 1 for face in range(1, sides + 1) }
+        for _ in range(abs(count)):
+            counts = _convolve(counts, die)
+            total *= sides
+    return counts, total
+
+def distribution(
+    *modifiers : Modifier
+) -> Dict[int, Fraction]:
+    """
+    Returns the exact odds of every total a stack of dice expressions and
+    flat modifiers can add up to
+
+    Parameters
+    ----------
+    *modifiers : `Union[int, str]`
+        Flat modifiers and dice expressions to add up, e.g. '2d6', 1, '-1d4'
+
+    Returns
+    -------
+    odds : `Dict[int, Fraction]`
+        The chance of rolling each total, in increasing order of total
+    """
+    counts, total = _counts(_normalize(modifiers))
+    return { x: Fraction(counts[x], total) for x in sorted(counts) }
+
+@lru_cache(maxsize=None)
+def _outcomes(
+    key : _Key
+) -> Tuple[Fraction, ...]:
+    counts, total = _counts(key)
+    odds = [ 0 ] * len(OUTCOMES)
+    for roll in range(1, 7):
+        for modifier, count in counts.items():
+            # A natural 1 or 6 ignores modifiers, anything else is moved
+            # along the scale and stops at either end of it
+            if roll in (1, 6):
+                result = roll
+            else:
+                result = min(max(roll + modifier, 1), 6)
+            odds[result - 1] += count
+    return tuple(Fraction(x, total * 6) for x in odds)
+
+def skillOutcomes(
+    *modifiers : Modifier
+) -> Tuple[Fraction, ...]:
+    """
+    Returns the exact odds of each skill roll outcome (see OUTCOMES) for a
+    stack of modifiers, i.e. a skill modifier of +1 and a DM penalty of -1.
+    Results are cached, so repeated lookups only cost the parsing of the
+    modifiers.
+
+    Parameters
+    ----------
+    *modifiers : `Union[int, str]`
+        Flat modifiers and dice expressions added to the 1d6 roll
+
+    Returns
+    -------
+    odds : `Tuple[Fraction, ...]`
+        The chance of each outcome, from "you fail, and..." to
+        "you succeed, and..."
+    """
+    return _outcomes(_normalize(modifiers))
+
+def successChance(
+    *modifiers : Modifier
+) -> Fraction:
+    """
+    Returns the exact chance of a skill roll succeeding (rolling "you
+    succeed, but..." or better) for a stack of modifiers
+
+    Parameters
+    ----------
+    *modifiers : `Union[int, str]`
+        Flat modifiers and dice expressions added to the 1d6 roll
+
+    Returns
+    -------
+    chance : `Fraction`
+        The chance of success
+    """
+    return _success(_normalize(modifiers))
+
+@lru_cache(maxsize=None)
+def _success(
+    key : _Key
+) -> Fraction:
+    return sum(_outcomes(key)[SUCCESS:], Fraction(0))
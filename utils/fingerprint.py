@@ -0,0 +1,98 @@
+"""
+Functions used to fingerprint data and the code rendering it, so cached build
+outputs can tell when they are stale
+"""
+from __future__ import print_function, division
+from functools import lru_cache
+from typing import Any, List
+import hashlib
+import json
+import os
+
+# Bump to throw away every cached build output regardless of source changes
+VERSION = 1
+
+# Directories whose source decides what the data renders to
+_RENDER_SOURCES = ['obj_classes', 'utils']
+
+def slotNames(cls : type) -> List[str]:
+    """
+    Returns the attribute names of the slots declared by a class and its
+    bases. Private slots (i.e. DataCollection's children) are stored under
+    their mangled name, which getattr needs in place of the declared one.
+    """
+    names = []
+    for base in cls.__mro__:
+        slots = getattr(base, '__slots__', ())
+        for name in [ slots ] if isinstance(slots, str) else slots:
+            if name.startswith('__') and not name.endswith('__'):
+                name = f'_{base.__name__.lstrip("_")}{name}'
+            names.append(name)
+    return names
+
+def _canonical(value : Any) -> Any:
+    """
+    Converts a value into a structure of plain JSON types which only depends
+    on the value's contents, objects are expanded field by field
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [ _canonical(x) for x in value ]
+        if isinstance(value, (set, frozenset)):
+            items.sort(key=json.dumps)
+        return [ type(value).__name__, items ]
+    if isinstance(value, dict):
+        return [
+            'dict',
+            [ [ str(k), _canonical(value[k]) ] for k in sorted(value, key=str) ]
+        ]
+    fields = {
+        name: getattr(value, name)
+        for name in slotNames(type(value)) if hasattr(value, name)
+    }
+    fields.update(getattr(value, '__dict__', {}))
+    return [
+        f'{type(value).__module__}.{type(value).__qualname__}',
+        [ [ k, _canonical(fields[k]) ] for k in sorted(fields) ]
+    ]
+
+def fingerprint(value : Any) -> str:
+    """
+    Returns a stable hash of a value's contents
+
+    Parameters
+    ----------
+    value : `Any`
+        The value (usually a LINAS data object) to hash
+
+    Returns
+    -------
+    digest : `str`
+        A hex digest which only changes when the value's fields change
+    """
+    return hashlib.sha1(
+        json.dumps(_canonical(value), separators=(',', ':')).encode('utf-8')
+    ).hexdigest()
+
+@lru_cache(maxsize=None)
+def rendererVersion() -> str:
+    """
+    Returns a hash of the code used to render data, any change to the
+    rendering classes (or to VERSION) produces a new renderer version
+
+    Returns
+    -------
+    version : `str`
+        A hex digest identifying the current renderer
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    digest = hashlib.sha1(str(VERSION).encode('utf-8'))
+    for directory in _RENDER_SOURCES:
+        path = os.path.join(root, directory)
+        for name in sorted(os.listdir(path)):
+            if name.endswith('.py'):
+                with open(os.path.join(path, name), 'rb') as fin:
+                    digest.update(name.encode('utf-8'))
+                    digest.update(fin.read())
+    return digest.hexdigest()
@@ -0,0 +1,266 @@
+"""
+Records how long each stage of a build takes, written out as a Chrome trace
+"""
+from __future__ import print_function, division
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List
+import json
+import os
+import threading
+import time
+
+# Returned by span() while profiling is off, so disabled spans cost nothing
+_NULL = nullcontext()
+
+class Profiler:
+    """
+    Records how long each stage of a build takes as nested spans. Spans are
+    written out in the Chrome trace event format (open the file in
+    chrome://tracing or https://ui.perfetto.dev) and summed up per stage in
+    a table.
+
+    HTML is generated lazily and consumed while it is piped to wkhtmltopdf,
+    so spans wrapping a generator (see iterate()) only count the time spent
+    inside the generator. The time spent by whatever consumes it is left
+    out, which keeps a section's time from including the pdf write.
+
+    Each stage's self time is its time minus the time of the spans nested in
+    it on the same thread, the summary is sorted by self time so the stages
+    doing the actual work come first. Stages running on worker threads (i.e.
+    pdf chunks) overlap, so their times can add up to more than the build's
+    total time.
+    """
+    def __init__(self) -> None:
+        self.__events : List[Dict[str, Any]] = None
+        self.__stats : Dict[str, List[float]] = {}
+        self.__threads : Dict[int, str] = {}
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+        self.__origin = 0.0
+
+    def enable(self) -> None:
+        """
+        Starts recording spans, dropping anything recorded before
+        """
+        self.__events = []
+        self.__stats = {}
+        self.__threads = {}
+        self.__origin = time.perf_counter()
+
+    def disable(self) -> None:
+        """
+        Stops recording spans
+        """
+        self.__events = None
+
+    def enabled(self) -> bool:
+        return self.__events is not None
+
+    def __stack(self) -> List[float]:
+        """
+        Returns the time taken by the children of each open span on the
+        current thread
+        """
+        stack = getattr(self.__local, 'stack', None)
+        if stack is None:
+            stack = self.__local.stack = []
+        return stack
+
+    def __record(
+        self,
+        name     : str,
+        category : str,
+        start    : float,
+        wall     : float,
+        total    : float,
+        own      : float
+    ) -> None:
+        thread = threading.get_ident()
+        with self.__lock:
+            if self.__events is None:
+                return
+            if thread not in self.__threads:
+                self.__threads[thread] = threading.current_thread().name
+            self.__events.append({
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': (start - self.__origin) * 1e6,
+                'dur': wall * 1e6,
+                'pid': os.getpid(),
+                'tid': list(self.__threads).index(thread),
+                'args': { 'ms': total * 1e3, 'selfMs': own * 1e3 },
+            })
+            stats = self.__stats.setdefault(name, [ 0, 0.0, 0.0 ])
+            stats[0] += 1
+            stats[1] += total
+            stats[2] += own
+
+    def span(
+        self,
+        name     : str,
+        category : str = 'build'
+    ) -> ContextManager[None]:
+        """
+        Returns a context manager timing the block it wraps
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the stage, i.e. 'section SkillSection'
+        category : `str`
+            The kind of stage, used to color the trace
+        """
+        if self.__events is None:
+            return _NULL
+        return self.__span(name, category)
+
+    @contextmanager
+    def __span(
+        self,
+        name     : str,
+        category : str
+    ) -> Iterator[None]:
+        stack = self.__stack()
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += wall
+            self.__record(name, category, start, wall, wall, wall - children)
+
+    def iterate(
+        self,
+        name     : str,
+        lines    : Iterable[Any],
+        category : str = 'render'
+    ) -> Iterator[Any]:
+        """
+        Wraps a generator (i.e. a section's iterHTML) so only the time spent
+        producing its items is recorded
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the stage
+        lines : `Iterable[Any]`
+            The items to time
+        category : `str`
+            The kind of stage, used to color the trace
+
+        Returns
+        -------
+        lines : `Iterator[Any]`
+            The same items, untouched if profiling is off
+        """
+        if self.__events is None:
+            return lines
+        return self.__iterate(name, iter(lines), category)
+
+    def __iterate(
+        self,
+        name     : str,
+        lines    : Iterator[Any],
+        category : str
+    ) -> Iterator[Any]:
+        start = time.perf_counter()
+        busy = 0.0
+        children = 0.0
+        try:
+            while True:
+                # The generator counts as an open span only while it runs,
+                # it may be resumed from more than one thread
+                stack = self.__stack()
+                stack.append(0.0)
+                resumed = time.perf_counter()
+                try:
+                    line = next(lines)
+                except StopIteration:
+                    break
+                finally:
+                    taken = time.perf_counter() - resumed
+                    busy += taken
+                    children += stack.pop()
+                    if stack:
+                        stack[-1] += taken
+                yield line
+        finally:
+            self.__record(
+                name,
+                category,
+                start,
+                time.perf_counter() - start,
+                busy,
+                busy - children
+            )
+
+    def writeTrace(
+        self,
+        path : str
+    ) -> None:
+        """
+        Writes the recorded spans out as a Chrome trace
+
+        Parameters
+        ----------
+        path : `str`
+            Location to write the trace (JSON) to
+        """
+        with self.__lock:
+            events = list(self.__events or [])
+            threads = list(self.__threads.values())
+        pid = os.getpid()
+        events += [
+            {
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': pid,
+                'tid': i,
+                'args': { 'name': name },
+            }
+            for i, name in enumerate(threads)
+        ]
+        with open(path, 'w') as fout:
+            json.dump({ 'traceEvents': events, 'displayTimeUnit': 'ms' }, fout)
+
+    def summary(
+        self,
+        limit : int = 30
+    ) -> str:
+        """
+        Returns a table of the stages taking the most time
+
+        Parameters
+        ----------
+        limit : `int`
+            The most stages to list
+
+        Returns
+        -------
+        table : `str`
+            One row per stage with its number of calls, total time and self
+            time, sorted by self time
+        """
+        with self.__lock:
+            stats = sorted(
+                self.__stats.items(),
+                key=lambda x: x[1][2],
+                reverse=True
+            )
+        width = max([ len(x) for x, _ in stats[:limit] ] + [ 5 ])
+        rows = [ f'{"Stage":<{width}}  {"Calls":>6}  {"Total ms":>10}  {"Self ms":>10}' ]
+        rows.append('-' * len(rows[0]))
+        for name, (calls, total, own) in stats[:limit]:
+            rows.append(
+                f'{name:<{width}}  {calls:>6}  {total * 1e3:>10.1f}  {own * 1e3:>10.1f}'
+            )
+        if len(stats) > limit:
+            rows.append(f'... {len(stats) - limit} more stages in the trace')
+        return '\n'.join(rows)
+
+# Profiler shared by every stage of a build, off until enabled
+profiler = Profiler()
@@ -0,0 +1,168 @@
+"""
+On-disk cache of built system data
+"""
+from __future__ import print_function, division
+from utils.fingerprint import rendererVersion
+from utils.profiler import profiler
+from typing import Any, Callable
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+
+# Bump to throw away every snapshot regardless of source changes
+VERSION = 1
+
+# Directory whose files are hashed into every snapshot key
+_ASSETS = 'assets'
+
+class SnapshotCache:
+    """
+    On-disk cache of built system data. Each snapshot is a pickle of whatever
+    a build function returned (usually a DataManager), keyed by a hash of the
+    module the function lives in, the data classes, the assets and the python
+    version, so data is only built again when something it depends on changes.
+
+    Parameters
+    ----------
+    directory : `str`
+        Location to keep snapshots in, if none is provided the cache is
+        disabled and the data is always built directly
+    rebuild : `bool`
+        If true, existing snapshots are ignored and overwritten by freshly
+        built data
+    """
+    def __init__(
+        self,
+        directory : str = None,
+        rebuild   : bool = False
+    ) -> None:
+        self.__directory = None
+        self.__rebuild = False
+
+        # Snapshots written since the cache was opened, never rebuilt twice
+        self.__written = set()
+        if directory:
+            self.open(directory, rebuild)
+
+    def open(
+        self,
+        directory : str,
+        rebuild   : bool = False
+    ) -> None:
+        """
+        Points the cache at a directory (creating it if needed)
+
+        Parameters
+        ----------
+        directory : `str`
+            Location to keep snapshots in
+        rebuild : `bool`
+            If true, existing snapshots are ignored and overwritten by freshly
+            built data
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = directory
+        self.__rebuild = rebuild
+        self.__written = set()
+
+    def close(self) -> None:
+        """
+        Disables the cache until reopened
+        """
+        self.__directory = None
+        self.__rebuild = False
+
+    def enabled(self) -> bool:
+        return self.__directory is not None
+
+    def key(
+        self,
+        build : Callable[[], Any]
+    ) -> str:
+        """
+        Returns the snapshot key for a build function
+
+        Parameters
+        ----------
+        build : `Callable[[], Any]`
+            The function building the data
+
+        Returns
+        -------
+        key : `str`
+            A hex digest of everything the built data depends on
+        """
+        digest = hashlib.sha1(
+            f'{VERSION}:{sys.version_info[:2]}:{os.getcwd()}:'
+            f'{rendererVersion()}:{build.__qualname__}'.encode('utf-8')
+        )
+        with open(inspect.getsourcefile(build), 'rb') as fin:
+            digest.update(fin.read())
+        assets = os.path.join(os.getcwd(), _ASSETS)
+        if os.path.isdir(assets):
+            for name in sorted(os.listdir(assets)):
+                path = os.path.join(assets, name)
+                if os.path.isfile(path):
+                    with open(path, 'rb') as fin:
+                        digest.update(name.encode('utf-8'))
+                        digest.update(fin.read())
+        return digest.hexdigest()
+
+    def load(
+        self,
+        build : Callable[[], Any]
+    ) -> Any:
+        """
+        Returns the data for a build function, loading it from its snapshot if
+        one is up to date and building (then snapshotting) it if not
+
+        Parameters
+        ----------
+        build : `Callable[[], Any]`
+            The function building the data, e.g. Fantasy.__buildData
+
+        Returns
+        -------
+        data : `Any`
+            The data returned by the build function
+        """
+        stage = build.__qualname__
+        if self.__directory is None:
+            with profiler.span(f'build {stage}', 'data'):
+                return build()
+        name = build.__qualname__.replace('.', '-')
+        path = os.path.join(self.__directory, f'{name}.{self.key(build)}.pickle')
+        fresh = not self.__rebuild or path in self.__written
+        if fresh and os.path.exists(path):
+            try:
+                with profiler.span(f'load snapshot {stage}', 'data'):
+                    with open(path, 'rb') as fin:
+                        return pickle.load(fin)
+            except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+                # A snapshot which can't be read is simply built again
+                pass
+        with profiler.span(f'build {stage}', 'data'):
+            data = build()
+
+        # Drop stale snapshots for the same function before writing the new one
+        for file in os.listdir(self.__directory):
+            if file.startswith(f'{name}.') and file.endswith('.pickle'):
+                try:
+                    os.remove(os.path.join(self.__directory, file))
+                except FileNotFoundError:
+                    # Another build process got to it first
+                    pass
+
+        # Other build processes may be writing the same snapshot
+        tmpPath = f'{path}.{os.getpid()}.tmp'
+        with profiler.span(f'write snapshot {stage}', 'data'):
+            with open(tmpPath, 'wb') as fout:
+                pickle.dump(data, fout, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpPath, path)
+        self.__written.add(path)
+        return data
+
+# Cache shared by the systems, disabled until opened
+snapshots = SnapshotCache()
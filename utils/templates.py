@@ -0,0 +1,80 @@
+"""
+Functions used to expand templated data objects into their variants
+"""
+from __future__ import print_function, division
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Callable, Dict, Iterator
+import copy
+
+@lru_cache(maxsize=None)
+def compileFormat(
+    template : str
+) -> Callable[[Dict[str, str]], str]:
+    """
+    Parses a format string once and returns a function filling it in, so a
+    string shared by every variant of a template is only parsed a single time
+
+    Parameters
+    ----------
+    template : `str`
+        The format string to compile, e.g. '{name} Walker'
+
+    Returns
+    -------
+    render : `Callable[[Dict[str, str]], str]`
+        A function taking the template element and returning the formatted
+        string
+    """
+    parts = list(Formatter().parse(template))
+    if all(field is None for _, field, _, _ in parts):
+        # Nothing to fill in, every variant shares the same string
+        return lambda element: template
+    if any(
+        spec or conversion or not field.isidentifier()
+        for _, field, spec, conversion in parts if field is not None
+    ):
+        # Leave anything beyond plain {field}s (i.e. {name[0]}, {x.attr} or
+        # {cost:>4}) to str.format
+        return lambda element: template.format_map(element)
+
+    def render(element : Dict[str, str]) -> str:
+        out = []
+        for literal, field, _, _ in parts:
+            out.append(literal)
+            if field is not None:
+                out.append(str(element[field]))
+        return ''.join(out)
+    return render
+
+def expandTemplate(
+    item : Any
+) -> Iterator[Any]:
+    """
+    Yields the variants of a templated data object, one per template element.
+    Each variant is a deep copy of the item with its name and description
+    filled in from the element, so editing one variant's lists or notes never
+    changes its siblings or the item. Only the template itself is shared.
+    Objects without a template are yielded as-is.
+
+    Parameters
+    ----------
+    item : `Any`
+        The data object to expand
+
+    Yields
+    ------
+    variant : `Any`
+        A single variant of the data object
+    """
+    template = getattr(item, 'template', None)
+    if template is None:
+        yield item
+        return
+    name = compileFormat(item.name)
+    desc = compileFormat(item.desc)
+    for element in template:
+        variant = copy.deepcopy(item, { id(template): template })
+        variant.name = name(element)
+        variant.desc = desc(element)
+        yield variant